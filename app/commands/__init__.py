@@ -0,0 +1,6 @@
+"""
+관리 명령 패키지
+
+서버 외부에서 실행하는 관리용 명령을 관리합니다.
+앱 디렉토리에서 `python -m commands.<명령>` 형식으로 실행합니다.
+"""
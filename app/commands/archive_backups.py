@@ -0,0 +1,66 @@
+"""
+삭제된 백업 상태 아카이브 명령
+
+보존 기간이 지난 소프트 삭제 백업 상태를 아카이브 테이블로 이동합니다.
+
+사용 예:
+    python -m commands.archive_backups
+    python -m commands.archive_backups --retention-days 7 --batch-size 1000
+    python -m commands.archive_backups --dry-run
+"""
+
+import argparse
+
+import models  # noqa: F401
+from config import get_settings
+from database import WriteSessionLocal
+from services.backup_archive import archive_deleted_backups, count_archivable_backups
+
+
+def main() -> None:
+    """명령줄 인자를 해석하여 아카이브를 실행합니다."""
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(
+        description="보존 기간이 지난 소프트 삭제 백업 상태를 아카이브합니다."
+    )
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=settings.backup_archive_retention_days,
+        help="삭제 후 보존 기간 (일)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.backup_archive_batch_size,
+        help="트랜잭션당 이동할 행 수",
+    )
+    parser.add_argument(
+        "--max-batches", type=int, default=None, help="최대 배치 수 (기본: 전체)"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="이동하지 않고 대상 수만 출력"
+    )
+    args = parser.parse_args()
+
+    db = WriteSessionLocal()
+    try:
+        if args.dry_run:
+            count = count_archivable_backups(db, args.retention_days)
+            print(f"아카이브 대상: {count}건 (보존 기간 {args.retention_days}일)")
+            return
+
+        archived = archive_deleted_backups(
+            db,
+            retention_days=args.retention_days,
+            batch_size=args.batch_size,
+            max_batches=args.max_batches,
+        )
+        print(f"✅ 아카이브 완료: {archived}건")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
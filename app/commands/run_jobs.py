@@ -0,0 +1,49 @@
+"""
+백그라운드 작업 워커 실행 명령
+
+웹 서버와 별도의 프로세스에서 jobs 테이블의 대기 작업을 실행합니다.
+웹 서버는 기본적으로 작업을 실행하지 않으므로(JOB_WORKERS=0) 이 명령을 워커로 함께 실행합니다.
+
+사용 예:
+    python -m commands.run_jobs
+    python -m commands.run_jobs --workers 4
+"""
+
+import argparse
+import signal
+import threading
+
+import models  # noqa: F401
+from config import get_settings
+from services.job_types import job_runner
+
+
+def main() -> None:
+    """명령줄 인자를 해석하여 종료 신호를 받을 때까지 작업 워커를 실행합니다."""
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description="백그라운드 작업 워커를 실행합니다.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.job_workers or 2,
+        help="워커 스레드 수",
+    )
+    args = parser.parse_args()
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+
+    job_runner.workers = args.workers
+    job_runner.start()
+    print(f"✅ 작업 워커 시작 ({args.workers}개, {job_runner.worker_id})")
+    stop_event.wait()
+
+    print("👋 작업 워커 종료 중...")
+    job_runner.stop()  # 실행 중인 작업은 대기 상태로 되돌림
+    print("✅ 작업 워커 종료 완료")
+
+
+if __name__ == "__main__":
+    main()
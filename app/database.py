@@ -1,42 +1,250 @@
 """
 데이터베이스 연결 모듈
 
-SQLAlchemy를 사용하여 MySQL 데이터베이스 연결을 설정합니다.
+SQLAlchemy를 사용하여 데이터베이스 연결을 설정합니다.
+기본은 MySQL이며, 단일 서버/로컬 환경을 위한 SQLite 모드를 지원합니다.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+import math
+import time
+
+from fastapi import Request
+from sqlalchemy import create_engine, desc, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.schema import CreateTable
 
 from config import get_settings
+from services.tracing import tracer
 
 settings = get_settings()
 
+# SQLite 모드 여부 (예: DATABASE_URL=sqlite:////var/lib/ym/ym.db)
+IS_SQLITE = make_url(settings.database_url).get_backend_name() == "sqlite"
+
+# 읽기 전용 요청 메서드 (쓰기 트랜잭션을 미리 잡지 않음)
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
 # SQLAlchemy 엔진 생성
 # pool_pre_ping: 연결 유효성 검사를 위해 사용
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
+    pool_pre_ping=not IS_SQLITE,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     echo=settings.debug,  # SQL 쿼리 로깅 (디버그 모드에서만)
+    # SQLite: 여러 스레드에서 연결 풀 공유, 잠금 대기 시간 설정
+    connect_args=(
+        {
+            "check_same_thread": False,
+            "timeout": settings.sqlite_busy_timeout_ms / 1000,
+        }
+        if IS_SQLITE
+        else {}
+    ),
 )
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 쓰기 세션 팩토리
+# SQLite에서는 트랜잭션 시작 시 쓰기 잠금을 미리 잡아(BEGIN IMMEDIATE),
+# 읽은 뒤 쓰는 트랜잭션이 잠금 승격 중 바로 실패하지 않고 busy_timeout만큼 기다리게 합니다.
+# MySQL에서는 SessionLocal과 동일하게 동작합니다.
+WriteSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine.execution_options(sqlite_begin="IMMEDIATE"),
+)
+
 # 모델 베이스 클래스
 Base = declarative_base()
 
 
-def get_db():
+if IS_SQLITE:
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        새 SQLite 연결에 PRAGMA를 적용합니다.
+
+        - WAL: 쓰기 중에도 읽기가 막히지 않음 (단일 writer, 다중 reader)
+        - synchronous=NORMAL: WAL에서 안전하면서 커밋마다 fsync하지 않음
+        - foreign_keys: 외래키 제약 적용 (SQLite 기본값은 꺼짐)
+        pysqlite의 암시적 BEGIN은 끄고 begin 이벤트에서 직접 트랜잭션을 시작합니다.
+        """
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute("PRAGMA synchronous = NORMAL")
+            cursor.execute("PRAGMA foreign_keys = ON")
+            cursor.execute(f"PRAGMA busy_timeout = {settings.sqlite_busy_timeout_ms}")
+            cursor.execute(
+                f"PRAGMA cache_size = -{settings.sqlite_cache_size_mb * 1024}"
+            )
+            cursor.execute(f"PRAGMA mmap_size = {settings.sqlite_mmap_size_mb << 20}")
+            cursor.execute("PRAGMA temp_store = MEMORY")
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def begin_sqlite_transaction(conn):
+        """쓰기 세션은 BEGIN IMMEDIATE, 그 외는 BEGIN(DEFERRED)으로 트랜잭션을 시작합니다."""
+        conn.exec_driver_sql(
+            f"BEGIN {conn.get_execution_options().get('sqlite_begin', 'DEFERRED')}"
+        )
+
+
+def create_sqlite_schema() -> None:
+    """
+    SQLite 모드에서 테이블을 생성합니다. (이미 있는 테이블은 건너뜀)
+
+    이미 있는 테이블에는 이후 추가된 생성 컬럼, 검색 인덱스(FTS5), 인덱스만 추가합니다.
+    인덱스는 테이블과 따로 이름 순서로 생성합니다.
+    (SQLite는 비용이 같은 인덱스 중 먼저 생성된 것을 고르므로 실행 계획이 실행마다 달라지지 않게 함)
+    MySQL은 migrations/ SQL로 스키마를 관리하므로 호출하지 않습니다.
+    """
+    import models  # noqa: F401
+    from models.backup_status import STAGE_MASK_SQL
+    from models.storage_catalog import (
+        STORAGE_CATALOG_DEDUPE_SQLITE,
+        STORAGE_CATALOG_FTS_DDL,
+    )
+
+    with engine.begin() as conn:
+        tables = set(inspect(conn).get_table_names())
+        for table in Base.metadata.sorted_tables:
+            if table.name not in tables:
+                conn.execute(CreateTable(table))
+        if "storage_catalog_fts" not in tables:
+            for statement in STORAGE_CATALOG_FTS_DDL:
+                conn.exec_driver_sql(statement)
+            # 검색 인덱스 생성 전에 있던 항목도 검색되도록 채움
+            conn.exec_driver_sql(
+                "INSERT INTO storage_catalog_fts(storage_catalog_fts) VALUES ('rebuild')"
+            )
+
+        columns = {
+            row[1] for row in conn.exec_driver_sql("PRAGMA table_xinfo(backup_status)")
+        }
+        if "stage_mask" not in columns:
+            # STORED 생성 컬럼은 ALTER TABLE로 추가할 수 없어 VIRTUAL로 추가
+            conn.exec_driver_sql(
+                "ALTER TABLE backup_status ADD COLUMN stage_mask SMALLINT "
+                f"GENERATED ALWAYS AS ({STAGE_MASK_SQL}) VIRTUAL"
+            )
+        # 식 인덱스는 checkfirst의 인덱스 조회에 나오지 않으므로 이름으로 확인
+        indexes = {
+            row[0]
+            for row in conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        if "uq_storage_catalog_natural_key" not in indexes:
+            # 자연 키 유니크 인덱스 추가 전 중복 항목 정리 (migrations/010과 동일)
+            for statement in STORAGE_CATALOG_DEDUPE_SQLITE:
+                conn.exec_driver_sql(statement)
+        for table in Base.metadata.sorted_tables:
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                if index.name not in indexes:
+                    index.create(conn)
+
+
+def desc_nulls_last(column):
+    """
+    NULL을 마지막에 두는 내림차순 정렬 조건을 반환합니다.
+
+    MySQL과 SQLite는 NULL을 가장 작은 값으로 정렬하므로 DESC만으로 NULL이 마지막에 오며,
+    정렬 컬럼의 인덱스를 그대로 사용할 수 있습니다.
+    그 외 DB는 NULLS LAST를 명시합니다.
+
+    Args:
+        column: 정렬할 컬럼
+
+    Returns:
+        정렬 조건
+    """
+    if engine.dialect.name in ("mysql", "sqlite"):
+        return desc(column)
+    return desc(column).nulls_last()
+
+
+class DeadlineExceeded(Exception):
+    """요청 처리 기한이 지나 더 이상 쿼리를 실행하지 않을 때 발생하는 예외"""
+
+
+@event.listens_for(Session, "after_begin")
+def apply_statement_timeout(session, transaction, connection):
+    """
+    요청 기한이 설정된 세션이면 남은 시간을 문장 타임아웃으로 적용합니다.
+
+    세션은 커밋할 때마다 연결을 풀에 반납하므로, 트랜잭션이 시작될 때마다
+    그 시점의 남은 시간으로 다시 설정합니다.
+    - MySQL: MAX_EXECUTION_TIME(SELECT), innodb_lock_wait_timeout(쓰기 잠금 대기)
+    - SQLite: 기한이 지나면 실행 중인 문장을 중단하는 progress handler
+
+    Raises:
+        DeadlineExceeded: 이미 기한이 지난 경우
+    """
+    deadline = session.info.get("deadline")
+    if deadline is None:
+        return
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded()
+
+    if connection.dialect.name == "mysql":
+        connection.exec_driver_sql(
+            f"SET SESSION MAX_EXECUTION_TIME = {int(remaining * 1000)}, "
+            f"innodb_lock_wait_timeout = {max(1, math.ceil(remaining))}"
+        )
+        connection.connection.info["statement_timeout"] = True
+    elif connection.dialect.name == "sqlite":
+        connection.connection.driver_connection.set_progress_handler(
+            lambda: time.monotonic() > deadline, 10000
+        )
+        connection.connection.info["statement_timeout"] = True
+
+
+@event.listens_for(engine, "checkin")
+def reset_statement_timeout(dbapi_connection, connection_record):
+    """풀에 반납되는 연결의 문장 타임아웃을 기본값으로 되돌립니다."""
+    if not connection_record.info.pop("statement_timeout", False):
+        return
+    if IS_SQLITE:
+        dbapi_connection.set_progress_handler(None, 0)
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(
+            "SET SESSION MAX_EXECUTION_TIME = DEFAULT, "
+            "innodb_lock_wait_timeout = DEFAULT"
+        )
+    finally:
+        cursor.close()
+
+
+def get_db(request: Request):
     """
     데이터베이스 세션을 생성하고 반환하는 의존성 함수
 
     FastAPI의 Depends에서 사용됩니다.
     요청이 완료되면 세션을 자동으로 닫습니다.
+    쓰기 요청(POST/PUT/PATCH/DELETE)은 쓰기 세션을 사용합니다.
+    부하 제어 미들웨어가 요청 기한(request.state.deadline)을 설정했다면
+    세션의 쿼리에 남은 시간만큼의 타임아웃이 적용됩니다.
 
     Yields:
         Session: SQLAlchemy 데이터베이스 세션
     """
-    db = SessionLocal()
+    read = request.method in READ_METHODS
+    with tracer.span("get_db", **{"db.session": "read" if read else "write"}):
+        db = SessionLocal() if read else WriteSessionLocal()
+        deadline = getattr(request.state, "deadline", None)
+        if deadline is not None:
+            db.info["deadline"] = deadline
     try:
         yield db
     finally:
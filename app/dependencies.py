@@ -0,0 +1,71 @@
+"""
+공통 의존성 모듈
+
+여러 라우터에서 함께 사용하는 FastAPI 의존성을 정의합니다.
+"""
+
+import secrets
+from typing import List, Optional, Sequence
+
+from fastapi import Header, HTTPException, Query, status
+
+from config import get_settings
+
+
+class FieldSelector:
+    """
+    응답 필드 선택(sparse fieldset) 의존성
+
+    `fields` 쿼리 파라미터(쉼표 구분)를 해석하여 요청된 필드 리스트를 반환합니다.
+    파라미터가 없으면 None을 반환하며, 이때는 전체 필드를 응답합니다.
+
+    Attributes:
+        allowed: 선택 가능한 필드명 (응답 스키마 필드 순서)
+    """
+
+    def __init__(self, allowed: Sequence[str]):
+        self.allowed = list(allowed)
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(
+            None, description="응답에 포함할 필드 (쉼표 구분, 예: id,name,cam)"
+        ),
+    ) -> Optional[List[str]]:
+        if not fields:
+            return None
+
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in self.allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"알 수 없는 필드입니다: {', '.join(unknown)}",
+            )
+        if not requested:
+            return None
+
+        # 중복 제거 후 스키마 필드 순서로 정렬
+        return [name for name in self.allowed if name in requested]
+
+
+def require_admin_token(
+    x_admin_token: Optional[str] = Header(None, description="관리 API 토큰"),
+) -> None:
+    """
+    관리 API 접근 의존성
+
+    X-Admin-Token 헤더가 설정(ADMIN_TOKEN)과 같아야 합니다.
+    ADMIN_TOKEN이 비어 있으면 관리 API를 사용할 수 없습니다.
+    """
+    admin_token = get_settings().admin_token
+    if not admin_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리 API가 비활성화되어 있습니다. (ADMIN_TOKEN 미설정)",
+        )
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="관리 API 토큰이 올바르지 않습니다.",
+        )
@@ -12,13 +12,25 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
 from config import get_settings
-from database import engine
+from database import IS_SQLITE, create_sqlite_schema, engine
+from middleware.load_shedding import LoadSheddingMiddleware, register_deadline_handlers
+from middleware.memory_profiling import MemoryProfilingMiddleware
+from middleware.tracing import TracingMiddleware
+from middleware.traffic_capture import TrafficCaptureMiddleware
 
 # 모든 모델을 import하여 SQLAlchemy가 관계를 인식하도록 함
 # 순서 중요: User -> BackupStatus -> MUserBackupStatus
 import models  # noqa: F401
 
-from routers import auth, backup_status, storage_catalog
+from routers import admin, auth, backup_status, jobs, storage_catalog
+from services.audit import audit_recorder
+from services.backup_snapshot import backup_snapshot
+from services.broadcaster import backup_status_broadcaster
+from services.job_types import job_runner
+from services.memory_profiler import memory_profiler
+from services.mark_complete_coalescer import mark_complete_coalescer
+from services.tracing import instrument_engine, instrument_fastapi, tracer
+from services.traffic_capture import traffic_recorder
 
 # 설정 로드
 settings = get_settings()
@@ -43,12 +55,63 @@ async def lifespan(app: FastAPI):
         print(f"❌ 데이터베이스 연결 실패: {e}")
         raise e
 
+    # SQLite 모드: 마이그레이션 대신 시작 시 테이블 생성
+    if IS_SQLITE:
+        create_sqlite_schema()
+        print("✅ SQLite 스키마 확인 완료")
+
+    # 변경 이력 일괄 기록 워커 시작
+    audit_recorder.start()
+
+    # span 내보내기 워커 시작
+    if settings.tracing:
+        tracer.start()
+        print(
+            f"✅ 요청 추적 활성화 ({settings.tracing_exporter}, "
+            f"샘플링 {settings.tracing_sample_rate:.0%})"
+        )
+
+    # mark-complete 쓰기 병합 워커 시작
+    if settings.mark_complete_coalescing:
+        mark_complete_coalescer.start()
+        print("✅ mark-complete 병합 모드 활성화")
+
+    # 요청 트래픽 기록 워커 시작
+    if settings.traffic_capture:
+        traffic_recorder.start()
+        print(f"✅ 요청 트래픽 수집 활성화 ({settings.traffic_capture_path})")
+
+    # 메모리 프로파일링 시작 (관리 API로 실행 중에도 켜고 끌 수 있음)
+    if settings.memory_profiling:
+        memory_profiler.start(settings.memory_profiling_frames)
+        print("✅ 메모리 프로파일링 시작")
+
+    # 백업 상태 인메모리 스냅샷 적재
+    if settings.backup_snapshot:
+        if backup_snapshot.available:
+            count = backup_snapshot.load()
+            print(f"✅ 백업 상태 스냅샷 적재 완료 ({count}건)")
+        else:
+            print("⚠️ numpy가 설치되지 않아 백업 상태 스냅샷을 사용하지 않습니다.")
+
+    # 백그라운드 작업 워커 시작 (중단된 작업 복구 포함)
+    if settings.job_workers > 0:
+        job_runner.start()
+        print(f"✅ 백그라운드 작업 워커 {settings.job_workers}개 시작")
+
     print("✅ 서버 시작 완료")
 
     yield  # 서버 실행 중
 
     # 종료 시 실행
     print("👋 서버 종료 중...")
+    backup_status_broadcaster.close()  # 열린 이벤트 스트림 종료
+    mark_complete_coalescer.stop()  # 대기 중인 병합 요청 처리 후 종료
+    job_runner.stop()  # 실행 중인 작업은 대기 상태로 되돌림
+    audit_recorder.stop()  # 큐에 남은 변경 이력 기록 후 종료
+    tracer.stop()  # 큐에 남은 span 내보낸 후 종료
+    traffic_recorder.stop()  # 큐에 남은 트래픽 기록 후 종료
+    memory_profiler.stop()
     engine.dispose()
     print("✅ 서버 종료 완료")
 
@@ -65,6 +128,34 @@ app = FastAPI(
     redirect_slashes=False,
 )
 
+# 메모리 프로파일링 미들웨어 설정
+# 가장 안쪽에 등록하여 라우트 처리(조회, 직렬화, 인코딩) 중 할당만 측정
+# 프로파일링 중이 아니면 요청마다 tracemalloc.is_tracing() 확인만 함
+app.add_middleware(
+    MemoryProfilingMiddleware,
+    profiler=memory_profiler,
+    exclude_routes=settings.memory_profiling_exclude_routes,
+)
+
+# 부하 제어 미들웨어 설정
+# CORS보다 먼저 등록하여 503 응답에도 CORS 헤더가 붙도록 함
+if settings.load_shedding:
+    app.add_middleware(
+        LoadSheddingMiddleware,
+        max_concurrency=(
+            settings.load_shed_max_concurrency
+            or settings.db_pool_size + settings.db_max_overflow
+        ),
+        write_reserved=settings.load_shed_write_reserved,
+        route_limits=settings.load_shed_route_limits,
+        exempt_routes=settings.load_shed_exempt_routes,
+        max_queue=settings.load_shed_max_queue,
+        max_queue_wait_ms=settings.load_shed_max_queue_wait_ms,
+        request_timeout_ms=settings.request_timeout_ms,
+        retry_after_seconds=settings.load_shed_retry_after_seconds,
+    )
+    register_deadline_handlers(app, settings.load_shed_retry_after_seconds)
+
 # CORS 미들웨어 설정
 # TODO: 프로덕션 환경에서는 허용 오리진을 제한해야 합니다.
 app.add_middleware(
@@ -75,10 +166,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 트래픽 수집 미들웨어 설정
+# 부하 제어보다 바깥에 등록하여 503으로 거절된 요청과 대기 시간까지 기록
+if settings.traffic_capture:
+    app.add_middleware(
+        TrafficCaptureMiddleware,
+        recorder=traffic_recorder,
+        max_body_bytes=settings.traffic_capture_max_body_bytes,
+        exclude_routes=settings.traffic_capture_exclude_routes,
+        full_bodies=settings.traffic_capture_full_bodies,
+    )
+
+# 요청 추적 미들웨어 설정
+# 가장 바깥에 등록하여 부하 제어로 거절된 요청과 CORS 처리까지 루트 span에 포함
+if settings.tracing:
+    instrument_engine(engine)
+    instrument_fastapi()
+    app.add_middleware(TracingMiddleware)
+
 # 라우터 등록
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(storage_catalog.router, prefix="/api/v1")
 app.include_router(backup_status.router, prefix="/api/v1")
+app.include_router(jobs.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
 
 
 @app.get("/")
@@ -0,0 +1,5 @@
+"""
+미들웨어 패키지
+
+ASGI 미들웨어를 관리합니다.
+"""
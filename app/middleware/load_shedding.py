@@ -0,0 +1,347 @@
+"""
+부하 제어(load shedding) 미들웨어
+
+DB 연결 풀 크기에 맞춰 동시에 처리할 API 요청 수를 제한하고,
+처리 슬롯을 오래 기다려야 하는 요청은 빠르게 503으로 거절합니다.
+"""
+
+import asyncio
+import bisect
+import itertools
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import OperationalError
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from database import READ_METHODS, DeadlineExceeded
+
+# 요청 우선순위 (작을수록 먼저 처리)
+PRIORITY_WRITE = 0
+PRIORITY_READ = 1
+
+# MySQL 타임아웃 오류 코드 (MAX_EXECUTION_TIME 초과, 잠금 대기 시간 초과)
+MYSQL_TIMEOUT_ERRORS = (3024, 1205)
+
+# SQLite 타임아웃 오류 메시지 (쓰기 잠금 대기 초과, 기한 초과로 중단)
+SQLITE_TIMEOUT_ERRORS = ("database is locked", "interrupted")
+
+# 부하 제어 대상 경로 접두사 (문서, 헬스 체크 등은 제외)
+API_PATH_PREFIX = "/api/"
+
+
+def compile_route_key(route_key: str) -> Tuple[str, Pattern]:
+    """
+    "METHOD 경로 템플릿" 형식의 라우트 키를 (메서드, 경로 정규식)으로 변환합니다.
+
+    Args:
+        route_key: 라우트 키 (예: "GET /api/v1/auth/users/{user_id}/backups")
+
+    Returns:
+        Tuple[str, Pattern]: 대문자 메서드와 경로 정규식
+    """
+    method, path = route_key.split(" ", 1)
+    path_regex, _, _ = compile_path(path.strip())
+    return method.upper(), path_regex
+
+
+class Overloaded(Exception):
+    """처리 슬롯을 얻지 못해 요청을 거절할 때 발생하는 예외"""
+
+
+@dataclass(order=True)
+class Waiter:
+    """처리 슬롯을 기다리는 요청"""
+
+    priority: int
+    seq: int
+    route_key: Optional[str] = field(compare=False, default=None)
+    future: Optional[asyncio.Future] = field(compare=False, default=None)
+
+
+class AdmissionController:
+    """
+    우선순위와 라우트별 제한을 지원하는 동시 처리 수 제어기
+
+    모든 요청은 전체 슬롯(max_concurrency)을 공유하되,
+    읽기 요청은 write_reserved개를 남겨 두고만 사용할 수 있어 쓰기 요청이 굶지 않습니다.
+    route_limits에 지정된 라우트(대용량 목록 조회 등)는 해당 수까지만 동시에 처리합니다.
+    대기 중인 요청은 (우선순위, 도착 순서)대로 슬롯을 받으며,
+    라우트 제한에 걸린 요청이 뒤의 다른 요청을 막지 않습니다.
+    이벤트 루프 안에서만 사용하므로 별도의 잠금은 없습니다.
+
+    Attributes:
+        max_concurrency: 최대 동시 처리 수
+        write_reserved: 쓰기 요청 전용 슬롯 수
+        route_limits: 라우트 키 -> 최대 동시 처리 수
+        max_queue: 최대 대기 요청 수
+        in_flight: 처리 중인 요청 수
+        shed: 거절한 요청 수
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        write_reserved: int = 0,
+        route_limits: Optional[Dict[str, int]] = None,
+        max_queue: int = 100,
+    ):
+        self.max_concurrency = max_concurrency
+        self.write_reserved = min(write_reserved, max_concurrency - 1)
+        self.route_limits = route_limits or {}
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.shed = 0
+        self._route_in_flight: Counter = Counter()
+        self._waiters: list = []
+        self._seq = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        """대기 중인 요청 수"""
+        return len(self._waiters)
+
+    def _can_admit(self, priority: int, route_key: Optional[str]) -> bool:
+        """슬롯과 라우트 제한을 확인하여 지금 처리할 수 있는지 반환합니다."""
+        limit = self.max_concurrency
+        if priority != PRIORITY_WRITE:
+            limit -= self.write_reserved
+        if self.in_flight >= limit:
+            return False
+        route_limit = self.route_limits.get(route_key)
+        if route_limit is not None and self._route_in_flight[route_key] >= route_limit:
+            return False
+        return True
+
+    def _admit(self, route_key: Optional[str]) -> None:
+        self.in_flight += 1
+        self._route_in_flight[route_key] += 1
+
+    def _dispatch(self) -> None:
+        """대기 중인 요청을 우선순위 순서대로 처리 가능한 만큼 깨웁니다."""
+        for waiter in list(self._waiters):
+            if waiter.future.done():
+                self._waiters.remove(waiter)
+            elif self._can_admit(waiter.priority, waiter.route_key):
+                self._waiters.remove(waiter)
+                self._admit(waiter.route_key)
+                waiter.future.set_result(None)
+
+    async def acquire(
+        self, priority: int, route_key: Optional[str], timeout: float
+    ) -> None:
+        """
+        처리 슬롯을 얻습니다.
+
+        Args:
+            priority: 요청 우선순위 (PRIORITY_WRITE, PRIORITY_READ)
+            route_key: 라우트 키 ("METHOD 경로")
+            timeout: 최대 대기 시간 (초)
+
+        Raises:
+            Overloaded: 대기열이 가득 찼거나 timeout 안에 슬롯을 얻지 못한 경우
+        """
+        # 앞에 기다리는 요청이 없으면 바로 처리
+        if not self._waiters and self._can_admit(priority, route_key):
+            self._admit(route_key)
+            return
+
+        if len(self._waiters) >= self.max_queue or timeout <= 0:
+            self.shed += 1
+            raise Overloaded()
+
+        waiter = Waiter(
+            priority,
+            next(self._seq),
+            route_key,
+            asyncio.get_running_loop().create_future(),
+        )
+        bisect.insort(self._waiters, waiter)
+        self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            if waiter.future.done():
+                # 시간 초과 직전에 슬롯을 받은 경우
+                return
+            waiter.future.cancel()
+            self._waiters.remove(waiter)
+            self.shed += 1
+            raise Overloaded()
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 등으로 취소된 경우 받은 슬롯을 반납
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(route_key)
+            else:
+                waiter.future.cancel()
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(self, route_key: Optional[str]) -> None:
+        """처리 슬롯을 반납하고 대기 중인 요청을 깨웁니다."""
+        self.in_flight -= 1
+        self._route_in_flight[route_key] -= 1
+        if self._waiters:
+            self._dispatch()
+
+
+class LoadSheddingMiddleware:
+    """
+    부하 제어 ASGI 미들웨어
+
+    /api/ 경로의 요청은 AdmissionController로 처리 슬롯을 얻은 뒤 처리하며,
+    요청 기한(request.state.deadline, time.monotonic 기준)을 설정합니다.
+    기한은 get_db를 통해 DB 문장 타임아웃으로 전파됩니다.
+    라우트별 제한/제외 대상은 "METHOD 경로 템플릿" 키로 지정하며,
+    SSE처럼 오래 유지되는 연결과 여러 트랜잭션으로 나눠 커밋하는 일괄 처리는
+    exempt_routes로 제외합니다. (기한 초과로 중간에 실패하면 일부만 저장되므로)
+    응답 본문 전송이 끝날 때까지 슬롯을 점유합니다.
+
+    Attributes:
+        controller: 동시 처리 수 제어기
+        exempt_routes: 제한하지 않을 라우트 키
+        max_queue_wait: 최대 대기 시간 (초)
+        request_timeout: 요청 처리 기한 (초)
+        retry_after: 503 응답의 Retry-After 값 (초)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrency: int,
+        write_reserved: int = 0,
+        route_limits: Optional[Dict[str, int]] = None,
+        exempt_routes: Iterable[str] = (),
+        max_queue: int = 100,
+        max_queue_wait_ms: int = 500,
+        request_timeout_ms: int = 10000,
+        retry_after_seconds: int = 1,
+    ):
+        self.app = app
+        self.controller = AdmissionController(
+            max_concurrency, write_reserved, route_limits, max_queue
+        )
+        self.exempt_routes = set(exempt_routes)
+        self.max_queue_wait = max_queue_wait_ms / 1000
+        self.request_timeout = request_timeout_ms / 1000
+        self.retry_after = retry_after_seconds
+        # 제외 라우트를 먼저 확인하도록 앞에 배치
+        self._route_patterns: List[Tuple[str, Pattern, str]] = [
+            (*compile_route_key(route_key), route_key)
+            for route_key in [*self.exempt_routes, *(route_limits or {})]
+        ]
+
+    def resolve_route_key(self, scope: Scope) -> Optional[str]:
+        """
+        요청에 해당하는 설정상의 라우트 키를 반환합니다.
+
+        Returns:
+            Optional[str]: 라우트 키 (제한/제외 대상이 아니면 None)
+        """
+        for method, path_regex, route_key in self._route_patterns:
+            if scope["method"] == method and path_regex.match(scope["path"]):
+                return route_key
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if not scope["path"].startswith(API_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        route_key = self.resolve_route_key(scope)
+        if route_key in self.exempt_routes:
+            await self.app(scope, receive, send)
+            return
+
+        arrived = time.monotonic()
+        deadline = arrived + self.request_timeout
+        priority = PRIORITY_READ if scope["method"] in READ_METHODS else PRIORITY_WRITE
+        try:
+            await self.controller.acquire(
+                priority, route_key, min(self.max_queue_wait, self.request_timeout)
+            )
+        except Overloaded:
+            response = overloaded_response(
+                "서버가 혼잡하여 요청을 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+                self.retry_after,
+            )
+            await response(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})["deadline"] = deadline
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(route_key)
+
+
+def overloaded_response(detail: str, retry_after: int) -> JSONResponse:
+    """
+    Retry-After 헤더를 포함한 503 응답을 생성합니다.
+
+    Args:
+        detail: 오류 메시지
+        retry_after: 재시도 대기 시간 (초)
+
+    Returns:
+        JSONResponse: 503 응답
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": detail},
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def is_timeout_error(exc: OperationalError) -> bool:
+    """
+    DB 오류가 문장 타임아웃/잠금 대기 초과인지 확인합니다.
+
+    Args:
+        exc: SQLAlchemy OperationalError
+
+    Returns:
+        bool: MySQL 오류 코드 또는 SQLite 오류 메시지가 타임아웃에 해당하는지 여부
+    """
+    if exc.orig is None or not exc.orig.args:
+        return False
+    error = exc.orig.args[0]
+    if isinstance(error, int):
+        return error in MYSQL_TIMEOUT_ERRORS
+    return str(error) in SQLITE_TIMEOUT_ERRORS
+
+
+def register_deadline_handlers(app, retry_after_seconds: int) -> None:
+    """
+    요청 기한 초과와 DB 문장 타임아웃을 503으로 변환하는 예외 핸들러를 등록합니다.
+
+    Args:
+        app: FastAPI 앱
+        retry_after_seconds: 503 응답의 Retry-After 값 (초)
+    """
+
+    @app.exception_handler(DeadlineExceeded)
+    async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+        return overloaded_response(
+            "요청 처리 기한을 초과했습니다. 잠시 후 다시 시도해 주세요.",
+            retry_after_seconds,
+        )
+
+    @app.exception_handler(OperationalError)
+    async def statement_timeout_handler(request: Request, exc: OperationalError):
+        if not is_timeout_error(exc):
+            raise exc
+        return overloaded_response(
+            "데이터베이스 응답이 지연되어 요청을 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.",
+            retry_after_seconds,
+        )
@@ -0,0 +1,71 @@
+"""
+메모리 프로파일링 미들웨어
+
+프로파일링 중일 때 요청별 최대 할당량을 라우트별로 기록합니다.
+(services.memory_profiler, 꺼져 있으면 그대로 통과)
+"""
+
+from typing import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from middleware.tracing import route_template
+from services.memory_profiler import MemoryProfiler
+
+
+class MemoryProfilingMiddleware:
+    """
+    메모리 프로파일링 미들웨어
+
+    라우트를 찾지 못한 요청(404 등)은 경로별로 늘어나지 않도록 "(unmatched)"로 묶어 기록합니다.
+    exclude_routes의 라우트(장시간 연결 등)는 응답을 시작할 때 측정에서 빼서
+    연결이 열려 있는 동안에도 다른 요청의 최대 할당량이 초기화되도록 합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        profiler: MemoryProfiler,
+        exclude_routes: Iterable[str] = (),
+    ):
+        self.app = app
+        self.profiler = profiler
+        self.exclude_routes = set(exclude_routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        started_bytes = (
+            self.profiler.request_started() if scope["type"] == "http" else None
+        )
+        if started_bytes is None:
+            await self.app(scope, receive, send)
+            return
+
+        excluded = False
+
+        async def send_with_exclusion(message: Message) -> None:
+            nonlocal excluded
+            # 라우트는 라우터가 찾은 뒤에만 알 수 있으므로 응답 시작 시점에 확인
+            if (
+                message["type"] == "http.response.start"
+                and not excluded
+                and self._route_name(scope) in self.exclude_routes
+            ):
+                excluded = True
+                self.profiler.request_excluded()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_exclusion)
+        finally:
+            if not excluded:
+                self.profiler.request_finished(self._route_name(scope), started_bytes)
+
+    @staticmethod
+    def _route_name(scope: Scope) -> str:
+        route = scope.get("route")
+        path = (
+            route_template(scope["path"], route.path)
+            if route is not None and hasattr(route, "path")
+            else "(unmatched)"
+        )
+        return f"{scope['method']} {path}"
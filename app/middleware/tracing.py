@@ -0,0 +1,79 @@
+"""
+요청 추적(tracing) 미들웨어
+
+요청마다 루트 span을 만들고, 응답 헤더에 trace ID를 실어 보냅니다.
+(traceparent: W3C Trace Context 형식, X-Trace-Id: trace ID)
+"""
+
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from services.tracing import tracer
+
+
+def route_template(path: str, route_path: str) -> str:
+    """
+    실제 경로와 매칭된 라우트의 경로 템플릿으로 전체 경로 템플릿을 만듭니다.
+
+    포함된 라우터의 라우트는 FastAPI 버전에 따라 prefix 없는 경로를 가지므로,
+    템플릿보다 앞선 경로 구간을 실제 경로에서 가져와 붙입니다.
+    (예: /api/v1/backup-status/3, /backup-status/{backup_id} -> /api/v1/backup-status/{backup_id})
+    """
+    segments = path.split("/")
+    prefix_length = len(segments) - len(route_path.split("/"))
+    if prefix_length <= 0:
+        return route_path
+    return "/".join(segments[: prefix_length + 1]) + route_path
+
+
+class TracingMiddleware:
+    """
+    요청 추적 미들웨어
+
+    요청의 traceparent 헤더가 있으면 그 trace를 이어서 기록합니다.
+    span 이름은 "METHOD 라우트 경로 템플릿"이며, 라우트를 찾지 못하면 실제 경로를 사용합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent: Optional[str] = None
+        for key, value in scope["headers"]:
+            if key == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        method = scope["method"]
+        span, token = tracer.start_trace(f"{method} {scope['path']}", traceparent)
+        span.attributes.update({"http.method": method, "http.target": scope["path"]})
+
+        async def send_with_trace_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                span.attributes["http.status_code"] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"traceparent", span.traceparent.encode()))
+                headers.append((b"x-trace-id", span.trace_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        error: Optional[BaseException] = None
+        try:
+            await self.app(scope, receive, send_with_trace_headers)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            route = scope.get("route")
+            if route is not None and hasattr(route, "path"):
+                template = route_template(scope["path"], route.path)
+                span.name = f"{method} {template}"
+                span.attributes["http.route"] = template
+            if error is None and span.attributes.get("http.status_code", 200) >= 500:
+                span.error = f"HTTP {span.attributes['http.status_code']}"
+            tracer.end_trace(span, token, error)
@@ -0,0 +1,150 @@
+"""
+요청 트래픽 수집 미들웨어
+
+API 요청의 메타데이터와 JSON 본문 구조, 응답 상태, 처리 시간을
+트래픽 기록기(services.traffic_capture)에 넘깁니다.
+"""
+
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from middleware.tracing import route_template
+from services.traffic_capture import (
+    CAPTURED_HEADERS,
+    TrafficRecorder,
+    body_shape,
+    redact,
+    redact_pairs,
+)
+
+# 수집 대상 경로 접두사 (문서, 헬스 체크 등은 제외)
+API_PATH_PREFIX = "/api/"
+
+
+class TrafficCaptureMiddleware:
+    """
+    요청 트래픽 수집 미들웨어
+
+    본문은 JSON이고 max_body_bytes 이하일 때만 키와 값 종류(구조)를 기록하며,
+    그 외(파일 업로드 등)는 크기만 기록합니다. (body_kind: shape, omitted)
+    사용자 입력 값(닉네임, 설명, 사용자 ID 등)이 파일에 남지 않도록 기본은 구조만 기록하고,
+    full_bodies를 켜면 비밀 값만 가린 본문 전체를 기록합니다. (body_kind: json)
+    exclude_routes의 라우트(장시간 연결 등)는 기록하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        recorder: TrafficRecorder,
+        max_body_bytes: int = 65536,
+        exclude_routes: Iterable[str] = (),
+        full_bodies: bool = False,
+    ):
+        self.app = app
+        self.recorder = recorder
+        self.max_body_bytes = max_body_bytes
+        self.exclude_routes = set(exclude_routes)
+        self.full_bodies = full_bodies
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(API_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.time()
+        started = time.perf_counter()
+        body = bytearray()
+        body_bytes = 0
+        response: Dict[str, int] = {"status": 500, "bytes": 0}
+
+        async def receive_with_capture() -> Message:
+            nonlocal body_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                body_bytes += len(chunk)
+                if body_bytes <= self.max_body_bytes:
+                    body.extend(chunk)
+            return message
+
+        async def send_with_capture(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_with_capture, send_with_capture)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            route = scope.get("route")
+            template = (
+                route_template(scope["path"], route.path)
+                if route is not None and hasattr(route, "path")
+                else None
+            )
+            if f"{scope['method']} {template}" not in self.exclude_routes:
+                headers = self._captured_headers(scope["headers"])
+                self.recorder.record(
+                    {
+                        "ts": round(started_at, 6),
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "route": template,
+                        "query": redact_pairs(
+                            parse_qsl(
+                                scope["query_string"].decode("latin-1"),
+                                keep_blank_values=True,
+                            )
+                        ),
+                        "headers": headers,
+                        **self._captured_body(headers, bytes(body), body_bytes),
+                        "status": response["status"],
+                        "duration_ms": round(duration_ms, 3),
+                        "response_bytes": response["bytes"],
+                    }
+                )
+
+    @staticmethod
+    def _captured_headers(raw_headers: List[Any]) -> List[List[str]]:
+        return redact_pairs(
+            (key.decode("latin-1"), value.decode("latin-1"))
+            for key, value in raw_headers
+            if key.decode("latin-1") in CAPTURED_HEADERS
+        )
+
+    def _captured_body(
+        self, headers: List[List[str]], body: bytes, body_bytes: int
+    ) -> Dict[str, Any]:
+        if not body_bytes:
+            return {"body_kind": None, "body": None, "body_bytes": 0}
+        content_type: Optional[str] = next(
+            (value for key, value in headers if key == "content-type"), None
+        )
+        if (
+            body_bytes <= self.max_body_bytes
+            and content_type
+            and content_type.startswith("application/json")
+        ):
+            try:
+                parsed = json.loads(body)
+            except ValueError:
+                pass
+            else:
+                if self.full_bodies:
+                    return {
+                        "body_kind": "json",
+                        "body": redact(parsed),
+                        "body_bytes": body_bytes,
+                    }
+                return {
+                    "body_kind": "shape",
+                    "body": body_shape(parsed),
+                    "body_bytes": body_bytes,
+                }
+        return {"body_kind": "omitted", "body": None, "body_bytes": body_bytes}
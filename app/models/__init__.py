@@ -7,6 +7,7 @@
 - User가 먼저 로드되어야 다른 모델에서 FK 참조 가능
 - BackupStatus는 User를 참조
 - MUserBackupStatus는 User와 BackupStatus를 모두 참조
+- 아카이브/이력/작업 모델은 외래키가 없으므로 순서와 무관
 """
 
 # 순환 참조 방지를 위해 순서대로 import
@@ -14,10 +15,18 @@ from models.user import User
 from models.storage_catalog import StorageCatalog
 from models.backup_status import BackupStatus
 from models.m_user_backup_status import MUserBackupStatus
+from models.backup_status_archive import BackupStatusArchive
+from models.m_user_backup_status_archive import MUserBackupStatusArchive
+from models.backup_status_history import BackupStatusHistory
+from models.job import Job
 
 __all__ = [
     "User",
     "StorageCatalog",
     "BackupStatus",
     "MUserBackupStatus",
+    "BackupStatusArchive",
+    "MUserBackupStatusArchive",
+    "BackupStatusHistory",
+    "Job",
 ]
@@ -7,11 +7,33 @@
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+)
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 
 from database import Base
 
+# 백업 단계별 stage_mask 비트 (완료(true)인 단계의 비트가 켜짐)
+STAGE_MASK_BITS = {"cam": 1, "master": 2, "clean": 4, "final_product": 8}
+
+# 모든 단계가 완료된 stage_mask 값
+STAGE_MASK_ALL = sum(STAGE_MASK_BITS.values())
+
+# stage_mask 생성 컬럼 식 (NULL/false 단계는 0, MySQL/SQLite 공통)
+STAGE_MASK_SQL = " + ".join(
+    f"COALESCE({stage}, 0) * {bit}" for stage, bit in STAGE_MASK_BITS.items()
+)
+
 
 class BackupStatus(Base):
     """
@@ -33,12 +55,30 @@ class BackupStatus(Base):
         clean_checker: 정리본 확인자 (User ID)
         final_product: 최종 산출물 백업 여부
         final_product_checker: 최종 산출물 확인자 (User ID)
+        stage_mask: 완료된 단계의 비트 합 (STAGE_MASK_BITS, 생성 컬럼)
         deleted: 삭제 여부 (소프트 삭제)
         deleted_by: 삭제한 사용자 ID
+        deleted_at: 삭제 일시 (아카이브 보존 기간 계산에 사용)
         created_at: 생성 일시
+        updated_at: 마지막 수정 일시 (변경분 동기화 커서, 마이크로초 단위)
     """
 
     __tablename__ = "backup_status"
+    __table_args__ = (
+        # 아카이브 대상(보존 기간이 지난 삭제 항목) 조회용 인덱스
+        Index("ix_backup_status_deleted_deleted_at", "deleted", "deleted_at"),
+        # 변경분 동기화(updated_at 커서) 조회용 인덱스
+        Index("ix_backup_status_updated_at", "updated_at"),
+        # 목록 조회(표시 날짜 범위 필터, 최신순 정렬)용 인덱스
+        Index("ix_backup_status_deleted_displayed_date", "deleted", "displayed_date"),
+        # 단계 완료 여부 필터/집계용 인덱스
+        Index(
+            "ix_backup_status_deleted_stage_mask",
+            "deleted",
+            "stage_mask",
+            "displayed_date",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="고유 식별자")
     event_name = Column(String(100), nullable=True, comment="이벤트명")
@@ -61,15 +101,31 @@ class BackupStatus(Base):
     final_product_checker = Column(
         Integer, ForeignKey("user.id"), nullable=True, comment="최종 산출물 확인자"
     )
+    # 네 단계의 완료 여부를 묶은 값 (OR 조건 대신 인덱스 범위/IN 조건으로 조회)
+    stage_mask = Column(
+        SmallInteger,
+        Computed(STAGE_MASK_SQL, persisted=True),
+        nullable=False,
+        comment="단계 완료 비트마스크",
+    )
     deleted = Column(
         Boolean, nullable=False, default=False, comment="삭제 여부 (소프트 삭제)"
     )
     deleted_by = Column(
         Integer, ForeignKey("user.id"), nullable=True, comment="삭제한 사용자 ID"
     )
+    deleted_at = Column(DateTime, nullable=True, comment="삭제 일시")
     created_at = Column(
         DateTime, nullable=False, default=datetime.utcnow, comment="생성 일시"
     )
+    # 같은 초에 일어난 변경도 구분할 수 있도록 MySQL에서는 DATETIME(6) 사용
+    updated_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="수정 일시",
+    )
 
     # 관계 설정
     cam_checker_user = relationship(
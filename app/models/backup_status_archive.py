@@ -0,0 +1,61 @@
+"""
+백업 상태 아카이브 모델
+
+보존 기간이 지난 소프트 삭제 백업 상태를 보관합니다.
+운영 테이블(backup_status)에는 활성 항목과 최근 삭제 항목만 남깁니다.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy.dialects import mysql
+
+from database import Base
+
+
+class BackupStatusArchive(Base):
+    """
+    백업 상태 아카이브 테이블 모델
+
+    backup_status와 동일한 컬럼에 아카이브 일시를 추가한 테이블입니다.
+    복원 시 원래 ID 그대로 운영 테이블로 되돌리기 위해 ID를 그대로 보관합니다.
+    사용자 삭제 등과 무관하게 보관되도록 외래키는 두지 않습니다.
+
+    Attributes:
+        id: 원본 백업 상태 ID
+        archived_at: 아카이브 일시
+        (그 외 컬럼은 BackupStatus와 동일)
+    """
+
+    __tablename__ = "backup_status_archive"
+    __table_args__ = {"comment": "백업 상태 아카이브 테이블"}
+
+    id = Column(Integer, primary_key=True, autoincrement=False, comment="원본 ID")
+    event_name = Column(String(100), nullable=True, comment="이벤트명")
+    displayed_date = Column(DateTime, nullable=True, comment="표시 날짜")
+    name = Column(String(100), nullable=False, comment="콘텐츠/파일 이름")
+    description = Column(String(1000), nullable=True, comment="상세 설명")
+    cam = Column(Boolean, nullable=True, comment="카메라 원본 백업 여부")
+    cam_checker = Column(Integer, nullable=True, comment="카메라 원본 확인자")
+    master = Column(Boolean, nullable=True, comment="마스터 파일 백업 여부")
+    master_checker = Column(Integer, nullable=True, comment="마스터 파일 확인자")
+    clean = Column(Boolean, nullable=True, comment="정리본 백업 여부")
+    clean_checker = Column(Integer, nullable=True, comment="정리본 확인자")
+    final_product = Column(Boolean, nullable=True, comment="최종 산출물 백업 여부")
+    final_product_checker = Column(Integer, nullable=True, comment="최종 산출물 확인자")
+    deleted = Column(Boolean, nullable=False, default=True, comment="삭제 여부")
+    deleted_by = Column(Integer, nullable=True, comment="삭제한 사용자 ID")
+    deleted_at = Column(DateTime, nullable=True, comment="삭제 일시")
+    created_at = Column(DateTime, nullable=False, comment="생성 일시")
+    updated_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        comment="수정 일시",
+    )
+    archived_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, comment="아카이브 일시"
+    )
+
+    def __repr__(self) -> str:
+        """모델의 문자열 표현을 반환합니다."""
+        return f"<BackupStatusArchive(id={self.id}, name='{self.name}')>"
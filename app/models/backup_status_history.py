@@ -0,0 +1,68 @@
+"""
+백업 상태 변경 이력 모델
+
+누가 언제 어떤 필드(단계)를 변경했는지 추가 전용으로 기록합니다.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+from sqlalchemy.dialects import mysql
+
+from database import Base
+
+
+class BackupStatusHistory(Base):
+    """
+    백업 상태 변경 이력 테이블 모델
+
+    요청 경로에서 큐에 넣은 이력을 백그라운드 작업이 일괄 INSERT합니다.
+    백업 상태가 아카이브되어도 이력은 남도록 외래키는 두지 않습니다.
+
+    Attributes:
+        id: 고유 식별자 (자동 증가)
+        backup_status_id: 백업 상태 ID
+        action: 작업 종류 (created, updated, completed, deleted, restored)
+        field: 변경된 필드명 (생성/삭제 등 필드 단위가 아닌 작업은 NULL)
+        old_value: 변경 전 값 (문자열)
+        new_value: 변경 후 값 (문자열)
+        changed_by: 변경한 사용자 ID
+        changed_at: 변경 일시
+    """
+
+    __tablename__ = "backup_status_history"
+    __table_args__ = (
+        # 백업 상태별 이력 조회용 인덱스
+        Index(
+            "ix_backup_status_history_backup_status_id_changed_at",
+            "backup_status_id",
+            "changed_at",
+        ),
+        {"comment": "백업 상태 변경 이력 테이블"},
+    )
+
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+        comment="고유 식별자",
+    )
+    backup_status_id = Column(Integer, nullable=False, comment="백업 상태 ID")
+    action = Column(String(20), nullable=False, comment="작업 종류")
+    field = Column(String(50), nullable=True, comment="변경된 필드명")
+    old_value = Column(String(1000), nullable=True, comment="변경 전 값")
+    new_value = Column(String(1000), nullable=True, comment="변경 후 값")
+    changed_by = Column(Integer, nullable=True, comment="변경한 사용자 ID")
+    changed_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.utcnow,
+        comment="변경 일시",
+    )
+
+    def __repr__(self) -> str:
+        """모델의 문자열 표현을 반환합니다."""
+        return (
+            f"<BackupStatusHistory(id={self.id}, backup_status_id="
+            f"{self.backup_status_id}, action='{self.action}', field='{self.field}')>"
+        )
@@ -0,0 +1,78 @@
+"""
+백그라운드 작업 모델
+
+내보내기/아카이브 등 오래 걸리는 작업의 상태와 진행률을 저장합니다.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+
+from database import Base
+
+
+class Job(Base):
+    """
+    백그라운드 작업 테이블 모델
+
+    작업 상태를 테이블에 저장하므로 서버가 재시작되어도
+    대기/실행 중이던 작업을 이어서 처리할 수 있습니다.
+
+    Attributes:
+        id: 고유 식별자 (자동 증가)
+        job_type: 작업 종류 (예: backup_status_export)
+        params: 작업 파라미터 (JSON)
+        status: 상태 (queued, running, succeeded, failed)
+        processed: 처리한 항목 수
+        total: 전체 항목 수 (알 수 없으면 NULL)
+        attempts: 실행 시도 횟수
+        worker_id: 실행 중인 워커 식별자
+        result: 작업 결과 요약 (JSON)
+        result_path: 결과 파일 경로 (JOB_RESULT_DIR 기준 상대 경로)
+        result_filename: 다운로드 파일명
+        result_media_type: 결과 파일 Content-Type
+        error: 실패 사유
+        created_by: 요청한 사용자 ID
+        created_at: 생성 일시
+        started_at: 실행 시작 일시
+        heartbeat_at: 워커가 마지막으로 실행 중임을 알린 일시
+        finished_at: 완료 일시
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # 대기 작업 선점 및 중단된 작업 복구용 인덱스
+        Index("ix_jobs_status_id", "status", "id"),
+        {"comment": "백그라운드 작업 테이블"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True, comment="고유 식별자")
+    job_type = Column(String(50), nullable=False, comment="작업 종류")
+    params = Column(JSON, nullable=True, comment="작업 파라미터")
+    status = Column(String(20), nullable=False, default="queued", comment="상태")
+    processed = Column(Integer, nullable=False, default=0, comment="처리한 항목 수")
+    total = Column(Integer, nullable=True, comment="전체 항목 수")
+    attempts = Column(Integer, nullable=False, default=0, comment="실행 시도 횟수")
+    worker_id = Column(String(100), nullable=True, comment="실행 중인 워커 식별자")
+    result = Column(JSON, nullable=True, comment="작업 결과 요약")
+    result_path = Column(
+        String(500), nullable=True, comment="결과 파일 경로 (JOB_RESULT_DIR 기준)"
+    )
+    result_filename = Column(String(255), nullable=True, comment="다운로드 파일명")
+    result_media_type = Column(
+        String(100), nullable=True, comment="결과 파일 Content-Type"
+    )
+    error = Column(Text, nullable=True, comment="실패 사유")
+    created_by = Column(Integer, nullable=True, comment="요청한 사용자 ID")
+    created_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, comment="생성 일시"
+    )
+    started_at = Column(DateTime, nullable=True, comment="실행 시작 일시")
+    heartbeat_at = Column(DateTime, nullable=True, comment="마지막 실행 확인 일시")
+    finished_at = Column(DateTime, nullable=True, comment="완료 일시")
+
+    def __repr__(self) -> str:
+        """모델의 문자열 표현을 반환합니다."""
+        return (
+            f"<Job(id={self.id}, job_type='{self.job_type}', status='{self.status}')>"
+        )
@@ -7,7 +7,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from database import Base
@@ -28,7 +28,20 @@ class MUserBackupStatus(Base):
     """
 
     __tablename__ = "m_user_backup_status"
-    __table_args__ = {"comment": "작업자 매핑 테이블"}
+    __table_args__ = (
+        # 사용자별 작업 항목 조회용 인덱스 (user_id로 backup_status_id까지 커버)
+        Index(
+            "ix_m_user_backup_status_user_id_backup_status_id",
+            "user_id",
+            "backup_status_id",
+        ),
+        # 백업 상태별 작업자 조회용 인덱스
+        # (MySQL은 외래키 인덱스가 자동 생성되므로 SQLite에서만 생성)
+        Index("ix_m_user_backup_status_backup_status_id", "backup_status_id").ddl_if(
+            dialect="sqlite"
+        ),
+        {"comment": "작업자 매핑 테이블"},
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="고유 식별자")
     user_id = Column(
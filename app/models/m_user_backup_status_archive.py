@@ -0,0 +1,48 @@
+"""
+작업자 매핑 아카이브 모델
+
+아카이브된 백업 상태의 작업자 매핑을 보관합니다.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer
+
+from database import Base
+
+
+class MUserBackupStatusArchive(Base):
+    """
+    사용자-백업상태 매핑 아카이브 테이블 모델
+
+    m_user_backup_status와 동일한 컬럼에 아카이브 일시를 추가한 테이블입니다.
+
+    Attributes:
+        id: 원본 매핑 ID
+        user_id: 사용자 ID
+        backup_status_id: 백업 상태 ID (backup_status_archive.id)
+        created_at: 생성 일시
+        created_by: 생성자 ID
+        archived_at: 아카이브 일시
+    """
+
+    __tablename__ = "m_user_backup_status_archive"
+    __table_args__ = {"comment": "작업자 매핑 아카이브 테이블"}
+
+    id = Column(Integer, primary_key=True, autoincrement=False, comment="원본 ID")
+    user_id = Column(Integer, nullable=False, comment="사용자 ID")
+    backup_status_id = Column(
+        Integer, nullable=False, index=True, comment="백업 상태 ID"
+    )
+    created_at = Column(DateTime, nullable=True, comment="생성 일시")
+    created_by = Column(Integer, nullable=False, comment="생성자 ID")
+    archived_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, comment="아카이브 일시"
+    )
+
+    def __repr__(self) -> str:
+        """모델의 문자열 표현을 반환합니다."""
+        return (
+            f"<MUserBackupStatusArchive(id={self.id}, user_id={self.user_id}, "
+            f"backup_status_id={self.backup_status_id})>"
+        )
@@ -5,7 +5,7 @@
 영상/이미지 등의 저장 위치와 분류를 추적합니다.
 """
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String, func, literal_column
 
 from database import Base
 
@@ -27,6 +27,25 @@ class StorageCatalog(Base):
     """
 
     __tablename__ = "storage_catalog"
+    __table_args__ = (
+        # 필터 및 facet 집계(GROUP BY)용 인덱스
+        Index(
+            "ix_storage_catalog_storage_category_year_month",
+            "storage",
+            "category",
+            "year",
+            "month",
+        ),
+        Index("ix_storage_catalog_year_month", "year", "month"),
+        # 활동명/설명 검색용 n-gram 전문 검색 인덱스 (MySQL 전용)
+        Index(
+            "ft_storage_catalog_activity_name_description",
+            "activity_name",
+            "description",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, comment="고유 식별자")
     storage = Column(String(20), nullable=False, comment="저장소 이름/위치")
@@ -44,3 +63,78 @@ class StorageCatalog(Base):
             f"<StorageCatalog(id={self.id}, storage='{self.storage}', "
             f"activity_name='{self.activity_name}')>"
         )
+
+
+# 카탈로그 자연 키 (저장소, 카테고리, 연도, 월, 활동명) 유니크 인덱스
+# 연도/월의 NULL은 서로 다른 값으로 취급되므로 0으로 바꿔 비교합니다.
+# (업서트의 충돌 대상(NATURAL_KEY)도 이 식과 같아야 SQLite ON CONFLICT가 인덱스를 찾음)
+NATURAL_KEY = (
+    StorageCatalog.storage,
+    StorageCatalog.category,
+    func.coalesce(StorageCatalog.year, literal_column("0")),
+    func.coalesce(StorageCatalog.month, literal_column("0")),
+    StorageCatalog.activity_name,
+)
+Index("uq_storage_catalog_natural_key", *NATURAL_KEY, unique=True)
+
+# 자연 키 유니크 인덱스가 없던 SQLite DB의 중복 항목 정리
+# 자연 키마다 가장 먼저 만든 항목(최소 ID)을 남기고, 설명은 가장 최근 항목의 값으로 맞춥니다.
+# (업서트가 기존 항목의 설명을 갱신하는 것과 같은 결과)
+STORAGE_CATALOG_DEDUPE_SQLITE = [
+    """
+    UPDATE storage_catalog SET description = (
+        SELECT latest.description FROM storage_catalog AS latest
+        WHERE latest.storage = storage_catalog.storage
+          AND latest.category = storage_catalog.category
+          AND COALESCE(latest.year, 0) = COALESCE(storage_catalog.year, 0)
+          AND COALESCE(latest.month, 0) = COALESCE(storage_catalog.month, 0)
+          AND latest.activity_name = storage_catalog.activity_name
+        ORDER BY latest.id DESC LIMIT 1
+    )
+    WHERE id IN (
+        SELECT MIN(id) FROM storage_catalog
+        GROUP BY storage, category, COALESCE(year, 0), COALESCE(month, 0), activity_name
+        HAVING COUNT(*) > 1
+    )
+    """,
+    """
+    DELETE FROM storage_catalog WHERE id NOT IN (
+        SELECT MIN(id) FROM storage_catalog
+        GROUP BY storage, category, COALESCE(year, 0), COALESCE(month, 0), activity_name
+    )
+    """,
+]
+
+# 활동명/설명 검색용 FTS5 trigram 인덱스 (SQLite 전용, 부분 문자열 검색)
+# 외부 콘텐츠 테이블로 만들고 트리거로 storage_catalog와 동기화합니다. (create_sqlite_schema에서 생성)
+STORAGE_CATALOG_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS storage_catalog_fts USING fts5(
+        activity_name, description,
+        content='storage_catalog', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS storage_catalog_fts_ai AFTER INSERT ON storage_catalog
+    BEGIN
+        INSERT INTO storage_catalog_fts(rowid, activity_name, description)
+        VALUES (new.id, new.activity_name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS storage_catalog_fts_ad AFTER DELETE ON storage_catalog
+    BEGIN
+        INSERT INTO storage_catalog_fts(storage_catalog_fts, rowid, activity_name, description)
+        VALUES ('delete', old.id, old.activity_name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS storage_catalog_fts_au AFTER UPDATE ON storage_catalog
+    BEGIN
+        INSERT INTO storage_catalog_fts(storage_catalog_fts, rowid, activity_name, description)
+        VALUES ('delete', old.id, old.activity_name, old.description);
+        INSERT INTO storage_catalog_fts(rowid, activity_name, description)
+        VALUES (new.id, new.activity_name, new.description);
+    END
+    """,
+]
@@ -4,6 +4,6 @@ API 라우터 패키지
 모든 API 엔드포인트 라우터를 이 패키지에서 관리합니다.
 """
 
-from routers import backup_status, storage_catalog, auth
+from routers import backup_status, storage_catalog, auth, jobs
 
-__all__ = ["storage_catalog", "backup_status", "auth"]
+__all__ = ["storage_catalog", "backup_status", "auth", "jobs"]
@@ -0,0 +1,97 @@
+"""
+관리 API 라우터
+
+워커 메모리 사용량 확인용 프로파일링 엔드포인트를 제공합니다.
+모든 엔드포인트는 X-Admin-Token 헤더가 필요합니다.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from config import get_settings
+from dependencies import require_admin_token
+from schemas.admin import AllocationTopResponse, MemoryProfileResponse
+from services.memory_profiler import GROUP_BY_OPTIONS, memory_profiler
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin_token)],
+    responses={401: {"description": "Invalid admin token"}},
+)
+
+# 설정 로드
+settings = get_settings()
+
+
+@router.get("/memory", response_model=MemoryProfileResponse)
+def get_memory_profile():
+    """
+    메모리 프로파일링 상태와 라우트별 요청 최대 할당량을 조회합니다.
+
+    현재/최대 RSS, 추적 중인 할당량, 열린 ORM 세션의 identity map 크기를 함께 반환합니다.
+    라우트별 값은 요청이 동시에 처리되면 다른 요청의 할당이 포함된 상한값입니다.
+    """
+    return memory_profiler.status()
+
+
+@router.post("/memory/start", response_model=MemoryProfileResponse)
+def start_memory_profiling(
+    frames: Optional[int] = Query(
+        None, ge=1, le=50, description="할당마다 저장할 호출 스택 깊이 (기본: 설정값)"
+    ),
+):
+    """
+    메모리 프로파일링을 시작합니다. (실행 중이면 집계를 초기화하고 다시 시작)
+
+    프로파일링 중에는 모든 할당을 추적하므로 요청 처리가 느려지고 메모리를 더 사용합니다.
+
+    - **frames**: 할당마다 저장할 호출 스택 깊이 (클수록 느림)
+    """
+    memory_profiler.start(frames or settings.memory_profiling_frames)
+    return memory_profiler.status()
+
+
+@router.post("/memory/stop", response_model=MemoryProfileResponse)
+def stop_memory_profiling():
+    """
+    메모리 프로파일링을 멈춥니다. (라우트별 집계는 다음 시작 전까지 유지)
+    """
+    memory_profiler.stop()
+    return memory_profiler.status()
+
+
+@router.post("/memory/reset", response_model=MemoryProfileResponse)
+def reset_memory_profile():
+    """
+    라우트별 집계와 최대 추적 할당량을 초기화합니다.
+    """
+    memory_profiler.reset()
+    return memory_profiler.status()
+
+
+@router.get("/memory/top", response_model=AllocationTopResponse)
+def get_top_allocations(
+    group_by: str = Query(
+        "lineno",
+        pattern=f"^({'|'.join(GROUP_BY_OPTIONS)})$",
+        description="묶는 기준 (lineno: 파일:줄, filename: 파일, traceback: 호출 스택)",
+    ),
+    limit: int = Query(20, ge=1, le=200, description="조회할 위치 수"),
+):
+    """
+    현재 살아 있는 할당을 위치별로 묶어 크기 순으로 조회합니다.
+
+    스냅샷을 만드는 동안 다른 요청 처리가 잠시 멈춥니다.
+    group_by=traceback은 프로파일링 시작 시 frames가 2 이상이어야 의미가 있습니다.
+
+    - **group_by**: 묶는 기준
+    - **limit**: 조회할 위치 수
+    """
+    if not memory_profiler.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="메모리 프로파일링 중이 아닙니다. /admin/memory/start로 시작해 주세요.",
+        )
+    return memory_profiler.top_allocations(group_by, limit)
@@ -6,12 +6,24 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import case, desc, func, or_, select
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import desc_nulls_last, get_db
+from models.backup_status import STAGE_MASK_ALL, STAGE_MASK_BITS, BackupStatus
+from models.m_user_backup_status import MUserBackupStatus
 from models.user import User
-from schemas.user import LoginRequest, UserResponse
+from schemas.backup_status import BackupStatusListResponse
+from schemas.user import (
+    LoginRequest,
+    UserCheckedCounts,
+    UserProducedCounts,
+    UserResponse,
+    UserWorkloadStatsResponse,
+)
+from services.backup_list import build_backup_list_responses, query_backup_list
+from services.response_formats import negotiate_list_response
 
 router = APIRouter(
     prefix="/auth",
@@ -55,11 +67,142 @@ def login(login_data: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/users", response_model=List[UserResponse])
-def get_all_users(db: Session = Depends(get_db)):
+def get_all_users(request: Request, db: Session = Depends(get_db)):
     """
     모든 사용자 목록 조회
 
     삭제되지 않은 모든 사용자 정보를 반환합니다. (비밀번호 제외)
+    Accept 헤더로 응답 형식을 선택할 수 있습니다.
     """
     users = db.query(User).filter(User.deleted == False).all()
-    return users
+    return negotiate_list_response(
+        request, [UserResponse.model_validate(user) for user in users]
+    )
+
+
+def get_active_user_or_404(db: Session, user_id: int) -> User:
+    """
+    삭제되지 않은 사용자를 조회하고, 없으면 404 예외를 발생시킵니다.
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+
+    Returns:
+        User: 사용자 객체
+    """
+    user = db.query(User).filter(User.id == user_id, User.deleted == False).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID {user_id}인 사용자를 찾을 수 없습니다.",
+        )
+    return user
+
+
+def count_if(condition):
+    """조건을 만족하는 행 수를 세는 집계식을 반환합니다."""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+@router.get("/users/{user_id}/backups", response_model=List[BackupStatusListResponse])
+def get_user_backups(
+    user_id: int,
+    skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
+    limit: int = Query(100, ge=1, le=10000, description="조회할 항목 수"),
+    db: Session = Depends(get_db),
+):
+    """
+    사용자가 작업자(producer)로 참여한 백업 상태 목록을 조회합니다.
+
+    삭제되지 않은 항목만 displayed_date 기준 최신순으로 반환합니다.
+
+    - **user_id**: 사용자 ID
+    - **skip**: 페이지네이션을 위한 건너뛸 항목 수
+    - **limit**: 조회할 최대 항목 수
+    """
+    get_active_user_or_404(db, user_id)
+
+    produced_ids = select(MUserBackupStatus.backup_status_id).where(
+        MUserBackupStatus.user_id == user_id
+    )
+    results = (
+        query_backup_list(db)
+        .filter(BackupStatus.deleted == False, BackupStatus.id.in_(produced_ids))
+        .order_by(desc_nulls_last(BackupStatus.displayed_date), desc(BackupStatus.id))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    return build_backup_list_responses(db, results)
+
+
+@router.get("/users/{user_id}/stats", response_model=UserWorkloadStatsResponse)
+def get_user_stats(user_id: int, db: Session = Depends(get_db)):
+    """
+    사용자의 작업량 통계를 조회합니다.
+
+    작업자로 참여한 항목의 단계별 완료 수와, 각 단계 확인자로 지정된 항목 수를
+    하나의 집계 쿼리로 계산합니다. 삭제된 항목은 제외됩니다.
+    단계별 완료 수는 stage_mask 비트로 계산합니다.
+
+    - **user_id**: 사용자 ID
+    """
+    get_active_user_or_404(db, user_id)
+
+    # 사용자가 작업자로 매핑된 백업 상태 ID (중복 매핑 제거)
+    produced = (
+        select(MUserBackupStatus.backup_status_id)
+        .where(MUserBackupStatus.user_id == user_id)
+        .distinct()
+        .subquery()
+    )
+    is_produced = produced.c.backup_status_id.isnot(None)
+    checked_conditions = {
+        "cam": BackupStatus.cam_checker == user_id,
+        "master": BackupStatus.master_checker == user_id,
+        "clean": BackupStatus.clean_checker == user_id,
+        "final_product": BackupStatus.final_product_checker == user_id,
+    }
+    is_checked = or_(*checked_conditions.values())
+
+    row = (
+        db.query(
+            count_if(is_produced).label("produced_total"),
+            *[
+                count_if(
+                    is_produced & (BackupStatus.stage_mask.bitwise_and(bit) != 0)
+                ).label(f"produced_{stage}")
+                for stage, bit in STAGE_MASK_BITS.items()
+            ],
+            count_if(is_produced & (BackupStatus.stage_mask == STAGE_MASK_ALL)).label(
+                "produced_fully_backed_up"
+            ),
+            count_if(is_checked).label("checked_total"),
+            *[
+                count_if(condition).label(f"checked_{stage}")
+                for stage, condition in checked_conditions.items()
+            ],
+        )
+        .select_from(BackupStatus)
+        .outerjoin(produced, produced.c.backup_status_id == BackupStatus.id)
+        .filter(BackupStatus.deleted == False, or_(is_produced, is_checked))
+        .one()
+    )
+    values = row._mapping
+
+    return UserWorkloadStatsResponse(
+        user_id=user_id,
+        produced=UserProducedCounts(
+            **{
+                field: values[f"produced_{field}"]
+                for field in UserProducedCounts.model_fields
+            }
+        ),
+        checked=UserCheckedCounts(
+            **{
+                field: values[f"checked_{field}"]
+                for field in UserCheckedCounts.model_fields
+            }
+        ),
+    )
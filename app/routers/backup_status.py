@@ -4,22 +4,68 @@
 백업 상태 CRUD 엔드포인트를 제공합니다.
 """
 
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import case, desc
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Literal, Optional, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, desc, exists, func, or_
 from sqlalchemy.orm import Session, aliased
 
-from database import get_db
-from models.backup_status import BackupStatus
+from config import get_settings
+from database import desc_nulls_last, get_db
+from dependencies import FieldSelector
+from models.backup_status import STAGE_MASK_ALL, STAGE_MASK_BITS, BackupStatus
+from models.backup_status_history import BackupStatusHistory
 from models.m_user_backup_status import MUserBackupStatus
 from models.user import User
 from schemas.backup_status import (
+    BackupStatusBatchGetRequest,
+    BackupStatusBatchGetResponse,
+    BackupStatusChangesResponse,
     BackupStatusCreate,
+    BackupStatusEventResponse,
+    BackupStatusHistoryResponse,
     BackupStatusListResponse,
     BackupStatusResponse,
+    BackupStatusSummaryResponse,
     BackupStatusUpdate,
 )
+from services.audit import (
+    ACTION_CREATED,
+    ACTION_DELETED,
+    ACTION_RESTORED,
+    ACTION_UPDATED,
+    HistoryEntry,
+    audit_recorder,
+    field_change_entries,
+    stage_change_entries,
+)
+from services.backup_archive import restore_archived_backup
+from services.backup_list import (
+    backup_progress_columns,
+    build_backup_list_responses,
+    get_producers_for_backups,
+    query_backup_list,
+)
+from services.backup_snapshot import backup_snapshot
+from services.broadcaster import (
+    EVENT_COMPLETED,
+    EVENT_CREATED,
+    EVENT_DELETED,
+    EVENT_UPDATED,
+    backup_status_broadcaster,
+)
+from services.mark_complete_coalescer import (
+    BackupStatusNotFoundError,
+    apply_stage_changes,
+    mark_complete_coalescer,
+)
+from services.response_formats import negotiate_list_response
+
+settings = get_settings()
 
 router = APIRouter(
     prefix="/backup-status",
@@ -28,24 +74,201 @@ router = APIRouter(
 )
 
 
-def get_producers_for_backup(db: Session, backup_status_id: int) -> List[str]:
+# 확인자 이름 필드 -> 확인자 ID 컬럼
+CHECKER_NAME_FIELDS = {
+    "cam_checker_name": BackupStatus.cam_checker,
+    "master_checker_name": BackupStatus.master_checker,
+    "clean_checker_name": BackupStatus.clean_checker,
+    "final_product_checker_name": BackupStatus.final_product_checker,
+}
+
+# 목록 조회 시 선택 가능한 필드
+backup_list_fields = FieldSelector(BackupStatusListResponse.model_fields)
+
+# 백업 단계 -> 확인자 컬럼
+STAGE_CHECKERS = {
+    "cam": BackupStatus.cam_checker,
+    "master": BackupStatus.master_checker,
+    "clean": BackupStatus.clean_checker,
+    "final_product": BackupStatus.final_product_checker,
+}
+
+
+@dataclass
+class BackupStatusFilters:
+    """
+    백업 상태 목록 필터 의존성
+
+    목록 조회의 필터 쿼리 파라미터를 모읍니다.
+    apply_backup_status_filters()로 쿼리에 적용하거나,
+    인메모리 스냅샷(services.backup_snapshot)에서 같은 조건으로 조회합니다.
+
+    Raises:
+        HTTPException: 표시 날짜 범위가 잘못된 경우 (400)
+    """
+
+    event_name: Optional[str] = Query(None, description="이벤트명 필터")
+    displayed_date_from: Optional[datetime] = Query(
+        None, description="표시 날짜 시작 (이상)"
+    )
+    displayed_date_to: Optional[datetime] = Query(
+        None, description="표시 날짜 끝 (미만)"
+    )
+    incomplete_stage: Optional[Literal["cam", "master", "clean", "final_product"]] = (
+        Query(None, description="해당 단계가 완료되지 않은 항목만 조회")
+    )
+    checker_id: Optional[int] = Query(
+        None, description="어느 단계든 확인자로 지정된 사용자 ID"
+    )
+    producer_id: Optional[int] = Query(None, description="작업자(producers) 사용자 ID")
+    fully_backed_up: Optional[bool] = Query(
+        None,
+        description="모든 단계 완료 여부 (true: 전체 완료, false: 미완료 단계 있음)",
+    )
+
+    def __post_init__(self):
+        if (
+            self.displayed_date_from is not None
+            and self.displayed_date_to is not None
+            and self.displayed_date_from >= self.displayed_date_to
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="displayed_date_from은 displayed_date_to보다 이전이어야 합니다.",
+            )
+
+
+def stage_incomplete(stage: str):
+    """
+    단계가 완료되지 않은(NULL 또는 false) 조건을 반환합니다.
+
+    해당 비트가 꺼진 stage_mask 값 목록(IN)으로 비교하여
+    (deleted, stage_mask, displayed_date) 인덱스 범위로 처리되게 합니다.
+    """
+    bit = STAGE_MASK_BITS[stage]
+    return BackupStatus.stage_mask.in_(
+        [mask for mask in range(STAGE_MASK_ALL + 1) if not mask & bit]
+    )
+
+
+def apply_backup_status_filters(query, filters: BackupStatusFilters):
+    """
+    목록 필터를 쿼리에 적용합니다.
+
+    표시 날짜 범위는 (deleted, displayed_date) 인덱스로,
+    미완료 단계/전체 완료 필터는 (deleted, stage_mask, displayed_date) 인덱스로 처리되고,
+    작업자 필터는 (user_id, backup_status_id) 인덱스를 사용하는 EXISTS로 처리합니다.
+
+    Args:
+        query: BackupStatus를 조회하는 쿼리
+        filters: 목록 필터
+
+    Returns:
+        Query: 필터가 적용된 쿼리
+    """
+    if filters.event_name:
+        query = query.filter(BackupStatus.event_name.contains(filters.event_name))
+    if filters.displayed_date_from is not None:
+        query = query.filter(BackupStatus.displayed_date >= filters.displayed_date_from)
+    if filters.displayed_date_to is not None:
+        query = query.filter(BackupStatus.displayed_date < filters.displayed_date_to)
+    if filters.incomplete_stage:
+        query = query.filter(stage_incomplete(filters.incomplete_stage))
+    if filters.checker_id is not None:
+        query = query.filter(
+            or_(*(checker == filters.checker_id for checker in STAGE_CHECKERS.values()))
+        )
+    if filters.producer_id is not None:
+        query = query.filter(
+            exists().where(
+                MUserBackupStatus.user_id == filters.producer_id,
+                MUserBackupStatus.backup_status_id == BackupStatus.id,
+            )
+        )
+    if filters.fully_backed_up is True:
+        query = query.filter(BackupStatus.stage_mask == STAGE_MASK_ALL)
+    elif filters.fully_backed_up is False:
+        query = query.filter(BackupStatus.stage_mask < STAGE_MASK_ALL)
+    return query
+
+
+def query_backup_fields(db: Session, fields: List[str]):
     """
-    백업 상태에 매핑된 작업자(producers) 이름 리스트를 조회합니다.
+    요청된 필드만 SELECT하는 백업 상태 목록 조회 쿼리를 생성합니다.
+
+    확인자 이름 필드가 요청된 경우에만 해당 User join을 추가하며,
+    작업자(producers)는 build_backup_field_rows()에서 요청된 경우에만 조회합니다.
 
     Args:
         db: 데이터베이스 세션
-        backup_status_id: 백업 상태 ID
+        fields: 응답에 포함할 필드명 리스트
 
     Returns:
-        List[str]: 작업자 이름 리스트
+        Query: 요청 필드(와 producers 조회용 id)를 컬럼으로 반환하는 쿼리
     """
-    results = (
-        db.query(User.name)
-        .join(MUserBackupStatus, MUserBackupStatus.user_id == User.id)
-        .filter(MUserBackupStatus.backup_status_id == backup_status_id)
-        .all()
-    )
-    return [row[0] for row in results]
+    columns = [BackupStatus.id]
+    joins = []
+    for field in fields:
+        if field in CHECKER_NAME_FIELDS:
+            checker = aliased(User)
+            columns.append(checker.name.label(field))
+            joins.append((checker, CHECKER_NAME_FIELDS[field] == checker.id))
+        elif field not in ("id", "producers"):
+            columns.append(getattr(BackupStatus, field))
+
+    query = db.query(*columns).select_from(BackupStatus)
+    for checker, on_clause in joins:
+        query = query.outerjoin(checker, on_clause)
+    return query
+
+
+def build_backup_field_rows(db: Session, rows, fields: List[str]) -> List[dict]:
+    """
+    query_backup_fields() 결과 행을 요청 필드만 담은 딕셔너리로 변환합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        rows: query_backup_fields() 쿼리 결과 행 리스트
+        fields: 응답에 포함할 필드명 리스트
+
+    Returns:
+        List[dict]: 요청 필드만 포함한 항목 리스트
+    """
+    producers = {}
+    if "producers" in fields:
+        producers = get_producers_for_backups(db, [row.id for row in rows])
+
+    items = []
+    for row in rows:
+        values = row._mapping
+        items.append(
+            {
+                field: producers[row.id] if field == "producers" else values[field]
+                for field in fields
+            }
+        )
+    return items
+
+
+def publish_backup_event(
+    event_type: str, backup: Union[BackupStatus, BackupStatusResponse]
+) -> None:
+    """
+    커밋된 백업 상태 변경을 스트림 구독자에게 발행합니다.
+
+    삭제 이벤트는 ID만, 그 외 이벤트는 상세 조회와 동일한 데이터를 보냅니다.
+
+    Args:
+        event_type: 이벤트 종류 (created, updated, completed, deleted)
+        backup: 변경된 백업 상태 객체 (또는 이미 변환된 응답 스키마)
+    """
+    if event_type == EVENT_DELETED:
+        data = {"id": backup.id}
+    else:
+        data = BackupStatusResponse.model_validate(backup).model_dump(mode="json")
+    backup_status_broadcaster.publish(event_type, data)
+    # 인메모리 스냅샷은 다음 조회 전에 변경분을 반영
+    backup_snapshot.mark_dirty()
 
 
 def sync_producers(
@@ -79,9 +302,11 @@ def sync_producers(
 
 @router.get("", response_model=List[BackupStatusListResponse])
 def get_backup_statuses(
+    request: Request,
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(100, ge=1, le=10000, description="조회할 항목 수"),
-    event_name: Optional[str] = Query(None, description="이벤트명 필터"),
+    filters: BackupStatusFilters = Depends(),
+    fields: Optional[List[str]] = Depends(backup_list_fields),
     db: Session = Depends(get_db),
 ):
     """
@@ -92,80 +317,313 @@ def get_backup_statuses(
     작업자(producers) 이름 리스트도 함께 반환합니다.
     displayed_date 기준 최신순으로 정렬됩니다.
 
+    fields가 주어지면 해당 필드만 조회하여 반환합니다.
+    요청되지 않은 확인자 이름의 join과 작업자 조회는 생략됩니다.
+
+    BACKUP_SNAPSHOT이 켜져 있으면 DB 대신 인메모리 스냅샷에서 조회합니다.
+    (표시 날짜가 같으면 ID 역순)
+
     - **skip**: 페이지네이션을 위한 건너뛸 항목 수
     - **limit**: 조회할 최대 항목 수
     - **event_name**: 이벤트명으로 필터링
+    - **displayed_date_from**, **displayed_date_to**: 표시 날짜 범위 (시작 이상, 끝 미만)
+    - **incomplete_stage**: 완료되지 않은 단계 (cam, master, clean, final_product)
+    - **checker_id**: 어느 단계든 확인자로 지정된 사용자 ID
+    - **producer_id**: 작업자로 매핑된 사용자 ID
+    - **fully_backed_up**: 모든 단계 완료 여부
+    - **fields**: 응답에 포함할 필드 (쉼표 구분, 예: id,name,event_name,cam)
+
+    Accept 헤더로 응답 형식을 선택할 수 있습니다.
+    (application/json, application/vnd.ym.columnar+json, application/msgpack)
     """
-    # 각 checker에 대해 User 테이블을 별도로 alias하여 left join
-    CamChecker = aliased(User)
-    MasterChecker = aliased(User)
-    CleanChecker = aliased(User)
-    FinalProductChecker = aliased(User)
-
-    query = (
-        db.query(
-            BackupStatus,
-            CamChecker.name.label("cam_checker_name"),
-            MasterChecker.name.label("master_checker_name"),
-            CleanChecker.name.label("clean_checker_name"),
-            FinalProductChecker.name.label("final_product_checker_name"),
-        )
-        .outerjoin(CamChecker, BackupStatus.cam_checker == CamChecker.id)
-        .outerjoin(MasterChecker, BackupStatus.master_checker == MasterChecker.id)
-        .outerjoin(CleanChecker, BackupStatus.clean_checker == CleanChecker.id)
-        .outerjoin(
-            FinalProductChecker,
-            BackupStatus.final_product_checker == FinalProductChecker.id,
-        )
-    )
+    items = backup_snapshot.list_items(filters, skip, limit)
+    if items is not None:
+        if fields:
+            items = [item.model_dump(include=set(fields)) for item in items]
+        return negotiate_list_response(request, items)
+
+    query = query_backup_fields(db, fields) if fields else query_backup_list(db)
 
     # 삭제되지 않은 항목만 조회
     query = query.filter(BackupStatus.deleted == False)
+    query = apply_backup_status_filters(query, filters)
 
-    if event_name:
-        query = query.filter(BackupStatus.event_name.contains(event_name))
-
-    # displayed_date 기준 최신순 정렬 (NULL은 마지막에 - MySQL 호환)
+    # displayed_date 기준 최신순 정렬 (NULL은 마지막에)
+    # 같은 날짜는 ID 역순으로 고정하여 페이지가 겹치거나 빠지지 않고 스냅샷 조회와 순서가 같도록 함
     query = query.order_by(
-        case((BackupStatus.displayed_date.is_(None), 1), else_=0),
-        desc(BackupStatus.displayed_date),
+        desc_nulls_last(BackupStatus.displayed_date), desc(BackupStatus.id)
     )
 
     results = query.offset(skip).limit(limit).all()
 
-    # 결과를 응답 스키마에 맞게 변환
-    response_list = []
-    for row in results:
-        backup = row[0]  # BackupStatus 객체
-
-        # 작업자(producers) 조회
-        producers = get_producers_for_backup(db, backup.id)
-
-        response_list.append(
-            BackupStatusListResponse(
-                id=backup.id,
-                event_name=backup.event_name,
-                displayed_date=backup.displayed_date,
-                name=backup.name,
-                description=backup.description,
-                cam=backup.cam,
-                cam_checker=backup.cam_checker,
-                cam_checker_name=row.cam_checker_name,
-                master=backup.master,
-                master_checker=backup.master_checker,
-                master_checker_name=row.master_checker_name,
-                clean=backup.clean,
-                clean_checker=backup.clean_checker,
-                clean_checker_name=row.clean_checker_name,
-                final_product=backup.final_product,
-                final_product_checker=backup.final_product_checker,
-                final_product_checker_name=row.final_product_checker_name,
-                created_at=backup.created_at,
-                producers=producers,
+    # 결과를 응답 스키마에 맞게 변환 (Accept 헤더에 따라 인코딩/압축)
+    if fields:
+        items = build_backup_field_rows(db, results, fields)
+    else:
+        items = build_backup_list_responses(db, results)
+    return negotiate_list_response(request, items)
+
+
+@router.post("/batch-get", response_model=BackupStatusBatchGetResponse)
+def batch_get_backup_statuses(
+    request_data: BackupStatusBatchGetRequest, db: Session = Depends(get_db)
+):
+    """
+    여러 백업 상태를 ID로 한 번에 조회합니다.
+
+    하나의 IN 쿼리로 조회하며, 목록 조회와 동일하게 확인자 이름과
+    작업자(producers) 이름을 함께 반환합니다.
+    결과는 요청한 ID 순서를 따르고, 없거나 삭제된 ID는 missing_ids로 반환합니다.
+
+    - **ids**: 조회할 백업 상태 ID 리스트 (최대 1000개)
+    """
+    ids = list(dict.fromkeys(request_data.ids))  # 순서를 유지하며 중복 제거
+
+    rows = (
+        query_backup_list(db)
+        .filter(BackupStatus.id.in_(ids), BackupStatus.deleted == False)
+        .all()
+    )
+    items_by_id = {item.id: item for item in build_backup_list_responses(db, rows)}
+
+    return BackupStatusBatchGetResponse(
+        items=[items_by_id[backup_id] for backup_id in ids if backup_id in items_by_id],
+        missing_ids=[backup_id for backup_id in ids if backup_id not in items_by_id],
+    )
+
+
+# 커밋 지연으로 늦게 보이는 변경을 놓치지 않도록 커서를 되돌려 두는 시간
+CHANGES_SAFETY_WINDOW = timedelta(seconds=5)
+
+
+@router.get("/summary", response_model=BackupStatusSummaryResponse)
+def get_backup_status_summary(
+    filters: BackupStatusFilters = Depends(),
+    db: Session = Depends(get_db),
+):
+    """
+    백업 상태 전체의 진행 요약을 조회합니다.
+
+    삭제되지 않은 항목의 수, 단계별 완료 수, 표시 날짜 범위를 반환합니다.
+    목록 조회와 같은 필터를 사용할 수 있습니다.
+    BACKUP_SNAPSHOT이 켜져 있으면 DB 대신 인메모리 스냅샷에서 집계합니다.
+    """
+    summary = backup_snapshot.summary(filters)
+    if summary is not None:
+        return BackupStatusSummaryResponse(**summary)
+
+    row = apply_backup_status_filters(
+        db.query(*backup_progress_columns()).filter(BackupStatus.deleted == False),
+        filters,
+    ).one()
+    return BackupStatusSummaryResponse(**row._mapping)
+
+
+@router.get("/events", response_model=List[BackupStatusEventResponse])
+def get_backup_status_events(
+    skip: int = Query(0, ge=0, description="건너뛸 이벤트 수"),
+    limit: int = Query(50, ge=1, le=500, description="조회할 이벤트 수"),
+    preview_skip: int = Query(
+        0, ge=0, description="이벤트별 미리보기에서 건너뛸 항목 수"
+    ),
+    preview_limit: int = Query(
+        5, ge=0, le=100, description="이벤트별 미리보기 항목 수"
+    ),
+    filters: BackupStatusFilters = Depends(),
+    db: Session = Depends(get_db),
+):
+    """
+    이벤트별 백업 진행 상태를 조회합니다.
+
+    삭제되지 않은 항목을 이벤트명으로 묶어 항목 수, 단계별 완료 수,
+    표시 날짜 범위를 한 번의 집계 쿼리로 계산하고,
+    조회된 이벤트들의 항목 미리보기를 한 번의 쿼리로 함께 조회합니다.
+    이벤트는 가장 늦은 표시 날짜 기준 최신순으로 정렬됩니다.
+    목록 조회와 같은 필터를 사용할 수 있으며, 필터는 집계 전에 적용됩니다.
+
+    - **skip**: 건너뛸 이벤트 수
+    - **limit**: 조회할 최대 이벤트 수
+    - **preview_skip**: 이벤트별 미리보기에서 건너뛸 항목 수
+    - **preview_limit**: 이벤트별 미리보기 항목 수 (0이면 미리보기 생략)
+    """
+    progress_columns = backup_progress_columns()
+    groups = (
+        apply_backup_status_filters(
+            db.query(BackupStatus.event_name, *progress_columns).filter(
+                BackupStatus.deleted == False
+            ),
+            filters,
+        )
+        .group_by(BackupStatus.event_name)
+        # 가장 늦은 표시 날짜(last_displayed_date) 최신순
+        .order_by(desc_nulls_last(progress_columns[-1]), BackupStatus.event_name)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+    items: Dict[Optional[str], List[BackupStatusListResponse]] = {
+        group.event_name: [] for group in groups
+    }
+    if groups and preview_limit:
+        # 이벤트별 표시 날짜 최신순 순번으로 미리보기 범위를 한 번에 조회
+        event_condition = BackupStatus.event_name.in_(
+            [event_name for event_name in items if event_name is not None]
+        )
+        if None in items:
+            event_condition = or_(event_condition, BackupStatus.event_name.is_(None))
+        row_number = (
+            func.row_number()
+            .over(
+                partition_by=BackupStatus.event_name,
+                order_by=(
+                    desc_nulls_last(BackupStatus.displayed_date),
+                    desc(BackupStatus.id),
+                ),
+            )
+            .label("row_number")
+        )
+        ranked = apply_backup_status_filters(
+            db.query(BackupStatus.id, row_number).filter(
+                BackupStatus.deleted == False, event_condition
+            ),
+            filters,
+        ).subquery()
+        rows = (
+            query_backup_list(db)
+            .join(ranked, ranked.c.id == BackupStatus.id)
+            .filter(
+                ranked.c.row_number > preview_skip,
+                ranked.c.row_number <= preview_skip + preview_limit,
+            )
+            .order_by(ranked.c.row_number)
+            .all()
+        )
+        for item in build_backup_list_responses(db, rows):
+            items[item.event_name].append(item)
+
+    return [
+        BackupStatusEventResponse(**group._mapping, items=items[group.event_name])
+        for group in groups
+    ]
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """시간대 정보가 있는 일시를 DB 저장 형식(UTC, naive)으로 변환합니다."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@router.get("/changes", response_model=BackupStatusChangesResponse)
+def get_backup_status_changes(
+    since: datetime = Query(..., description="마지막 동기화 시점 (next_since)"),
+    since_id: int = Query(0, ge=0, description="마지막 동기화 ID (next_since_id)"),
+    limit: int = Query(500, ge=1, le=5000, description="조회할 최대 변경 수"),
+    db: Session = Depends(get_db),
+):
+    """
+    since 이후 변경된 백업 상태를 조회합니다. (변경분 동기화)
+
+    생성/수정된 항목은 items로, 삭제된 항목은 deleted_ids(tombstone)로 반환합니다.
+    (updated_at, id) 순으로 limit개씩 반환하며, has_more가 true이면
+    next_since, next_since_id로 이어서 요청합니다.
+    커밋 지연으로 인한 누락을 막기 위해 커서를 최근 몇 초 전으로 되돌려 둘 수 있으므로
+    같은 항목이 다시 올 수 있습니다. 클라이언트는 ID 기준으로 덮어써야 합니다.
+
+    since가 삭제 항목 보존 기간보다 오래되었으면 resync_required가 true이며,
+    이 경우 전체 목록을 다시 조회한 뒤 next_since부터 이어서 동기화합니다.
+
+    - **since**: 마지막 동기화 시점 (최초 동기화 시 전체 조회 직전 시각)
+    - **since_id**: 마지막 동기화 ID
+    - **limit**: 조회할 최대 변경 수
+    """
+    now = datetime.utcnow()
+    safe_since = now - CHANGES_SAFETY_WINDOW
+    since = to_naive_utc(since)
+
+    # 보존 기간이 지난 삭제 항목은 아카이브되어 tombstone을 보낼 수 없음
+    if since < now - timedelta(days=settings.backup_archive_retention_days):
+        return BackupStatusChangesResponse(
+            next_since=safe_since,
+            next_since_id=0,
+            has_more=False,
+            resync_required=True,
+        )
+
+    rows = (
+        query_backup_list(db)
+        .filter(
+            or_(
+                BackupStatus.updated_at > since,
+                and_(BackupStatus.updated_at == since, BackupStatus.id > since_id),
             )
         )
+        .order_by(BackupStatus.updated_at, BackupStatus.id)
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_since, next_since_id = since, since_id
+    if rows:
+        next_since, next_since_id = rows[-1][0].updated_at, rows[-1][0].id
+    if not has_more and next_since > safe_since:
+        next_since, next_since_id = safe_since, 0
+
+    live_rows = [row for row in rows if not row[0].deleted]
+    return BackupStatusChangesResponse(
+        items=build_backup_list_responses(db, live_rows),
+        deleted_ids=[row[0].id for row in rows if row[0].deleted],
+        next_since=next_since,
+        next_since_id=next_since_id,
+        has_more=has_more,
+    )
 
-    return response_list
+
+# 스트림 유지용 keep-alive 주석 전송 간격 (초)
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+@router.get("/stream")
+async def stream_backup_status_events(
+    last_event_id: Optional[int] = Header(
+        None, description="마지막으로 받은 이벤트 ID (재연결 시 자동 전송)"
+    ),
+):
+    """
+    백업 상태 변경 이벤트를 Server-Sent Events로 전달합니다.
+
+    생성(created), 수정(updated), 완료 표시(completed), 삭제(deleted) 이벤트가
+    커밋되는 즉시 전달되므로, 목록을 주기적으로 다시 조회할 필요가 없습니다.
+    이벤트를 놓쳐 이어받을 수 없는 경우 resync 이벤트를 보내며,
+    이때 클라이언트는 목록을 다시 조회해야 합니다.
+    (서버가 재시작되면 이벤트 ID가 다시 시작되므로 이전 ID로 재연결해도 resync)
+
+    - **Last-Event-ID**: 재연결 시 마지막으로 받은 이벤트 ID
+    """
+
+    async def event_stream():
+        async with backup_status_broadcaster.subscribe(last_event_id) as queue:
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=STREAM_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    # 서버 종료
+                    break
+                yield event.to_sse()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{backup_id}", response_model=BackupStatusResponse)
@@ -188,6 +646,34 @@ def get_backup_status(backup_id: int, db: Session = Depends(get_db)):
     return backup
 
 
+@router.get("/{backup_id}/history", response_model=List[BackupStatusHistoryResponse])
+def get_backup_status_history(
+    backup_id: int,
+    skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
+    limit: int = Query(100, ge=1, le=1000, description="반환할 최대 항목 수"),
+    db: Session = Depends(get_db),
+):
+    """
+    백업 상태의 변경 이력을 최신순으로 조회합니다.
+
+    이력은 백그라운드에서 일괄 기록되므로 방금 변경한 내용은
+    AUDIT_FLUSH_INTERVAL_MS(기본 1초) 정도 늦게 나타날 수 있습니다.
+    삭제/아카이브된 항목의 이력도 조회할 수 있습니다.
+
+    - **backup_id**: 백업 상태의 ID
+    - **skip**: 건너뛸 항목 수 (페이지네이션)
+    - **limit**: 반환할 최대 항목 수
+    """
+    return (
+        db.query(BackupStatusHistory)
+        .filter(BackupStatusHistory.backup_status_id == backup_id)
+        .order_by(desc(BackupStatusHistory.changed_at), desc(BackupStatusHistory.id))
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
 @router.post(
     "", response_model=BackupStatusResponse, status_code=status.HTTP_201_CREATED
 )
@@ -215,6 +701,16 @@ def create_backup_status(
         sync_producers(db, backup.id, backup_data.user_ids, backup_data.created_by)
         db.commit()
 
+    audit_recorder.record(
+        [
+            HistoryEntry(
+                backup_status_id=backup.id,
+                action=ACTION_CREATED,
+                changed_by=backup_data.created_by,
+            )
+        ]
+    )
+    publish_backup_event(EVENT_CREATED, backup)
     return backup
 
 
@@ -247,7 +743,9 @@ def update_backup_status(
     update_data = backup_data.model_dump(
         exclude_unset=True, exclude={"user_ids", "updated_by"}
     )
+    field_changes = []
     for field, value in update_data.items():
+        field_changes.append((field, getattr(backup, field), value))
         setattr(backup, field, value)
 
     # 작업자(producers) 매핑 갱신
@@ -257,10 +755,25 @@ def update_backup_status(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="user_ids 변경 시 updated_by는 필수입니다.",
             )
+        old_user_ids = [
+            user_id
+            for (user_id,) in db.query(MUserBackupStatus.user_id)
+            .filter(MUserBackupStatus.backup_status_id == backup_id)
+            .order_by(MUserBackupStatus.user_id)
+        ]
+        field_changes.append(("producers", old_user_ids, sorted(backup_data.user_ids)))
         sync_producers(db, backup_id, backup_data.user_ids, backup_data.updated_by)
+        # 매핑만 바뀐 경우에도 변경분 동기화에 포함되도록 수정 일시 갱신
+        backup.updated_at = datetime.utcnow()
 
     db.commit()
     db.refresh(backup)
+    audit_recorder.record(
+        field_change_entries(
+            backup_id, ACTION_UPDATED, field_changes, backup_data.updated_by
+        )
+    )
+    publish_backup_event(EVENT_UPDATED, backup)
     return backup
 
 
@@ -291,7 +804,33 @@ def mark_backup_complete(
     - **clean_checker**: 정리본 확인자 ID
     - **final_product**: 최종 산출물 백업 완료 여부
     - **final_product_checker**: 최종 산출물 확인자 ID
+
+    MARK_COMPLETE_COALESCING이 켜져 있으면 동시에 들어온 요청을 모아
+    하나의 트랜잭션으로 반영합니다. (응답은 요청별로 동일하게 반환)
     """
+    changes = {
+        "cam": cam,
+        "cam_checker": cam_checker,
+        "master": master,
+        "master_checker": master_checker,
+        "clean": clean,
+        "clean_checker": clean_checker,
+        "final_product": final_product,
+        "final_product_checker": final_product_checker,
+    }
+
+    # 병합 모드: 짧은 시간 동안 모인 요청을 하나의 트랜잭션으로 반영
+    if settings.mark_complete_coalescing and mark_complete_coalescer.running:
+        try:
+            result = mark_complete_coalescer.submit(backup_id, changes).result()
+        except BackupStatusNotFoundError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"ID {backup_id}인 백업 상태를 찾을 수 없습니다.",
+            )
+        publish_backup_event(EVENT_COMPLETED, result)
+        return result
+
     backup = (
         db.query(BackupStatus)
         .filter(BackupStatus.id == backup_id, BackupStatus.deleted == False)
@@ -303,25 +842,12 @@ def mark_backup_complete(
             detail=f"ID {backup_id}인 백업 상태를 찾을 수 없습니다.",
         )
 
-    if cam is not None:
-        backup.cam = cam
-    if cam_checker is not None:
-        backup.cam_checker = cam_checker
-    if master is not None:
-        backup.master = master
-    if master_checker is not None:
-        backup.master_checker = master_checker
-    if clean is not None:
-        backup.clean = clean
-    if clean_checker is not None:
-        backup.clean_checker = clean_checker
-    if final_product is not None:
-        backup.final_product = final_product
-    if final_product_checker is not None:
-        backup.final_product_checker = final_product_checker
+    diffs = apply_stage_changes(backup, changes)
 
     db.commit()
     db.refresh(backup)
+    audit_recorder.record(stage_change_entries(backup_id, diffs, changes))
+    publish_backup_event(EVENT_COMPLETED, backup)
     return backup
 
 
@@ -351,5 +877,55 @@ def delete_backup_status(
     # 소프트 삭제 처리
     backup.deleted = True
     backup.deleted_by = deleted_by
+    backup.deleted_at = datetime.utcnow()
 
     db.commit()
+    audit_recorder.record(
+        [
+            HistoryEntry(
+                backup_status_id=backup_id,
+                action=ACTION_DELETED,
+                changed_by=deleted_by,
+            )
+        ]
+    )
+    publish_backup_event(EVENT_DELETED, backup)
+
+
+@router.post("/{backup_id}/restore", response_model=BackupStatusResponse)
+def restore_backup_status(backup_id: int, db: Session = Depends(get_db)):
+    """
+    삭제된 백업 상태 항목을 복원합니다.
+
+    소프트 삭제 상태인 항목은 삭제 표시만 해제하고,
+    이미 아카이브된 항목은 작업자 매핑과 함께 운영 테이블로 되돌립니다.
+
+    - **backup_id**: 복원할 백업 상태의 ID
+    """
+    backup = db.query(BackupStatus).filter(BackupStatus.id == backup_id).first()
+    if backup and not backup.deleted:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"ID {backup_id}인 백업 상태는 삭제되지 않았습니다.",
+        )
+
+    if not backup:
+        if not restore_archived_backup(db, backup_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"ID {backup_id}인 백업 상태를 찾을 수 없습니다.",
+            )
+        backup = db.get(BackupStatus, backup_id)
+
+    backup.deleted = False
+    backup.deleted_by = None
+    backup.deleted_at = None
+
+    db.commit()
+    db.refresh(backup)
+    audit_recorder.record(
+        [HistoryEntry(backup_status_id=backup_id, action=ACTION_RESTORED)]
+    )
+    # 클라이언트 입장에서는 목록에 다시 나타나는 항목이므로 생성 이벤트로 전달
+    publish_backup_event(EVENT_CREATED, backup)
+    return backup
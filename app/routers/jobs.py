@@ -0,0 +1,171 @@
+"""
+백그라운드 작업 API 라우터
+
+오래 걸리는 내보내기/아카이브 작업의 등록, 상태 조회, 결과 다운로드 엔드포인트를 제공합니다.
+"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+from pydantic import ValidationError
+from sqlalchemy import desc
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models.job import Job
+from schemas.job import JobCreate, JobResponse
+from services.job_types import JOB_TYPES, job_runner
+from services.jobs import JOB_QUEUED, JOB_SUCCEEDED
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["Jobs"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+def to_job_response(job: Job) -> JobResponse:
+    """
+    작업 모델을 응답 스키마로 변환합니다.
+
+    Args:
+        job: 작업 객체
+
+    Returns:
+        JobResponse: 결과 파일 존재 여부를 포함한 응답
+    """
+    response = JobResponse.model_validate(job)
+    response.has_result_file = job.status == JOB_SUCCEEDED and bool(job.result_path)
+    return response
+
+
+def get_job_or_404(db: Session, job_id: int) -> Job:
+    """
+    작업을 조회하고, 없으면 404 예외를 발생시킵니다.
+
+    Args:
+        db: 데이터베이스 세션
+        job_id: 작업 ID
+
+    Returns:
+        Job: 작업 객체
+    """
+    job = db.get(Job, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID {job_id}인 작업을 찾을 수 없습니다.",
+        )
+    return job
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_job(job_data: JobCreate, db: Session = Depends(get_db)):
+    """
+    백그라운드 작업을 등록합니다.
+
+    작업은 대기 상태로 저장되며, 워커가 순서대로 실행합니다.
+    진행 상태는 GET /jobs/{job_id}로 확인합니다.
+
+    - **job_type**: 작업 종류
+        - backup_status_export: 백업 상태 내보내기 (params: format=csv|ndjson)
+        - backup_summary: 이벤트별 진행 요약 재집계 (params: format=csv|ndjson)
+        - storage_catalog_export: 저장소 카탈로그 내보내기 (params: format=csv|ndjson)
+        - backup_archive: 삭제 항목 아카이브 (params: retention_days, batch_size)
+    - **params**: 작업 파라미터
+    - **created_by**: 요청한 사용자 ID
+    """
+    job_type = JOB_TYPES.get(job_data.job_type)
+    if job_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"알 수 없는 작업 종류입니다: {job_data.job_type} "
+                f"(허용: {', '.join(JOB_TYPES)})"
+            ),
+        )
+
+    try:
+        params = job_type.params_model.model_validate(job_data.params)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False),
+        )
+
+    job = Job(
+        job_type=job_data.job_type,
+        params=params.model_dump(mode="json"),
+        status=JOB_QUEUED,
+        created_by=job_data.created_by,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return to_job_response(job)
+
+
+@router.get("", response_model=List[JobResponse])
+def get_jobs(
+    skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
+    limit: int = Query(50, ge=1, le=500, description="조회할 항목 수"),
+    job_status: Optional[str] = Query(
+        None,
+        alias="status",
+        description="상태 필터 (queued, running, succeeded, failed)",
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    작업 목록을 최신순으로 조회합니다.
+
+    - **skip**: 페이지네이션을 위한 건너뛸 항목 수
+    - **limit**: 조회할 최대 항목 수
+    - **status**: 상태로 필터링
+    """
+    query = db.query(Job)
+    if job_status:
+        query = query.filter(Job.status == job_status)
+    jobs = query.order_by(desc(Job.id)).offset(skip).limit(limit).all()
+    return [to_job_response(job) for job in jobs]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: int, db: Session = Depends(get_db)):
+    """
+    작업 상태와 진행률을 조회합니다.
+
+    - **job_id**: 작업 ID
+    """
+    return to_job_response(get_job_or_404(db, job_id))
+
+
+@router.get("/{job_id}/download")
+def download_job_result(job_id: int, db: Session = Depends(get_db)):
+    """
+    완료된 작업의 결과 파일을 다운로드합니다.
+
+    작업이 아직 끝나지 않았거나 결과 파일이 없는 작업이면 409를 반환합니다.
+
+    - **job_id**: 작업 ID
+    """
+    job = get_job_or_404(db, job_id)
+    if job.status != JOB_SUCCEEDED or not job.result_path:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"ID {job_id}인 작업의 결과 파일이 없습니다. (상태: {job.status})",
+        )
+    # 워커가 다른 프로세스/컨테이너여도 같은 JOB_RESULT_DIR 저장소를 사용해야 함
+    result_path = job_runner.resolve_result_path(job.result_path)
+    if not result_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=f"ID {job_id}인 작업의 결과 파일이 삭제되었습니다.",
+        )
+
+    return FileResponse(
+        result_path,
+        media_type=job.result_media_type,
+        filename=job.result_filename,
+    )
@@ -4,18 +4,62 @@
 저장소 카탈로그 CRUD 엔드포인트를 제공합니다.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from pydantic import ValidationError
+from sqlalchemy import (
+    case,
+    column,
+    desc,
+    func,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Query as SAQuery
 from sqlalchemy.orm import Session
 
 from database import get_db
-from models.storage_catalog import StorageCatalog
+from dependencies import FieldSelector
+from models.storage_catalog import NATURAL_KEY, StorageCatalog
 from schemas.storage_catalog import (
+    FacetCount,
+    StorageCatalogBulkUpsertRequest,
+    StorageCatalogBulkUpsertResponse,
     StorageCatalogCreate,
+    StorageCatalogFacetsResponse,
+    StorageCatalogImportError,
+    StorageCatalogImportResponse,
     StorageCatalogResponse,
+    StorageCatalogTreeResponse,
     StorageCatalogUpdate,
 )
+from services.cache import storage_catalog_facet_cache
+from services.catalog_tree import storage_catalog_tree
+from services.response_formats import negotiate_list_response
+from services.catalog_import import (
+    IMPORT_FORMATS,
+    ImportRowError,
+    detect_import_format,
+    iter_import_rows,
+)
 
 router = APIRouter(
     prefix="/storage-catalogs",
@@ -24,25 +68,148 @@ router = APIRouter(
 )
 
 
+# n-gram 전문 검색 최소 토큰 길이 (MySQL ngram_token_size 기본값)
+NGRAM_TOKEN_SIZE = 2
+
+# MySQL BOOLEAN MODE에서 연산자로 해석되는 문자
+FULLTEXT_OPERATOR_CHARS = '+-<>()~*"@'
+
+# SQLite FTS5 trigram 토크나이저의 최소 검색어 길이
+TRIGRAM_TOKEN_SIZE = 3
+
+# SQLite FTS5 검색 테이블 (models.storage_catalog에서 생성)
+storage_catalog_fts = table("storage_catalog_fts", column("rowid"), column("rank"))
+
+
+def build_boolean_query(q: str) -> str:
+    """
+    검색어를 MySQL BOOLEAN MODE 검색식으로 변환합니다.
+
+    연산자 문자를 제거한 뒤 공백으로 나눈 각 단어를 필수(+) 조건으로 만듭니다.
+    ngram 파서는 각 단어를 n-gram 구문 검색으로 처리하므로 부분 문자열 검색이 됩니다.
+
+    Args:
+        q: 사용자 검색어
+
+    Returns:
+        str: BOOLEAN MODE 검색식 (유효한 단어가 없으면 빈 문자열)
+    """
+    cleaned = q.translate({ord(ch): " " for ch in FULLTEXT_OPERATOR_CHARS})
+    terms = [term for term in cleaned.split() if len(term) >= NGRAM_TOKEN_SIZE]
+    return " ".join(f"+{term}" for term in terms)
+
+
+def build_fts5_query(q: str) -> str:
+    """
+    검색어를 SQLite FTS5 검색식으로 변환합니다.
+
+    각 단어를 큰따옴표로 감싼 문자열로 만들어 모든 단어를 포함하는 행을 찾습니다.
+    trigram 토크나이저는 3자 미만의 단어를 찾을 수 없으므로,
+    그런 단어가 있으면 빈 문자열을 반환하여 LIKE 검색으로 대체하도록 합니다.
+
+    Args:
+        q: 사용자 검색어
+
+    Returns:
+        str: FTS5 검색식 (FTS5로 처리할 수 없으면 빈 문자열)
+    """
+    terms = q.split()
+    if not terms or any(len(term) < TRIGRAM_TOKEN_SIZE for term in terms):
+        return ""
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+@lru_cache()
+def has_storage_catalog_fts(bind) -> bool:
+    """SQLite DB에 FTS5 검색 테이블이 있는지 확인합니다. (엔진별로 한 번만 조회)"""
+    return inspect(bind).has_table("storage_catalog_fts")
+
+
+def apply_catalog_search(query: SAQuery, db: Session, q: str) -> SAQuery:
+    """
+    활동명/설명 검색 조건과 관련도 정렬을 쿼리에 적용합니다.
+
+    MySQL에서는 ngram FULLTEXT 인덱스(MATCH ... AGAINST)를,
+    SQLite에서는 FTS5 trigram 인덱스를 사용하고(bm25 관련도 순),
+    그 외 DB나 인덱스로 처리할 수 없는 짧은 검색어는 LIKE 검색으로 대체합니다.
+
+    Args:
+        query: 저장소 카탈로그 쿼리
+        db: 데이터베이스 세션
+        q: 사용자 검색어
+
+    Returns:
+        Query: 검색 조건과 관련도 정렬이 적용된 쿼리
+    """
+    boolean_query = build_boolean_query(q)
+
+    if db.get_bind().dialect.name == "mysql" and boolean_query:
+        relevance = match(
+            StorageCatalog.activity_name,
+            StorageCatalog.description,
+            against=boolean_query,
+        ).in_boolean_mode()
+        return query.filter(relevance > 0).order_by(desc(relevance), StorageCatalog.id)
+
+    fts_query = build_fts5_query(q)
+    bind = db.get_bind()
+    if bind.dialect.name == "sqlite" and fts_query and has_storage_catalog_fts(bind):
+        matches = (
+            select(storage_catalog_fts.c.rowid, storage_catalog_fts.c.rank)
+            .where(literal_column("storage_catalog_fts").op("MATCH")(fts_query))
+            .subquery()
+        )
+        return query.join(matches, matches.c.rowid == StorageCatalog.id).order_by(
+            matches.c.rank, StorageCatalog.id
+        )
+
+    # LIKE 대체 검색: 활동명 일치를 설명 일치보다 우선 정렬
+    term = q.strip()
+    name_matches = StorageCatalog.activity_name.contains(term, autoescape=True)
+    return query.filter(
+        or_(name_matches, StorageCatalog.description.contains(term, autoescape=True))
+    ).order_by(case((name_matches, 0), else_=1), StorageCatalog.id)
+
+
+# 목록 조회 시 선택 가능한 필드
+catalog_list_fields = FieldSelector(StorageCatalogResponse.model_fields)
+
+
 @router.get("", response_model=List[StorageCatalogResponse])
 def get_storage_catalogs(
+    request: Request,
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(100, ge=1, le=10000, description="조회할 항목 수"),
     storage: Optional[str] = Query(None, description="저장소 필터"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     year: Optional[int] = Query(None, description="연도 필터"),
+    q: Optional[str] = Query(
+        None, min_length=1, max_length=250, description="활동명/설명 검색어"
+    ),
+    fields: Optional[List[str]] = Depends(catalog_list_fields),
     db: Session = Depends(get_db),
 ):
     """
     저장소 카탈로그 목록을 조회합니다.
 
+    검색어(q)가 주어지면 활동명과 설명을 전문 검색하여 관련도순으로 정렬합니다.
+    fields가 주어지면 해당 컬럼만 조회하여 반환합니다.
+
     - **skip**: 페이지네이션을 위한 건너뛸 항목 수
     - **limit**: 조회할 최대 항목 수
     - **storage**: 저장소 이름으로 필터링
     - **category**: 카테고리로 필터링
     - **year**: 연도로 필터링
+    - **q**: 활동명/설명 검색어
+    - **fields**: 응답에 포함할 필드 (쉼표 구분, 예: id,activity_name)
+
+    Accept 헤더로 응답 형식을 선택할 수 있습니다.
+    (application/json, application/vnd.ym.columnar+json, application/msgpack)
     """
-    query = db.query(StorageCatalog)
+    if fields:
+        query = db.query(*[getattr(StorageCatalog, field) for field in fields])
+    else:
+        query = db.query(StorageCatalog)
 
     if storage:
         query = query.filter(StorageCatalog.storage == storage)
@@ -50,8 +217,131 @@ def get_storage_catalogs(
         query = query.filter(StorageCatalog.category == category)
     if year:
         query = query.filter(StorageCatalog.year == year)
+    if q and q.strip():
+        query = apply_catalog_search(query, db, q)
+
+    results = query.offset(skip).limit(limit).all()
+
+    # Accept 헤더에 따라 인코딩/압축
+    if fields:
+        items = [dict(row._mapping) for row in results]
+    else:
+        items = [StorageCatalogResponse.model_validate(row) for row in results]
+    return negotiate_list_response(request, items)
+
+
+# facet으로 집계하는 컬럼 (응답 필드명 -> 모델 컬럼)
+FACET_COLUMNS = {
+    "storage": StorageCatalog.storage,
+    "category": StorageCatalog.category,
+    "year": StorageCatalog.year,
+    "month": StorageCatalog.month,
+}
+
+
+def count_facet(db: Session, facet: str, filters: Dict[str, Any]) -> List[FacetCount]:
+    """
+    하나의 facet 컬럼에 대해 고유 값별 항목 수를 집계합니다.
+
+    자기 자신의 필터는 제외하고 나머지 필터만 적용하여,
+    현재 선택된 값 외의 다른 선택지도 함께 표시될 수 있도록 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        facet: 집계할 facet 이름 (FACET_COLUMNS의 키)
+        filters: 현재 적용된 필터 (facet 이름 -> 값)
+
+    Returns:
+        List[FacetCount]: 값 기준 오름차순으로 정렬된 facet 개수 리스트
+    """
+    column = FACET_COLUMNS[facet]
+    query = db.query(column, func.count().label("count"))
+
+    for name, value in filters.items():
+        if name != facet and value is not None:
+            query = query.filter(FACET_COLUMNS[name] == value)
+
+    results = query.group_by(column).order_by(column).all()
+    return [FacetCount(value=row[0], count=row.count) for row in results]
+
 
-    return query.offset(skip).limit(limit).all()
+@router.get("/facets", response_model=StorageCatalogFacetsResponse)
+def get_storage_catalog_facets(
+    storage: Optional[str] = Query(None, description="저장소 필터"),
+    category: Optional[str] = Query(None, description="카테고리 필터"),
+    year: Optional[int] = Query(None, description="연도 필터"),
+    month: Optional[int] = Query(None, description="월 필터"),
+    db: Session = Depends(get_db),
+):
+    """
+    저장소 카탈로그 필터용 facet 집계를 조회합니다.
+
+    storage, category, year, month 각각의 고유 값과 항목 수를 반환합니다.
+    각 facet은 자신을 제외한 나머지 필터로 좁혀진 결과를 집계합니다.
+    결과는 다음 카탈로그 쓰기 작업 전까지 캐시됩니다.
+
+    - **storage**: 저장소 이름으로 필터링
+    - **category**: 카테고리로 필터링
+    - **year**: 연도로 필터링
+    - **month**: 월로 필터링
+    """
+    filters = {"storage": storage, "category": category, "year": year, "month": month}
+    cache_key = tuple(sorted(filters.items()))
+
+    return storage_catalog_facet_cache.get_or_compute(
+        cache_key,
+        lambda: StorageCatalogFacetsResponse(
+            **{facet: count_facet(db, facet, filters) for facet in FACET_COLUMNS}
+        ),
+    )
+
+
+@router.get("/tree", response_model=StorageCatalogTreeResponse)
+def get_storage_catalog_tree(
+    storage: Optional[str] = Query(None, description="저장소 (지정 시 연도 목록)"),
+    year: Optional[int] = Query(
+        None, ge=0, le=2100, description="연도 (지정 시 월 목록, 0이면 연도 미지정)"
+    ),
+    month: Optional[int] = Query(
+        None, ge=0, le=12, description="월 (지정 시 활동 목록, 0이면 월 미지정)"
+    ),
+    skip: int = Query(0, ge=0, description="건너뛸 자식 수"),
+    limit: int = Query(100, ge=1, le=1000, description="조회할 자식 수"),
+):
+    """
+    저장소 → 연도 → 월 → 활동 탐색 트리의 노드 하나를 조회합니다.
+
+    지정한 경로의 노드와 카탈로그 수, 자식 한 페이지(자식별 카탈로그 수 포함)를 반환합니다.
+    아무것도 지정하지 않으면 저장소 목록을 반환합니다.
+    트리는 첫 조회 시 메모리에 구성되고 카탈로그 쓰기 시 해당 항목만 반영됩니다.
+
+    - **storage**: 저장소
+    - **year**: 연도 (storage 필요, 0이면 연도 미지정)
+    - **month**: 월 (year 필요, 0이면 월 미지정)
+    - **skip**: 건너뛸 자식 수
+    - **limit**: 조회할 자식 수
+    """
+    if (year is not None and storage is None) or (month is not None and year is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="year는 storage와, month는 year와 함께 지정해야 합니다.",
+        )
+
+    # 연도/월 0은 미지정(NULL) 노드
+    path = ()
+    if storage is not None:
+        path += (storage,)
+    if year is not None:
+        path += (year or None,)
+    if month is not None:
+        path += (month or None,)
+    node = storage_catalog_tree.get_subtree(path, skip, limit)
+    if node is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 경로의 카탈로그가 없습니다.",
+        )
+    return StorageCatalogTreeResponse(**node)
 
 
 @router.get("/{catalog_id}", response_model=StorageCatalogResponse)
@@ -83,11 +373,220 @@ def create_storage_catalog(
     """
     catalog = StorageCatalog(**catalog_data.model_dump())
     db.add(catalog)
-    db.commit()
+    commit_catalog(db)
     db.refresh(catalog)
+    storage_catalog_facet_cache.invalidate()
+    storage_catalog_tree.upsert(catalog)
+    return catalog
+
+
+def commit_catalog(db: Session) -> None:
+    """
+    카탈로그 변경을 커밋합니다.
+
+    자연 키(저장소, 카테고리, 연도, 월, 활동명)가 같은 항목이 이미 있으면
+    롤백하고 409를 반환합니다.
+    """
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="저장소, 카테고리, 연도, 월, 활동명이 같은 카탈로그가 이미 있습니다.",
+        )
+
+
+def build_catalog_upsert(bind):
+    """
+    자연 키가 같은 항목이 있으면 설명을 갱신하는 카탈로그 INSERT 문을 만듭니다.
+
+    - MySQL: INSERT ... ON DUPLICATE KEY UPDATE
+      (갱신된 행의 ID를 LAST_INSERT_ID로 돌려받아 lastrowid로 확인)
+    - SQLite: INSERT ... ON CONFLICT (자연 키) DO UPDATE
+
+    Args:
+        bind: 실행할 엔진/연결
+
+    Returns:
+        카탈로그 업서트 문 (values 또는 파라미터 리스트와 함께 실행)
+    """
+    if bind.dialect.name == "mysql":
+        statement = mysql_insert(StorageCatalog)
+        return statement.on_duplicate_key_update(
+            id=func.last_insert_id(StorageCatalog.id),
+            description=statement.inserted.description,
+        )
+    statement = sqlite_insert(StorageCatalog)
+    return statement.on_conflict_do_update(
+        index_elements=list(NATURAL_KEY),
+        set_={"description": statement.excluded.description},
+    )
+
+
+@router.put("/upsert", response_model=StorageCatalogResponse)
+def upsert_storage_catalog(
+    catalog_data: StorageCatalogCreate, db: Session = Depends(get_db)
+):
+    """
+    저장소 카탈로그 항목을 업서트합니다.
+
+    자연 키(저장소, 카테고리, 연도, 월, 활동명)가 같은 항목이 있으면 설명을 갱신하고,
+    없으면 생성합니다. 기존 항목을 조회하지 않고 한 문장으로 처리합니다.
+
+    - **catalog_data**: 업서트할 카탈로그 데이터
+    """
+    data = catalog_data.model_dump()
+    bind = db.get_bind()
+    statement = build_catalog_upsert(bind).values(**data)
+    if bind.dialect.name == "mysql":
+        catalog_id = db.execute(statement).lastrowid
+    else:
+        catalog_id = db.execute(statement.returning(StorageCatalog.id)).scalar_one()
+    db.commit()
+
+    catalog = StorageCatalog(id=catalog_id, **data)
+    storage_catalog_facet_cache.invalidate()
+    storage_catalog_tree.upsert(catalog)
     return catalog
 
 
+@router.put("/bulk-upsert", response_model=StorageCatalogBulkUpsertResponse)
+def bulk_upsert_storage_catalogs(
+    request: StorageCatalogBulkUpsertRequest, db: Session = Depends(get_db)
+):
+    """
+    저장소 카탈로그 항목을 일괄 업서트합니다.
+
+    자연 키가 같은 항목은 설명을 갱신하고, 없는 항목은 생성합니다.
+    요청 전체를 조회 없이 하나의 INSERT 문과 트랜잭션으로 처리하므로
+    같은 목록을 다시 보내도 항목이 중복되지 않습니다.
+
+    - **items**: 업서트할 카탈로그 리스트 (최대 5000개)
+    """
+    db.execute(
+        build_catalog_upsert(db.get_bind()),
+        [item.model_dump() for item in request.items],
+    )
+    db.commit()
+
+    storage_catalog_facet_cache.invalidate()
+    # 갱신/생성된 항목의 ID를 알 수 없으므로 트리를 다시 구성
+    storage_catalog_tree.invalidate()
+    return StorageCatalogBulkUpsertResponse(upserted=len(request.items))
+
+
+# 일괄 가져오기 응답에 포함할 최대 오류 수
+MAX_IMPORT_ERRORS = 1000
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """
+    Pydantic 검증 오류를 한 줄 메시지로 변환합니다.
+
+    Args:
+        error: 검증 오류
+
+    Returns:
+        str: '필드: 메시지' 형식을 ';'로 이은 문자열
+    """
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+@router.post("/import", response_model=StorageCatalogImportResponse)
+def import_storage_catalogs(
+    file: UploadFile = File(..., description="CSV 또는 NDJSON 파일"),
+    format: Optional[str] = Query(
+        None,
+        pattern=f"^({'|'.join(IMPORT_FORMATS)})$",
+        description="파일 형식 (미지정 시 파일명/Content-Type으로 판별)",
+    ),
+    dry_run: bool = Query(False, description="저장하지 않고 검증만 수행"),
+    batch_size: int = Query(500, ge=1, le=5000, description="트랜잭션당 저장할 행 수"),
+    db: Session = Depends(get_db),
+):
+    """
+    CSV 또는 NDJSON 파일로 저장소 카탈로그를 일괄 생성합니다.
+
+    파일을 한 줄씩 읽어 StorageCatalogCreate로 검증하고,
+    batch_size 단위로 묶어 하나의 업서트 문과 트랜잭션으로 저장합니다.
+    자연 키가 같은 항목은 설명을 갱신하므로 같은 파일을 다시 가져와도 중복되지 않습니다.
+    실패한 줄은 건너뛰고 줄 번호와 사유를 함께 반환합니다.
+
+    - **file**: 업로드 파일 (CSV는 첫 줄이 헤더)
+    - **format**: 파일 형식 (csv, ndjson)
+    - **dry_run**: true이면 저장하지 않고 검증 결과만 반환
+    - **batch_size**: 트랜잭션당 저장할 행 수
+    """
+    fmt = format or detect_import_format(file.filename, file.content_type)
+    if fmt not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="파일 형식을 판별할 수 없습니다. format 파라미터를 지정해 주세요.",
+        )
+
+    result = StorageCatalogImportResponse(
+        dry_run=dry_run, total=0, inserted=0, failed=0
+    )
+
+    def add_error(line: int, message: str) -> None:
+        result.failed += 1
+        if len(result.errors) < MAX_IMPORT_ERRORS:
+            result.errors.append(StorageCatalogImportError(line=line, error=message))
+        else:
+            result.errors_truncated = True
+
+    committed = False
+
+    def flush(batch: List[tuple]) -> None:
+        nonlocal committed
+        if not dry_run:
+            try:
+                db.execute(
+                    build_catalog_upsert(db.get_bind()), [row for _, row in batch]
+                )
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                for line, _ in batch:
+                    add_error(line, f"저장 실패: {e.__class__.__name__}")
+                return
+            committed = True
+        result.inserted += len(batch)
+
+    try:
+        batch: List[tuple] = []
+        for line, row in iter_import_rows(file.file, fmt):
+            result.total += 1
+            if isinstance(row, ImportRowError):
+                add_error(line, str(row))
+                continue
+            try:
+                catalog_data = StorageCatalogCreate.model_validate(row)
+            except ValidationError as e:
+                add_error(line, format_validation_error(e))
+                continue
+
+            batch.append((line, catalog_data.model_dump()))
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+
+        if batch:
+            flush(batch)
+    finally:
+        # 중간에 실패해도 이미 커밋된 배치가 있으면 캐시를 비움
+        if committed:
+            storage_catalog_facet_cache.invalidate()
+            # 일괄 삽입은 생성된 ID를 알 수 없으므로 트리를 다시 구성
+            storage_catalog_tree.invalidate()
+
+    return result
+
+
 @router.put("/{catalog_id}", response_model=StorageCatalogResponse)
 def update_storage_catalog(
     catalog_id: int, catalog_data: StorageCatalogUpdate, db: Session = Depends(get_db)
@@ -109,8 +608,10 @@ def update_storage_catalog(
     for field, value in update_data.items():
         setattr(catalog, field, value)
 
-    db.commit()
+    commit_catalog(db)
     db.refresh(catalog)
+    storage_catalog_facet_cache.invalidate()
+    storage_catalog_tree.upsert(catalog)
     return catalog
 
 
@@ -130,4 +631,6 @@ def delete_storage_catalog(catalog_id: int, db: Session = Depends(get_db)):
 
     db.delete(catalog)
     db.commit()
+    storage_catalog_facet_cache.invalidate()
+    storage_catalog_tree.remove(catalog_id)
     return None
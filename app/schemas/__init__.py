@@ -5,20 +5,32 @@ API 요청/응답 유효성 검사를 위한 스키마를 관리합니다.
 """
 
 from schemas.backup_status import (
+    BackupStatusBatchGetRequest,
+    BackupStatusBatchGetResponse,
+    BackupStatusChangesResponse,
     BackupStatusCreate,
+    BackupStatusHistoryResponse,
     BackupStatusListResponse,
     BackupStatusResponse,
     BackupStatusUpdate,
 )
+from schemas.job import JobCreate, JobResponse
 from schemas.storage_catalog import (
+    FacetCount,
     StorageCatalogCreate,
+    StorageCatalogFacetsResponse,
+    StorageCatalogImportError,
+    StorageCatalogImportResponse,
     StorageCatalogResponse,
     StorageCatalogUpdate,
 )
 from schemas.user import (
     LoginRequest,
+    UserCheckedCounts,
+    UserProducedCounts,
     UserResponse,
     UserSimpleResponse,
+    UserWorkloadStatsResponse,
 )
 
 __all__ = [
@@ -26,13 +38,27 @@ __all__ = [
     "StorageCatalogCreate",
     "StorageCatalogUpdate",
     "StorageCatalogResponse",
+    "StorageCatalogFacetsResponse",
+    "FacetCount",
+    "StorageCatalogImportError",
+    "StorageCatalogImportResponse",
     # Backup Status
     "BackupStatusCreate",
     "BackupStatusUpdate",
     "BackupStatusResponse",
     "BackupStatusListResponse",
+    "BackupStatusChangesResponse",
+    "BackupStatusBatchGetRequest",
+    "BackupStatusBatchGetResponse",
+    "BackupStatusHistoryResponse",
     # User
     "LoginRequest",
     "UserResponse",
     "UserSimpleResponse",
+    "UserProducedCounts",
+    "UserCheckedCounts",
+    "UserWorkloadStatsResponse",
+    # Job
+    "JobCreate",
+    "JobResponse",
 ]
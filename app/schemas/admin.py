@@ -0,0 +1,81 @@
+"""
+관리 API 스키마
+
+API 요청/응답을 위한 Pydantic 스키마 정의
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class RouteMemoryStatsResponse(BaseModel):
+    """
+    라우트별 요청 최대 할당량 스키마
+
+    요청 시작 시점 대비 요청 처리 중 최대 추적 메모리 증가량입니다.
+    (동시 요청이 있으면 다른 요청의 할당이 포함된 상한값)
+    """
+
+    route: str = Field(..., description="라우트 (METHOD 경로 템플릿)")
+    requests: int = Field(..., description="측정한 요청 수")
+    peak_max_bytes: int = Field(..., description="요청별 최대 할당량의 최댓값 (바이트)")
+    peak_avg_bytes: int = Field(..., description="요청별 최대 할당량의 평균 (바이트)")
+    last_peak_bytes: int = Field(..., description="마지막 요청의 최대 할당량 (바이트)")
+
+
+class MemoryProfileResponse(BaseModel):
+    """
+    메모리 프로파일링 상태 응답 스키마
+    """
+
+    enabled: bool = Field(..., description="프로파일링 중인지 여부")
+    frames: int = Field(..., description="할당마다 저장하는 호출 스택 깊이")
+    traced_current_bytes: int = Field(..., description="현재 추적 중인 할당량 (바이트)")
+    traced_peak_bytes: int = Field(
+        ..., description="마지막 초기화 이후 최대 추적 할당량 (바이트)"
+    )
+    tracemalloc_overhead_bytes: int = Field(
+        ..., description="추적 자체가 사용하는 메모리 (바이트)"
+    )
+    rss_bytes: Optional[int] = Field(
+        None, description="현재 프로세스 RSS (바이트, Linux 외에는 null)"
+    )
+    max_rss_bytes: int = Field(..., description="프로세스 시작 이후 최대 RSS (바이트)")
+    routes: List[RouteMemoryStatsResponse] = Field(
+        default_factory=list, description="라우트별 집계 (최대 할당량 큰 순서)"
+    )
+    identity_map_sessions: int = Field(
+        ..., description="객체를 보유한 ORM 세션 수 (프로파일링 중 시작된 세션만)"
+    )
+    identity_map_objects: int = Field(
+        ..., description="ORM 세션 identity map의 전체 객체 수"
+    )
+    identity_map_sizes: List[int] = Field(
+        default_factory=list, description="세션별 identity map 객체 수 (큰 순서)"
+    )
+
+
+class AllocationSiteResponse(BaseModel):
+    """
+    할당 위치 스키마
+    """
+
+    site: str = Field(..., description="할당 위치 (파일:줄 또는 파일)")
+    size_bytes: int = Field(..., description="살아 있는 할당량 (바이트)")
+    count: int = Field(..., description="살아 있는 할당 블록 수")
+    traceback: Optional[List[str]] = Field(
+        None, description="호출 스택 (group_by=traceback일 때, 가장 최근 호출부터)"
+    )
+
+
+class AllocationTopResponse(BaseModel):
+    """
+    할당 위치 상위 항목 응답 스키마
+    """
+
+    group_by: str = Field(..., description="묶은 기준 (lineno, filename, traceback)")
+    total_bytes: int = Field(..., description="집계된 전체 할당량 (바이트)")
+    sites: List[AllocationSiteResponse] = Field(
+        default_factory=list, description="할당량이 큰 위치 목록"
+    )
@@ -85,6 +85,7 @@ class BackupStatusResponse(BackupStatusBase):
 
     id: int = Field(..., description="고유 식별자")
     created_at: datetime = Field(..., description="생성 일시")
+    updated_at: Optional[datetime] = Field(None, description="수정 일시")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -120,4 +121,109 @@ class BackupStatusListResponse(BaseModel):
         None, description="최종 산출물 확인자 이름"
     )
     created_at: datetime = Field(..., description="생성 일시")
+    updated_at: Optional[datetime] = Field(None, description="수정 일시")
     producers: List[str] = Field(default_factory=list, description="작업자 이름 리스트")
+
+
+class BackupStatusChangesResponse(BaseModel):
+    """
+    백업 상태 변경분 응답 스키마
+
+    since 이후 변경된 항목과 삭제된 항목(tombstone) ID를 반환합니다.
+    다음 요청에는 next_since, next_since_id를 그대로 전달합니다.
+    """
+
+    items: List[BackupStatusListResponse] = Field(
+        default_factory=list, description="생성/수정된 항목"
+    )
+    deleted_ids: List[int] = Field(
+        default_factory=list, description="삭제된 항목 ID (tombstone)"
+    )
+    next_since: datetime = Field(..., description="다음 요청에 사용할 since")
+    next_since_id: int = Field(..., description="다음 요청에 사용할 since_id")
+    has_more: bool = Field(..., description="남은 변경분이 있는지 여부")
+    resync_required: bool = Field(
+        False, description="변경 이력 보존 기간이 지나 전체를 다시 조회해야 하는지 여부"
+    )
+
+
+class BackupStatusBatchGetRequest(BaseModel):
+    """
+    백업 상태 일괄 조회 요청 스키마
+
+    여러 ID의 백업 상태를 한 번에 조회할 때 사용됩니다.
+    """
+
+    ids: List[int] = Field(
+        ..., min_length=1, max_length=1000, description="조회할 백업 상태 ID 리스트"
+    )
+
+
+class BackupStatusBatchGetResponse(BaseModel):
+    """
+    백업 상태 일괄 조회 응답 스키마
+
+    요청 순서대로 찾은 항목과, 없거나 삭제된 ID를 반환합니다.
+    """
+
+    items: List[BackupStatusListResponse] = Field(
+        default_factory=list, description="조회된 항목 (요청 ID 순서)"
+    )
+    missing_ids: List[int] = Field(
+        default_factory=list, description="존재하지 않거나 삭제된 ID"
+    )
+
+
+class BackupStatusSummaryResponse(BaseModel):
+    """
+    백업 진행 요약 응답 스키마
+
+    항목 수, 단계별 완료 수, 표시 날짜 범위를 반환합니다.
+    """
+
+    item_count: int = Field(..., description="항목 수")
+    cam_count: int = Field(0, description="카메라 원본 백업 완료 수")
+    master_count: int = Field(0, description="마스터 파일 백업 완료 수")
+    clean_count: int = Field(0, description="정리본 백업 완료 수")
+    final_product_count: int = Field(0, description="최종 산출물 백업 완료 수")
+    fully_backed_up_count: int = Field(0, description="모든 단계 완료 수")
+    first_displayed_date: Optional[datetime] = Field(
+        None, description="가장 이른 표시 날짜"
+    )
+    last_displayed_date: Optional[datetime] = Field(
+        None, description="가장 늦은 표시 날짜"
+    )
+
+
+class BackupStatusEventResponse(BackupStatusSummaryResponse):
+    """
+    이벤트별 백업 진행 상태 응답 스키마
+
+    이벤트명으로 묶은 진행 요약과 항목 미리보기(최신순)를 반환합니다.
+    """
+
+    event_name: Optional[str] = Field(None, description="이벤트명 (없으면 null)")
+    items: List[BackupStatusListResponse] = Field(
+        default_factory=list, description="항목 미리보기 (표시 날짜 최신순)"
+    )
+
+
+class BackupStatusHistoryResponse(BaseModel):
+    """
+    백업 상태 변경 이력 응답 스키마
+
+    누가 언제 어떤 필드를 변경했는지 반환합니다.
+    """
+
+    id: int = Field(..., description="고유 식별자")
+    backup_status_id: int = Field(..., description="백업 상태 ID")
+    action: str = Field(
+        ..., description="작업 종류 (created, updated, completed, deleted, restored)"
+    )
+    field: Optional[str] = Field(None, description="변경된 필드명")
+    old_value: Optional[str] = Field(None, description="변경 전 값")
+    new_value: Optional[str] = Field(None, description="변경 후 값")
+    changed_by: Optional[int] = Field(None, description="변경한 사용자 ID")
+    changed_at: datetime = Field(..., description="변경 일시")
+
+    model_config = ConfigDict(from_attributes=True)
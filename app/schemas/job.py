@@ -0,0 +1,51 @@
+"""
+백그라운드 작업 스키마
+
+API 요청/응답을 위한 Pydantic 스키마 정의
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobCreate(BaseModel):
+    """
+    백그라운드 작업 생성 스키마
+
+    작업 종류와 종류별 파라미터를 전달합니다.
+    """
+
+    job_type: str = Field(
+        ...,
+        max_length=50,
+        description="작업 종류 (backup_status_export, backup_summary, storage_catalog_export, backup_archive)",
+    )
+    params: Dict[str, Any] = Field(default_factory=dict, description="작업 파라미터")
+    created_by: Optional[int] = Field(None, description="요청한 사용자 ID")
+
+
+class JobResponse(BaseModel):
+    """
+    백그라운드 작업 응답 스키마
+
+    작업 상태와 진행률을 반환합니다.
+    """
+
+    id: int = Field(..., description="고유 식별자")
+    job_type: str = Field(..., description="작업 종류")
+    params: Optional[Dict[str, Any]] = Field(None, description="작업 파라미터")
+    status: str = Field(..., description="상태 (queued, running, succeeded, failed)")
+    processed: int = Field(0, description="처리한 항목 수")
+    total: Optional[int] = Field(None, description="전체 항목 수")
+    attempts: int = Field(0, description="실행 시도 횟수")
+    result: Optional[Dict[str, Any]] = Field(None, description="작업 결과 요약")
+    has_result_file: bool = Field(False, description="다운로드할 결과 파일 존재 여부")
+    error: Optional[str] = Field(None, description="실패 사유")
+    created_by: Optional[int] = Field(None, description="요청한 사용자 ID")
+    created_at: datetime = Field(..., description="생성 일시")
+    started_at: Optional[datetime] = Field(None, description="실행 시작 일시")
+    finished_at: Optional[datetime] = Field(None, description="완료 일시")
+
+    model_config = ConfigDict(from_attributes=True)
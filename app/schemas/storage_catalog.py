@@ -4,7 +4,7 @@
 API 요청/응답을 위한 Pydantic 스키마 정의
 """
 
-from typing import Optional
+from typing import List, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -36,6 +36,27 @@ class StorageCatalogCreate(StorageCatalogBase):
     pass
 
 
+class StorageCatalogBulkUpsertRequest(BaseModel):
+    """
+    저장소 카탈로그 일괄 업서트 요청 스키마
+
+    자연 키(저장소, 카테고리, 연도, 월, 활동명)가 같은 항목이 있으면 설명을 갱신하고,
+    없으면 생성합니다.
+    """
+
+    items: List[StorageCatalogCreate] = Field(
+        ..., min_length=1, max_length=5000, description="업서트할 카탈로그 리스트"
+    )
+
+
+class StorageCatalogBulkUpsertResponse(BaseModel):
+    """
+    저장소 카탈로그 일괄 업서트 응답 스키마
+    """
+
+    upserted: int = Field(..., description="생성 또는 갱신한 항목 수")
+
+
 class StorageCatalogUpdate(BaseModel):
     """
     저장소 카탈로그 수정 스키마
@@ -62,3 +83,101 @@ class StorageCatalogResponse(StorageCatalogBase):
     id: int = Field(..., description="고유 식별자")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class FacetCount(BaseModel):
+    """
+    facet 값별 개수 스키마
+
+    필터 드롭다운에 표시할 고유 값과 해당 항목 수를 나타냅니다.
+    """
+
+    value: Optional[Union[int, str]] = Field(
+        None, description="고유 값 (미지정은 null)"
+    )
+    count: int = Field(..., description="항목 수")
+
+
+class StorageCatalogFacetsResponse(BaseModel):
+    """
+    저장소 카탈로그 facet 응답 스키마
+
+    필터 항목별 고유 값과 개수를 반환합니다.
+    """
+
+    storage: List[FacetCount] = Field(default_factory=list, description="저장소별 개수")
+    category: List[FacetCount] = Field(
+        default_factory=list, description="카테고리별 개수"
+    )
+    year: List[FacetCount] = Field(default_factory=list, description="연도별 개수")
+    month: List[FacetCount] = Field(default_factory=list, description="월별 개수")
+
+
+class StorageCatalogImportError(BaseModel):
+    """
+    일괄 가져오기 오류 스키마
+
+    가져오기에 실패한 줄과 사유를 나타냅니다.
+    """
+
+    line: int = Field(..., description="파일 내 줄 번호 (1부터 시작)")
+    error: str = Field(..., description="오류 사유")
+
+
+class StorageCatalogImportResponse(BaseModel):
+    """
+    저장소 카탈로그 일괄 가져오기 응답 스키마
+
+    처리된 행 수와 줄별 오류를 반환합니다.
+    """
+
+    dry_run: bool = Field(..., description="검증만 수행했는지 여부")
+    total: int = Field(..., description="처리한 전체 행 수")
+    inserted: int = Field(
+        ...,
+        description="저장(생성 또는 갱신)된 행 수 (dry_run이면 저장 가능한 행 수)",
+    )
+    failed: int = Field(..., description="실패한 행 수")
+    errors: List[StorageCatalogImportError] = Field(
+        default_factory=list, description="줄별 오류 목록"
+    )
+    errors_truncated: bool = Field(
+        False, description="오류가 많아 일부만 반환되었는지 여부"
+    )
+
+
+class StorageCatalogTreeNode(BaseModel):
+    """
+    탐색 트리 자식 노드 스키마
+
+    하위 계층의 값과 그 아래 카탈로그 수를 나타냅니다.
+    """
+
+    value: Optional[Union[int, str]] = Field(
+        None, description="노드 값 (저장소/연도/월, 미지정은 null)"
+    )
+    count: int = Field(..., description="하위 카탈로그 수")
+
+
+class StorageCatalogTreeResponse(BaseModel):
+    """
+    저장소 카탈로그 탐색 트리 응답 스키마
+
+    요청한 노드의 카탈로그 수와 자식 한 페이지를 반환합니다.
+    월 노드의 자식은 activities, 그 외 노드의 자식은 children에 담깁니다.
+    """
+
+    level: Literal["root", "storage", "year", "month"] = Field(
+        ..., description="조회한 노드의 계층"
+    )
+    count: int = Field(..., description="노드 아래 카탈로그 수")
+    child_level: Literal["storage", "year", "month", "activity"] = Field(
+        ..., description="자식의 계층"
+    )
+    total_children: int = Field(..., description="전체 자식 수")
+    children: List[StorageCatalogTreeNode] = Field(
+        default_factory=list, description="자식 노드 목록"
+    )
+    activities: List[StorageCatalogResponse] = Field(
+        default_factory=list, description="활동 목록 (월 노드)"
+    )
@@ -57,3 +57,46 @@ class LoginRequest(BaseModel):
 
     nickname: str = Field(..., max_length=200, description="닉네임")
     password: str = Field(..., description="비밀번호")
+
+
+class UserProducedCounts(BaseModel):
+    """
+    사용자 작업(producer) 항목 단계별 집계 스키마
+
+    사용자가 작업자로 매핑된 백업 상태 중 단계별 완료 개수를 나타냅니다.
+    """
+
+    total: int = Field(0, description="작업한 항목 수")
+    cam: int = Field(0, description="카메라 원본 백업 완료 수")
+    master: int = Field(0, description="마스터 파일 백업 완료 수")
+    clean: int = Field(0, description="정리본 백업 완료 수")
+    final_product: int = Field(0, description="최종 산출물 백업 완료 수")
+    fully_backed_up: int = Field(0, description="모든 단계 완료 수")
+
+
+class UserCheckedCounts(BaseModel):
+    """
+    사용자 확인(checker) 항목 단계별 집계 스키마
+
+    사용자가 각 단계의 확인자로 지정된 백업 상태 개수를 나타냅니다.
+    """
+
+    total: int = Field(0, description="한 단계 이상 확인한 항목 수")
+    cam: int = Field(0, description="카메라 원본 확인 수 (cam_checker)")
+    master: int = Field(0, description="마스터 파일 확인 수 (master_checker)")
+    clean: int = Field(0, description="정리본 확인 수 (clean_checker)")
+    final_product: int = Field(
+        0, description="최종 산출물 확인 수 (final_product_checker)"
+    )
+
+
+class UserWorkloadStatsResponse(BaseModel):
+    """
+    사용자 작업량 통계 응답 스키마
+
+    삭제되지 않은 백업 상태 기준으로 작업/확인 항목 수를 반환합니다.
+    """
+
+    user_id: int = Field(..., description="사용자 ID")
+    produced: UserProducedCounts = Field(..., description="작업자로 참여한 항목 집계")
+    checked: UserCheckedCounts = Field(..., description="확인자로 지정된 항목 집계")
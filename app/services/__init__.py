@@ -0,0 +1,5 @@
+"""
+서비스 패키지
+
+라우터에서 공통으로 사용하는 인메모리 캐시 등 보조 기능을 관리합니다.
+"""
@@ -0,0 +1,268 @@
+"""
+백업 상태 변경 이력(감사 로그) 기록 모듈
+
+요청 경로에서는 이력을 메모리 큐에 넣기만 하고(논블로킹),
+백그라운드 스레드가 큐를 모아 일괄 INSERT합니다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import WriteSessionLocal
+from models.backup_status_history import BackupStatusHistory
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# 이력 작업 종류
+ACTION_CREATED = "created"
+ACTION_UPDATED = "updated"
+ACTION_COMPLETED = "completed"
+ACTION_DELETED = "deleted"
+ACTION_RESTORED = "restored"
+
+# 이력 값 컬럼 최대 길이
+MAX_VALUE_LENGTH = 1000
+
+# (필드명, 변경 전 값, 변경 후 값)
+FieldChange = Tuple[str, Any, Any]
+
+
+def format_history_value(value: Any) -> Optional[str]:
+    """
+    이력 컬럼에 저장할 문자열로 값을 변환합니다.
+
+    Args:
+        value: 변환할 값
+
+    Returns:
+        Optional[str]: 문자열 값 (None은 그대로 None)
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        text = "true" if value else "false"
+    elif isinstance(value, datetime):
+        text = value.isoformat()
+    elif isinstance(value, (list, tuple, set)):
+        text = ",".join(str(item) for item in value)
+    else:
+        text = str(value)
+    return text[:MAX_VALUE_LENGTH]
+
+
+@dataclass
+class HistoryEntry:
+    """큐에 쌓이는 변경 이력 한 건"""
+
+    backup_status_id: int
+    action: str
+    field: Optional[str] = None
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    changed_by: Optional[int] = None
+    changed_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        # 큐에서 기다린 시간과 무관하게 요청 시점을 변경 일시로 기록
+        if self.changed_at is None:
+            self.changed_at = datetime.utcnow()
+
+
+class AuditRecorder:
+    """
+    변경 이력 비동기 일괄 기록기
+
+    record()는 크기가 제한된 큐에 put_nowait로 넣기만 하므로 요청을 막지 않습니다.
+    큐가 가득 차면 이력을 버리고 dropped 카운터를 올립니다. (메모리 사용량 상한)
+    워커 스레드는 batch_size건이 모이거나 flush_interval이 지나면
+    한 번의 INSERT(executemany)와 커밋으로 기록하고, stop() 시 남은 이력을 모두 기록합니다.
+
+    Attributes:
+        max_queue_size: 큐 최대 크기
+        batch_size: INSERT당 최대 이력 수
+        flush_interval: 이력을 모으는 최대 시간 (초)
+        dropped: 큐가 가득 차 버린 이력 수
+        written: 기록된 이력 수
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[HistoryEntry]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._dropped_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """워커 스레드가 실행 중인지 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """워커 스레드를 시작합니다."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="audit-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """큐에 남은 이력을 모두 기록한 뒤 워커 스레드를 종료합니다."""
+        if not self.running:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def record(self, entries: Iterable[HistoryEntry]) -> None:
+        """
+        변경 이력을 큐에 넣습니다. (논블로킹)
+
+        Args:
+            entries: 기록할 이력 목록
+        """
+        for entry in entries:
+            try:
+                self._queue.put_nowait(entry)
+            except queue.Full:
+                # 여러 요청 스레드에서 동시에 올리므로 잠금 안에서 증가
+                with self._dropped_lock:
+                    self.dropped += 1
+                    dropped = self.dropped
+                if dropped == 1 or dropped % 1000 == 0:
+                    logger.warning("이력 큐가 가득 차 %d건을 버렸습니다.", dropped)
+
+    def _run(self) -> None:
+        """이력을 모아 일괄 기록하는 워커 루프"""
+        while not (self._stopping.is_set() and self._queue.empty()):
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                # 종료 중에는 기다리지 않고 남은 이력만 모음
+                remaining = (
+                    0 if self._stopping.is_set() else deadline - time.monotonic()
+                )
+                try:
+                    if remaining <= 0:
+                        batch.append(self._queue.get_nowait())
+                    else:
+                        batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+
+    def _write(self, batch: List[HistoryEntry]) -> None:
+        """이력 배치를 한 번의 INSERT로 기록합니다. (실패 시 로그만 남기고 버림)"""
+        db = self._session_factory()
+        try:
+            db.execute(insert(BackupStatusHistory), [asdict(entry) for entry in batch])
+            db.commit()
+            self.written += len(batch)
+        except Exception:
+            db.rollback()
+            logger.exception("변경 이력 %d건 기록에 실패했습니다.", len(batch))
+        finally:
+            db.close()
+
+
+def field_change_entries(
+    backup_id: int,
+    action: str,
+    changes: Iterable[FieldChange],
+    changed_by: Optional[int] = None,
+) -> List[HistoryEntry]:
+    """
+    필드 변경 목록을 이력 엔트리로 변환합니다. (값이 같은 필드는 제외)
+
+    Args:
+        backup_id: 백업 상태 ID
+        action: 작업 종류
+        changes: (필드명, 변경 전 값, 변경 후 값) 목록
+        changed_by: 변경한 사용자 ID
+
+    Returns:
+        List[HistoryEntry]: 이력 엔트리 목록
+    """
+    changed_at = datetime.utcnow()
+    return [
+        HistoryEntry(
+            backup_status_id=backup_id,
+            action=action,
+            field=name,
+            old_value=format_history_value(old),
+            new_value=format_history_value(new),
+            changed_by=changed_by,
+            changed_at=changed_at,
+        )
+        for name, old, new in changes
+        if old != new
+    ]
+
+
+def stage_change_entries(
+    backup_id: int, changes: Iterable[FieldChange], params: Dict[str, Any]
+) -> List[HistoryEntry]:
+    """
+    mark-complete 단계 변경을 이력 엔트리로 변환합니다.
+
+    단계 필드(cam 등)는 같은 요청의 확인자(cam_checker 등)를,
+    확인자 필드는 새 확인자 자신을 변경한 사용자로 기록합니다.
+
+    Args:
+        backup_id: 백업 상태 ID
+        changes: (필드명, 변경 전 값, 변경 후 값) 목록
+        params: mark-complete 요청 값
+
+    Returns:
+        List[HistoryEntry]: 이력 엔트리 목록
+    """
+    entries = []
+    for name, old, new in changes:
+        if name.endswith("_checker"):
+            changed_by = new
+        else:
+            changed_by = params.get(f"{name}_checker")
+        entries.extend(
+            field_change_entries(
+                backup_id, ACTION_COMPLETED, [(name, old, new)], changed_by
+            )
+        )
+    return entries
+
+
+# 백업 상태 변경 이력 기록기 (lifespan에서 시작/종료)
+audit_recorder = AuditRecorder(
+    WriteSessionLocal,
+    max_queue_size=settings.audit_queue_max_size,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_ms / 1000,
+)
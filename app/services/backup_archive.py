@@ -0,0 +1,189 @@
+"""
+백업 상태 아카이브 모듈
+
+보존 기간이 지난 소프트 삭제 백업 상태와 작업자 매핑을
+아카이브 테이블로 배치 단위로 이동하고, 필요 시 복원합니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import delete, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from models.backup_status import BackupStatus
+from models.backup_status_archive import BackupStatusArchive
+from models.m_user_backup_status import MUserBackupStatus
+from models.m_user_backup_status_archive import MUserBackupStatusArchive
+
+# 운영 테이블과 아카이브 테이블이 공유하는 컬럼명 (생성 컬럼 제외)
+BACKUP_COLUMNS = [
+    column.name for column in BackupStatus.__table__.columns if column.computed is None
+]
+MAPPING_COLUMNS = [column.name for column in MUserBackupStatus.__table__.columns]
+
+
+def archivable_backups_filter(retention_days: int):
+    """
+    아카이브 대상(보존 기간이 지난 소프트 삭제 항목) 조건을 반환합니다.
+
+    deleted_at이 기록되기 전에 삭제된 항목은 보존 기간이 지난 것으로 간주합니다.
+
+    Args:
+        retention_days: 삭제 후 보존 기간 (일)
+    """
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    return (
+        BackupStatus.deleted == True,
+        or_(BackupStatus.deleted_at.is_(None), BackupStatus.deleted_at <= cutoff),
+    )
+
+
+def count_archivable_backups(db: Session, retention_days: int) -> int:
+    """
+    아카이브 대상 백업 상태 수를 반환합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        retention_days: 삭제 후 보존 기간 (일)
+
+    Returns:
+        int: 아카이브 대상 항목 수
+    """
+    return (
+        db.query(BackupStatus.id)
+        .filter(*archivable_backups_filter(retention_days))
+        .count()
+    )
+
+
+def archive_backup_batch(db: Session, backup_ids: List[int]) -> None:
+    """
+    주어진 백업 상태와 작업자 매핑을 아카이브 테이블로 이동합니다.
+
+    INSERT ... SELECT 후 운영 테이블에서 삭제하며, 커밋은 호출자가 수행합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        backup_ids: 이동할 백업 상태 ID 리스트
+    """
+    archived_at = literal(datetime.utcnow())
+
+    db.execute(
+        insert(BackupStatusArchive).from_select(
+            BACKUP_COLUMNS + ["archived_at"],
+            select(
+                *[BackupStatus.__table__.c[name] for name in BACKUP_COLUMNS],
+                archived_at,
+            ).where(BackupStatus.id.in_(backup_ids)),
+        )
+    )
+    db.execute(
+        insert(MUserBackupStatusArchive).from_select(
+            MAPPING_COLUMNS + ["archived_at"],
+            select(
+                *[MUserBackupStatus.__table__.c[name] for name in MAPPING_COLUMNS],
+                archived_at,
+            ).where(MUserBackupStatus.backup_status_id.in_(backup_ids)),
+        )
+    )
+
+    # FK 순서에 맞춰 매핑부터 삭제
+    db.execute(
+        delete(MUserBackupStatus).where(
+            MUserBackupStatus.backup_status_id.in_(backup_ids)
+        )
+    )
+    db.execute(delete(BackupStatus).where(BackupStatus.id.in_(backup_ids)))
+
+
+def archive_deleted_backups(
+    db: Session,
+    retention_days: int,
+    batch_size: int,
+    max_batches: Optional[int] = None,
+) -> int:
+    """
+    보존 기간이 지난 소프트 삭제 백업 상태를 배치 단위로 아카이브합니다.
+
+    배치마다 별도의 트랜잭션으로 커밋하므로, 도중에 중단되어도
+    이미 이동한 배치는 유지되고 다음 실행에서 나머지를 이어서 처리합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        retention_days: 삭제 후 보존 기간 (일)
+        batch_size: 트랜잭션당 이동할 행 수
+        max_batches: 최대 배치 수 (None이면 대상이 없을 때까지)
+
+    Returns:
+        int: 아카이브된 백업 상태 수
+    """
+    archived = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        backup_ids = [
+            row[0]
+            for row in db.query(BackupStatus.id)
+            .filter(*archivable_backups_filter(retention_days))
+            .order_by(BackupStatus.id)
+            .limit(batch_size)
+            .all()
+        ]
+        if not backup_ids:
+            break
+
+        archive_backup_batch(db, backup_ids)
+        db.commit()
+
+        archived += len(backup_ids)
+        batches += 1
+
+    return archived
+
+
+def restore_archived_backup(db: Session, backup_id: int) -> bool:
+    """
+    아카이브된 백업 상태와 작업자 매핑을 운영 테이블로 되돌립니다.
+
+    원래 ID를 그대로 사용하며, 커밋은 호출자가 수행합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        backup_id: 복원할 백업 상태 ID
+
+    Returns:
+        bool: 아카이브에 해당 항목이 있어 복원했는지 여부
+    """
+    archived = db.get(BackupStatusArchive, backup_id)
+    if archived is None:
+        return False
+
+    db.execute(
+        insert(BackupStatus).from_select(
+            BACKUP_COLUMNS,
+            select(
+                *[BackupStatusArchive.__table__.c[name] for name in BACKUP_COLUMNS]
+            ).where(BackupStatusArchive.id == backup_id),
+        )
+    )
+    db.execute(
+        insert(MUserBackupStatus).from_select(
+            MAPPING_COLUMNS,
+            select(
+                *[
+                    MUserBackupStatusArchive.__table__.c[name]
+                    for name in MAPPING_COLUMNS
+                ]
+            ).where(MUserBackupStatusArchive.backup_status_id == backup_id),
+        )
+    )
+
+    db.execute(
+        delete(MUserBackupStatusArchive).where(
+            MUserBackupStatusArchive.backup_status_id == backup_id
+        )
+    )
+    db.execute(delete(BackupStatusArchive).where(BackupStatusArchive.id == backup_id))
+    db.expunge(archived)
+    return True
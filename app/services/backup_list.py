@@ -0,0 +1,156 @@
+"""
+백업 상태 목록 조회 모듈
+
+확인자/작업자 이름을 포함한 백업 상태 목록 조회 쿼리와 응답 변환,
+진행 요약 집계 컬럼을 제공합니다.
+(백업 상태/사용자 라우터와 백그라운드 작업에서 공통으로 사용)
+"""
+
+from typing import Dict, List
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session, aliased
+
+from models.backup_status import STAGE_MASK_ALL, STAGE_MASK_BITS, BackupStatus
+from models.m_user_backup_status import MUserBackupStatus
+from models.user import User
+from schemas.backup_status import BackupStatusListResponse
+
+
+def get_producers_for_backups(
+    db: Session, backup_status_ids: List[int]
+) -> Dict[int, List[str]]:
+    """
+    여러 백업 상태에 매핑된 작업자(producers) 이름을 한 번의 쿼리로 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        backup_status_ids: 백업 상태 ID 리스트
+
+    Returns:
+        Dict[int, List[str]]: 백업 상태 ID별 작업자 이름 리스트
+    """
+    producers: Dict[int, List[str]] = {
+        backup_status_id: [] for backup_status_id in backup_status_ids
+    }
+    if not backup_status_ids:
+        return producers
+
+    results = (
+        db.query(MUserBackupStatus.backup_status_id, User.name)
+        .join(User, MUserBackupStatus.user_id == User.id)
+        .filter(MUserBackupStatus.backup_status_id.in_(backup_status_ids))
+        .order_by(MUserBackupStatus.id)
+        .all()
+    )
+    for backup_status_id, name in results:
+        producers[backup_status_id].append(name)
+    return producers
+
+
+def query_backup_list(db: Session):
+    """
+    확인자 이름을 포함한 백업 상태 목록 조회 쿼리를 생성합니다.
+
+    각 checker에 대해 User 테이블을 별도로 alias하여 left join합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        Query: (BackupStatus, 확인자 이름 4개) 행을 반환하는 쿼리
+    """
+    CamChecker = aliased(User)
+    MasterChecker = aliased(User)
+    CleanChecker = aliased(User)
+    FinalProductChecker = aliased(User)
+
+    return (
+        db.query(
+            BackupStatus,
+            CamChecker.name.label("cam_checker_name"),
+            MasterChecker.name.label("master_checker_name"),
+            CleanChecker.name.label("clean_checker_name"),
+            FinalProductChecker.name.label("final_product_checker_name"),
+        )
+        .outerjoin(CamChecker, BackupStatus.cam_checker == CamChecker.id)
+        .outerjoin(MasterChecker, BackupStatus.master_checker == MasterChecker.id)
+        .outerjoin(CleanChecker, BackupStatus.clean_checker == CleanChecker.id)
+        .outerjoin(
+            FinalProductChecker,
+            BackupStatus.final_product_checker == FinalProductChecker.id,
+        )
+    )
+
+
+def build_backup_list_responses(db: Session, rows) -> List[BackupStatusListResponse]:
+    """
+    query_backup_list() 결과 행을 목록 응답 스키마로 변환합니다.
+
+    작업자(producers) 이름은 한 번의 쿼리로 일괄 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        rows: query_backup_list() 쿼리 결과 행 리스트
+
+    Returns:
+        List[BackupStatusListResponse]: 목록 응답 리스트
+    """
+    producers = get_producers_for_backups(db, [row[0].id for row in rows])
+
+    response_list = []
+    for row in rows:
+        backup = row[0]  # BackupStatus 객체
+        response_list.append(
+            BackupStatusListResponse(
+                id=backup.id,
+                event_name=backup.event_name,
+                displayed_date=backup.displayed_date,
+                name=backup.name,
+                description=backup.description,
+                cam=backup.cam,
+                cam_checker=backup.cam_checker,
+                cam_checker_name=row.cam_checker_name,
+                master=backup.master,
+                master_checker=backup.master_checker,
+                master_checker_name=row.master_checker_name,
+                clean=backup.clean,
+                clean_checker=backup.clean_checker,
+                clean_checker_name=row.clean_checker_name,
+                final_product=backup.final_product,
+                final_product_checker=backup.final_product_checker,
+                final_product_checker_name=row.final_product_checker_name,
+                created_at=backup.created_at,
+                updated_at=backup.updated_at,
+                producers=producers[backup.id],
+            )
+        )
+    return response_list
+
+
+def backup_progress_columns() -> list:
+    """
+    항목 수, 단계별 완료 수, 표시 날짜 범위를 계산하는 집계 컬럼을 반환합니다.
+
+    BackupStatusSummaryResponse 필드명으로 label되며,
+    마지막 컬럼은 가장 늦은 표시 날짜(last_displayed_date)입니다.
+    단계별 완료 수는 stage_mask 비트로 계산하므로
+    (deleted, stage_mask, displayed_date) 인덱스만 읽어 집계할 수 있습니다.
+
+    Returns:
+        list: 집계 컬럼 리스트
+    """
+    return [
+        func.count(BackupStatus.id).label("item_count"),
+        *(
+            func.count(case((BackupStatus.stage_mask.bitwise_and(bit) != 0, 1))).label(
+                f"{stage}_count"
+            )
+            for stage, bit in STAGE_MASK_BITS.items()
+        ),
+        func.count(case((BackupStatus.stage_mask == STAGE_MASK_ALL, 1))).label(
+            "fully_backed_up_count"
+        ),
+        func.min(BackupStatus.displayed_date).label("first_displayed_date"),
+        func.max(BackupStatus.displayed_date).label("last_displayed_date"),
+    ]
@@ -0,0 +1,483 @@
+"""
+백업 상태 인메모리 스냅샷 모듈
+
+삭제되지 않은 백업 상태 전체를 numpy 배열 기반 컬럼형 구조로 메모리에 유지하고,
+목록 조회/필터/정렬/요약을 DB 왕복 없이 벡터 연산으로 처리합니다.
+변경분은 updated_at 커서로 주기적으로, 또는 쓰기 API가 알린 직후에 반영합니다.
+스냅샷이 비활성화되었거나 numpy가 없으면 DB 조회를 사용합니다.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from config import get_settings
+from database import SessionLocal
+from models.backup_status import STAGE_MASK_ALL, STAGE_MASK_BITS, BackupStatus
+from models.m_user_backup_status import MUserBackupStatus
+from models.user import User
+from schemas.backup_status import BackupStatusListResponse
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# 백업 단계 (stage_mask 비트 순서)
+STAGES = tuple(STAGE_MASK_BITS)
+
+# 일시 저장 기준 (UTC naive, 마이크로초 단위 int64)
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+# 커밋 지연으로 늦게 보이는 변경을 놓치지 않도록 커서를 되돌려 두는 시간
+REFRESH_SAFETY_WINDOW = timedelta(seconds=5)
+
+# 배열 초기 용량
+INITIAL_CAPACITY = 1024
+
+
+def to_micros(value: Optional[datetime], null: int) -> int:
+    """일시를 EPOCH 기준 마이크로초로 변환합니다. (None이면 null 값)"""
+    if value is None:
+        return null
+    return (value.replace(tzinfo=None) - EPOCH) // MICROSECOND
+
+
+def from_micros(value: int, null: int) -> Optional[datetime]:
+    """EPOCH 기준 마이크로초를 일시로 변환합니다. (null 값이면 None)"""
+    if value == null:
+        return None
+    return EPOCH + timedelta(microseconds=int(value))
+
+
+class BackupStatusSnapshot:
+    """
+    삭제되지 않은 백업 상태의 컬럼형 스냅샷
+
+    숫자 컬럼은 numpy 배열, 문자열 컬럼은 리스트로 행 위치를 맞춰 저장합니다.
+    - 일시: int64 (마이크로초, NULL은 int64 최솟값이라 최신순 정렬 시 마지막)
+    - 단계 완료 여부: uint8 비트셋 2개 (true인 단계(stage_mask), NULL인 단계)
+    - 이벤트명: 중복 제거한 이름 목록의 인덱스 (int32, NULL은 -1)
+    - 확인자 ID: (행, 단계) int32 배열 (NULL은 0)
+    삭제된 행은 마지막 행을 그 위치로 옮겨 채우므로 행 순서는 의미가 없습니다.
+    변환한 응답 객체는 행이 바뀔 때까지 ID별로 재사용합니다.
+    조회와 변경분 반영은 하나의 잠금으로 직렬화합니다.
+
+    Attributes:
+        refresh_interval: 변경분 반영 주기 (초)
+        loaded: 전체 적재 완료 여부
+        cursor: 다음 변경분 조회 기준 일시
+    """
+
+    def __init__(self, session_factory: sessionmaker, refresh_interval: float = 1.0):
+        self._session_factory = session_factory
+        self.refresh_interval = refresh_interval
+        self.loaded = False
+        self.cursor: Optional[datetime] = None
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._refreshed_at = 0.0
+        self._reset()
+
+    @property
+    def available(self) -> bool:
+        """numpy가 설치되어 스냅샷을 사용할 수 있는지 여부"""
+        return np is not None
+
+    @property
+    def size(self) -> int:
+        """스냅샷의 행 수"""
+        return self._size
+
+    def _reset(self) -> None:
+        self._size = 0
+        self._positions: Dict[int, int] = {}
+        self._event_names: List[str] = []
+        self._event_codes_by_name: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._descriptions: List[Optional[str]] = []
+        self._producers: List[Tuple[int, ...]] = []
+        self._producer_backups: Dict[int, Set[int]] = {}
+        self._user_names: Dict[int, str] = {}
+        self._responses: Dict[int, BackupStatusListResponse] = {}
+        if np is None:
+            return
+        self._null_date = np.iinfo(np.int64).min
+        self._ids = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self._event_codes = np.zeros(INITIAL_CAPACITY, dtype=np.int32)
+        self._displayed = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self._created = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self._updated = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self._done = np.zeros(INITIAL_CAPACITY, dtype=np.uint8)
+        self._null = np.zeros(INITIAL_CAPACITY, dtype=np.uint8)
+        self._checkers = np.zeros((INITIAL_CAPACITY, len(STAGES)), dtype=np.int32)
+
+    # ------------------------------------------------------------------
+    # 적재/변경분 반영
+    # ------------------------------------------------------------------
+
+    def load(self) -> int:
+        """
+        삭제되지 않은 백업 상태 전체를 적재합니다.
+
+        Returns:
+            int: 적재한 행 수
+
+        Raises:
+            RuntimeError: numpy가 설치되지 않은 경우
+        """
+        if np is None:
+            raise RuntimeError("백업 상태 스냅샷을 사용하려면 numpy가 필요합니다.")
+
+        with self._lock:
+            started = datetime.utcnow()
+            db = self._session_factory()
+            try:
+                self._reset()
+                self._load_users(db)
+                backups = (
+                    db.query(BackupStatus)
+                    .filter(BackupStatus.deleted == False)
+                    .order_by(BackupStatus.id)
+                    .all()
+                )
+                producers = self._query_producers(db, None)
+                for backup in backups:
+                    self._upsert(backup, producers.get(backup.id, ()))
+            finally:
+                db.close()
+            self.cursor = started
+            self.loaded = True
+            self._dirty = False
+            self._refreshed_at = time.monotonic()
+            return self._size
+
+    def mark_dirty(self) -> None:
+        """쓰기 API가 변경을 커밋했음을 알립니다. (다음 조회 전에 변경분 반영)"""
+        self._dirty = True
+
+    def refresh(self) -> int:
+        """
+        마지막 반영 이후 변경된 행을 반영합니다.
+
+        커서보다 REFRESH_SAFETY_WINDOW만큼 앞선 시점부터 다시 조회하므로
+        같은 변경이 여러 번 반영될 수 있으며, 반영은 멱등입니다.
+
+        Returns:
+            int: 반영한 행 수 (추가/수정/삭제)
+        """
+        with self._lock:
+            started = datetime.utcnow()
+            self._dirty = False
+            db = self._session_factory()
+            try:
+                backups = (
+                    db.query(BackupStatus)
+                    .filter(
+                        BackupStatus.updated_at >= self.cursor - REFRESH_SAFETY_WINDOW
+                    )
+                    .all()
+                )
+                live_ids = [backup.id for backup in backups if not backup.deleted]
+                producers = self._query_producers(db, live_ids) if live_ids else {}
+                user_ids = {
+                    getattr(backup, f"{stage}_checker")
+                    for backup in backups
+                    for stage in STAGES
+                }
+                user_ids.update(
+                    user_id for ids in producers.values() for user_id in ids
+                )
+                user_ids.discard(None)
+                if not user_ids.issubset(self._user_names):
+                    self._load_users(db)
+                for backup in backups:
+                    if backup.deleted:
+                        self._remove(backup.id)
+                    else:
+                        self._upsert(backup, producers.get(backup.id, ()))
+            finally:
+                db.close()
+            self.cursor = started
+            self._refreshed_at = time.monotonic()
+            return len(backups)
+
+    def _ensure_fresh(self) -> bool:
+        """변경 알림이 있었거나 반영 주기가 지났으면 변경분을 반영합니다."""
+        if (
+            self._dirty
+            or time.monotonic() - self._refreshed_at >= self.refresh_interval
+        ):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("백업 상태 스냅샷 갱신에 실패했습니다.")
+                return False
+        return True
+
+    def _load_users(self, db: Session) -> None:
+        self._user_names = dict(db.query(User.id, User.name).all())
+        # 확인자/작업자 이름이 바뀌었을 수 있으므로 변환 결과를 버림
+        self._responses.clear()
+
+    def _query_producers(
+        self, db: Session, backup_ids: Optional[List[int]]
+    ) -> Dict[int, Tuple[int, ...]]:
+        """백업 상태별 작업자 ID를 매핑 순서대로 조회합니다. (None이면 전체)"""
+        query = db.query(MUserBackupStatus.backup_status_id, MUserBackupStatus.user_id)
+        if backup_ids is not None:
+            query = query.filter(MUserBackupStatus.backup_status_id.in_(backup_ids))
+        producers: Dict[int, List[int]] = {}
+        for backup_id, user_id in query.order_by(MUserBackupStatus.id):
+            producers.setdefault(backup_id, []).append(user_id)
+        return {backup_id: tuple(ids) for backup_id, ids in producers.items()}
+
+    def _grow(self) -> None:
+        """배열 용량을 두 배로 늘립니다."""
+        capacity = len(self._ids) * 2
+        for name in (
+            "_ids",
+            "_event_codes",
+            "_displayed",
+            "_created",
+            "_updated",
+            "_done",
+            "_null",
+            "_checkers",
+        ):
+            array = getattr(self, name)
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[: self._size] = array[: self._size]
+            setattr(self, name, grown)
+
+    def _event_code(self, event_name: Optional[str]) -> int:
+        if event_name is None:
+            return -1
+        code = self._event_codes_by_name.get(event_name)
+        if code is None:
+            code = len(self._event_names)
+            self._event_names.append(event_name)
+            self._event_codes_by_name[event_name] = code
+        return code
+
+    def _upsert(self, backup: BackupStatus, producers: Tuple[int, ...]) -> None:
+        """행을 추가하거나 같은 위치에 덮어씁니다."""
+        self._responses.pop(backup.id, None)
+        position = self._positions.get(backup.id)
+        if position is None:
+            if self._size == len(self._ids):
+                self._grow()
+            position = self._size
+            self._size += 1
+            self._positions[backup.id] = position
+            self._names.append(backup.name)
+            self._descriptions.append(backup.description)
+            self._producers.append(())
+        else:
+            self._names[position] = backup.name
+            self._descriptions[position] = backup.description
+
+        null = 0
+        for index, stage in enumerate(STAGES):
+            if getattr(backup, stage) is None:
+                null |= STAGE_MASK_BITS[stage]
+            self._checkers[position, index] = getattr(backup, f"{stage}_checker") or 0
+
+        self._ids[position] = backup.id
+        self._event_codes[position] = self._event_code(backup.event_name)
+        self._displayed[position] = to_micros(backup.displayed_date, self._null_date)
+        self._created[position] = to_micros(backup.created_at, self._null_date)
+        self._updated[position] = to_micros(backup.updated_at, self._null_date)
+        self._done[position] = backup.stage_mask
+        self._null[position] = null
+        self._set_producers(position, backup.id, producers)
+
+    def _set_producers(
+        self, position: int, backup_id: int, producers: Tuple[int, ...]
+    ) -> None:
+        for user_id in self._producers[position]:
+            self._producer_backups.get(user_id, set()).discard(backup_id)
+        self._producers[position] = producers
+        for user_id in producers:
+            self._producer_backups.setdefault(user_id, set()).add(backup_id)
+
+    def _remove(self, backup_id: int) -> None:
+        """행을 삭제하고 마지막 행을 그 위치로 옮깁니다."""
+        self._responses.pop(backup_id, None)
+        position = self._positions.pop(backup_id, None)
+        if position is None:
+            return
+        self._set_producers(position, backup_id, ())
+
+        last = self._size - 1
+        if position != last:
+            for array in (
+                self._ids,
+                self._event_codes,
+                self._displayed,
+                self._created,
+                self._updated,
+                self._done,
+                self._null,
+                self._checkers,
+            ):
+                array[position] = array[last]
+            for values in (self._names, self._descriptions, self._producers):
+                values[position] = values[last]
+            self._positions[int(self._ids[position])] = position
+        for values in (self._names, self._descriptions, self._producers):
+            values.pop()
+        self._size = last
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _filter_mask(self, filters):
+        """목록 필터(BackupStatusFilters)에 해당하는 행의 불리언 마스크를 만듭니다."""
+        size = self._size
+        mask = np.ones(size, dtype=bool)
+
+        if filters.event_name:
+            # DB 조회의 LIKE와 같이 대소문자를 구분하지 않음
+            term = filters.event_name.lower()
+            codes = [
+                code
+                for code, event_name in enumerate(self._event_names)
+                if term in event_name.lower()
+            ]
+            mask &= np.isin(self._event_codes[:size], codes)
+        displayed = self._displayed[:size]
+        if filters.displayed_date_from is not None:
+            mask &= displayed >= to_micros(filters.displayed_date_from, 0)
+        if filters.displayed_date_to is not None:
+            mask &= (displayed < to_micros(filters.displayed_date_to, 0)) & (
+                displayed != self._null_date
+            )
+        done = self._done[:size]
+        if filters.incomplete_stage:
+            mask &= (done & STAGE_MASK_BITS[filters.incomplete_stage]) == 0
+        if filters.checker_id is not None:
+            mask &= (self._checkers[:size] == filters.checker_id).any(axis=1)
+        if filters.producer_id is not None:
+            backup_ids = list(self._producer_backups.get(filters.producer_id, ()))
+            mask &= np.isin(self._ids[:size], backup_ids)
+        if filters.fully_backed_up is True:
+            mask &= done == STAGE_MASK_ALL
+        elif filters.fully_backed_up is False:
+            mask &= done != STAGE_MASK_ALL
+        return mask
+
+    def _to_response(self, position: int) -> BackupStatusListResponse:
+        """행을 목록 응답 스키마로 변환합니다. (행이 바뀌기 전까지 재사용)"""
+        backup_id = int(self._ids[position])
+        response = self._responses.get(backup_id)
+        if response is not None:
+            return response
+
+        done = int(self._done[position])
+        null = int(self._null[position])
+        values = {}
+        for index, stage in enumerate(STAGES):
+            bit = STAGE_MASK_BITS[stage]
+            checker = int(self._checkers[position, index]) or None
+            values[stage] = None if null & bit else bool(done & bit)
+            values[f"{stage}_checker"] = checker
+            values[f"{stage}_checker_name"] = self._user_names.get(checker)
+
+        code = int(self._event_codes[position])
+        response = BackupStatusListResponse(
+            id=backup_id,
+            event_name=self._event_names[code] if code >= 0 else None,
+            displayed_date=from_micros(self._displayed[position], self._null_date),
+            name=self._names[position],
+            description=self._descriptions[position],
+            created_at=from_micros(self._created[position], self._null_date),
+            updated_at=from_micros(self._updated[position], self._null_date),
+            producers=[
+                self._user_names[user_id]
+                for user_id in self._producers[position]
+                if user_id in self._user_names
+            ],
+            **values,
+        )
+        self._responses[backup_id] = response
+        return response
+
+    def list_items(
+        self, filters, skip: int, limit: int
+    ) -> Optional[List[BackupStatusListResponse]]:
+        """
+        필터에 맞는 항목을 표시 날짜 최신순(NULL은 마지막, 같으면 ID 역순)으로 조회합니다.
+
+        Args:
+            filters: 목록 필터 (BackupStatusFilters)
+            skip: 건너뛸 항목 수
+            limit: 조회할 항목 수
+
+        Returns:
+            Optional[List[BackupStatusListResponse]]: 조회 결과 (스냅샷을 쓸 수 없으면 None)
+        """
+        if not self.loaded:
+            return None
+        with self._lock:
+            if not self._ensure_fresh():
+                return None
+            positions = np.flatnonzero(self._filter_mask(filters))
+            order = np.lexsort((self._ids[positions], self._displayed[positions]))[::-1]
+            page = positions[order[skip : skip + limit]]
+            return [self._to_response(int(position)) for position in page]
+
+    def summary(self, filters) -> Optional[Dict[str, object]]:
+        """
+        필터에 맞는 항목의 단계별 완료 수와 표시 날짜 범위를 집계합니다.
+
+        Args:
+            filters: 목록 필터 (BackupStatusFilters)
+
+        Returns:
+            Optional[Dict[str, object]]: 요약 응답 필드 (스냅샷을 쓸 수 없으면 None)
+        """
+        if not self.loaded:
+            return None
+        with self._lock:
+            if not self._ensure_fresh():
+                return None
+            mask = self._filter_mask(filters)
+            done = self._done[: self._size][mask]
+            displayed = self._displayed[: self._size][mask]
+            displayed = displayed[displayed != self._null_date]
+
+            result = {"item_count": int(mask.sum())}
+            for stage, bit in STAGE_MASK_BITS.items():
+                result[f"{stage}_count"] = int(np.count_nonzero(done & bit))
+            result["fully_backed_up_count"] = int(
+                np.count_nonzero(done == STAGE_MASK_ALL)
+            )
+            result["first_displayed_date"] = (
+                from_micros(displayed.min(), self._null_date)
+                if len(displayed)
+                else None
+            )
+            result["last_displayed_date"] = (
+                from_micros(displayed.max(), self._null_date)
+                if len(displayed)
+                else None
+            )
+            return result
+
+
+# 백업 상태 스냅샷 (BACKUP_SNAPSHOT이 켜져 있으면 lifespan에서 적재)
+backup_snapshot = BackupStatusSnapshot(
+    SessionLocal,
+    refresh_interval=settings.backup_snapshot_refresh_interval_ms / 1000,
+)
@@ -0,0 +1,162 @@
+"""
+백업 상태 변경 이벤트 브로드캐스터 모듈
+
+쓰기 API에서 커밋된 변경 사항을 한 곳에서 받아
+연결된 모든 스트림 구독자(SSE)에게 전달합니다.
+"""
+
+import asyncio
+import json
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Set
+
+# 이벤트 종류
+EVENT_CREATED = "created"
+EVENT_UPDATED = "updated"
+EVENT_COMPLETED = "completed"
+EVENT_DELETED = "deleted"
+# 구독자가 이벤트를 놓쳐 전체 목록을 다시 조회해야 할 때 보내는 이벤트
+EVENT_RESYNC = "resync"
+
+
+@dataclass
+class BroadcastEvent:
+    """
+    브로드캐스트 이벤트
+
+    Attributes:
+        id: 단조 증가하는 이벤트 ID (SSE Last-Event-ID로 재연결 시 사용)
+        type: 이벤트 종류
+        data: 이벤트 데이터 (JSON 직렬화 가능한 딕셔너리)
+    """
+
+    id: int
+    type: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_sse(self) -> str:
+        """SSE(text/event-stream) 형식의 메시지로 변환합니다."""
+        payload = json.dumps(self.data, ensure_ascii=False)
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+class Broadcaster:
+    """
+    프로세스 내 이벤트 브로드캐스터
+
+    쓰기 요청은 스레드풀에서 실행되므로 publish()는 어느 스레드에서든
+    호출할 수 있으며, 실제 전달은 이벤트 루프에서 구독자 큐로 이루어집니다.
+    구독자마다 DB를 조회하지 않고 하나의 발행으로 모든 구독자에게 전달합니다.
+
+    최근 이벤트를 history_size만큼 보관하여 재연결 시 놓친 이벤트를 다시 보내며,
+    큐가 가득 찬 느린 구독자나 보관 범위를 벗어난 재연결, 서버 재시작 전 이벤트 ID로의
+    재연결(이벤트 ID는 프로세스마다 1부터 다시 시작)에는 resync 이벤트를 보냅니다.
+
+    Attributes:
+        queue_size: 구독자별 최대 대기 이벤트 수
+        history_size: 재연결용으로 보관할 최근 이벤트 수
+    """
+
+    def __init__(self, queue_size: int = 256, history_size: int = 1000):
+        self.queue_size = queue_size
+        self._history: Deque[BroadcastEvent] = deque(maxlen=history_size)
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._last_id = 0
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> None:
+        """
+        이벤트를 발행합니다. 커밋이 끝난 뒤 호출해야 합니다.
+
+        Args:
+            event_type: 이벤트 종류
+            data: 이벤트 데이터
+        """
+        with self._lock:
+            self._last_id += 1
+            event = BroadcastEvent(id=self._last_id, type=event_type, data=data)
+            self._history.append(event)
+            loop = self._loop
+
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._dispatch, event)
+        except RuntimeError:
+            # 종료 중인 루프
+            pass
+
+    def _dispatch(self, event: Optional[BroadcastEvent]) -> None:
+        """이벤트 루프에서 모든 구독자 큐에 이벤트를 넣습니다."""
+        for queue in list(self._subscribers):
+            self._put(queue, event)
+
+    def _put(self, queue: asyncio.Queue, event: Optional[BroadcastEvent]) -> None:
+        """큐가 가득 찼으면 비우고 resync 이벤트로 대체합니다."""
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            if event is None:
+                queue.put_nowait(None)
+            else:
+                queue.put_nowait(BroadcastEvent(id=event.id, type=EVENT_RESYNC))
+
+    @asynccontextmanager
+    async def subscribe(
+        self, last_event_id: Optional[int] = None
+    ) -> AsyncIterator[asyncio.Queue]:
+        """
+        이벤트를 수신할 큐를 등록합니다.
+
+        큐에서 None을 받으면 서버 종료로 스트림을 끝내야 합니다.
+
+        Args:
+            last_event_id: 클라이언트가 마지막으로 받은 이벤트 ID (재연결 시)
+
+        Yields:
+            asyncio.Queue: 이벤트 수신 큐
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._subscribers.add(queue)
+            if last_event_id is not None:
+                missed = [event for event in self._history if event.id > last_event_id]
+                oldest_id = self._history[0].id if self._history else self._last_id + 1
+                # 보관 범위를 벗어나 놓친 이벤트를 모두 보낼 수 없거나,
+                # 이 프로세스가 발행하지 않은 ID(재시작 전 ID)라 놓친 이벤트를 알 수 없음
+                if last_event_id < oldest_id - 1 or last_event_id > self._last_id:
+                    missed = [BroadcastEvent(id=self._last_id, type=EVENT_RESYNC)]
+                for event in missed:
+                    self._put(queue, event)
+
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def close(self) -> None:
+        """모든 구독자에게 종료 신호(None)를 보냅니다. 서버 종료 시 호출합니다."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._dispatch, None)
+        except RuntimeError:
+            pass
+
+    @property
+    def subscriber_count(self) -> int:
+        """현재 구독자 수를 반환합니다."""
+        return len(self._subscribers)
+
+
+# 백업 상태 변경 이벤트 브로드캐스터
+backup_status_broadcaster = Broadcaster()
@@ -0,0 +1,66 @@
+"""
+쿼리 결과 캐시 모듈
+
+쓰기 작업이 일어날 때까지 유지되는 간단한 인메모리 캐시를 제공합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class QueryCache:
+    """
+    쓰기 시 무효화되는 쿼리 결과 캐시
+
+    키별로 계산 결과를 보관하고, 관련 테이블에 쓰기가 발생하면
+    invalidate()로 전체를 비웁니다.
+    캐시는 프로세스 단위이므로 워커가 여러 개인 경우 각 워커가 따로 보관합니다.
+
+    Attributes:
+        max_entries: 보관할 최대 키 수 (초과 시 가장 오래된 키부터 제거)
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        캐시된 값을 반환하고, 없으면 계산하여 저장합니다.
+
+        계산 도중 invalidate()가 호출되면 계산 결과는 저장하지 않습니다.
+
+        Args:
+            key: 캐시 키
+            compute: 캐시 미스 시 값을 계산하는 함수
+
+        Returns:
+            Any: 캐시된 값 또는 새로 계산된 값
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            version = self._version
+
+        value = compute()
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = value
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self) -> None:
+        """캐시된 모든 값을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._version += 1
+
+
+# 저장소 카탈로그 facet 집계 캐시 (카탈로그 쓰기 시 무효화)
+storage_catalog_facet_cache = QueryCache()
@@ -0,0 +1,119 @@
+"""
+저장소 카탈로그 일괄 가져오기 모듈
+
+CSV/NDJSON 업로드 파일을 전체를 메모리에 올리지 않고 한 줄씩 파싱합니다.
+"""
+
+import csv
+import io
+import json
+from typing import IO, Any, Dict, Iterator, Optional, Tuple, Union
+
+# 지원하는 가져오기 형식
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# 파일 확장자 -> 형식
+EXTENSION_FORMATS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+# Content-Type -> 형식
+CONTENT_TYPE_FORMATS = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+class ImportRowError(Exception):
+    """가져오기 파일의 한 줄을 해석할 수 없을 때 발생하는 예외"""
+
+
+def detect_import_format(
+    filename: Optional[str], content_type: Optional[str]
+) -> Optional[str]:
+    """
+    파일명 확장자 또는 Content-Type으로 가져오기 형식을 판별합니다.
+
+    Args:
+        filename: 업로드 파일명
+        content_type: 업로드 파일의 Content-Type
+
+    Returns:
+        Optional[str]: 'csv' 또는 'ndjson' (판별 불가 시 None)
+    """
+    if filename:
+        lowered = filename.lower()
+        for extension, fmt in EXTENSION_FORMATS.items():
+            if lowered.endswith(extension):
+                return fmt
+    if content_type:
+        return CONTENT_TYPE_FORMATS.get(content_type.split(";")[0].strip().lower())
+    return None
+
+
+def _iter_csv_rows(text: IO[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    CSV 스트림을 헤더 기준 딕셔너리로 한 줄씩 반환합니다.
+
+    빈 값은 누락된 것으로 간주하여 스키마 기본값이 적용되도록 제거합니다.
+    """
+    reader = csv.DictReader(text)
+    for record in reader:
+        row = {
+            key.strip(): value
+            for key, value in record.items()
+            if key is not None and value not in (None, "")
+        }
+        yield reader.line_num, row
+
+
+def _iter_ndjson_rows(
+    text: IO[str],
+) -> Iterator[Tuple[int, Union[Dict[str, Any], ImportRowError]]]:
+    """NDJSON 스트림을 한 줄씩 JSON 객체로 반환합니다. 빈 줄은 건너뜁니다."""
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, ImportRowError(f"JSON 파싱 실패: {e.msg}")
+            continue
+        if not isinstance(row, dict):
+            yield line_number, ImportRowError("각 줄은 JSON 객체여야 합니다.")
+            continue
+        yield line_number, row
+
+
+def iter_import_rows(
+    stream: IO[bytes], fmt: str
+) -> Iterator[Tuple[int, Union[Dict[str, Any], ImportRowError]]]:
+    """
+    업로드 스트림을 한 줄씩 파싱하여 (줄 번호, 행 또는 오류)를 반환합니다.
+
+    UTF-8(BOM 허용)로 디코딩하며, 디코딩에 실패하면 해당 위치에서
+    오류를 반환하고 파싱을 중단합니다.
+
+    Args:
+        stream: 업로드 파일의 바이너리 스트림
+        fmt: 가져오기 형식 ('csv' 또는 'ndjson')
+
+    Yields:
+        Tuple[int, Union[dict, ImportRowError]]: 줄 번호와 파싱된 행 또는 오류
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    rows = _iter_csv_rows(text) if fmt == "csv" else _iter_ndjson_rows(text)
+    line_number = 0
+    try:
+        for line_number, row in rows:
+            yield line_number, row
+    except (UnicodeDecodeError, csv.Error) as e:
+        yield line_number + 1, ImportRowError(f"파일을 읽을 수 없습니다: {e}")
+    finally:
+        # 업로드 스트림은 FastAPI가 닫으므로 래퍼만 분리
+        text.detach()
@@ -0,0 +1,199 @@
+"""
+저장소 카탈로그 탐색 트리 모듈
+
+저장소 → 연도 → 월 → 활동 계층과 노드별 카탈로그 수를 메모리에 유지합니다.
+첫 조회 시 한 번 구성하고, 카탈로그 생성/수정/삭제 시 해당 항목만 반영합니다.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import sessionmaker
+
+from database import SessionLocal
+from models.storage_catalog import StorageCatalog
+from schemas.storage_catalog import StorageCatalogResponse
+
+# 트리 계층 (루트부터 순서대로, 마지막 계층의 자식은 활동)
+TREE_LEVELS = ("storage", "year", "month")
+
+
+class TreeNode:
+    """
+    탐색 트리 노드
+
+    월 노드의 자식은 카탈로그 ID -> 카탈로그 응답이고,
+    그 외 노드의 자식은 하위 계층 값 -> TreeNode입니다.
+
+    Attributes:
+        count: 하위 카탈로그 수
+        children: 자식 노드 (또는 카탈로그)
+    """
+
+    __slots__ = ("count", "children", "_order")
+
+    def __init__(self):
+        self.count = 0
+        self.children: Dict[Any, Any] = {}
+        self._order: Optional[List[Any]] = None
+
+    def changed(self) -> None:
+        """자식 구성이 바뀌었음을 표시합니다. (정렬 순서 재계산)"""
+        self._order = None
+
+    def ordered_keys(self, leaf: bool) -> List[Any]:
+        """
+        자식 키를 정렬하여 반환합니다. (자식이 바뀌기 전까지 재사용)
+
+        계층 노드는 값 오름차순(미지정은 마지막), 활동은 활동명/ID순입니다.
+        """
+        if self._order is None:
+            if leaf:
+                self._order = sorted(
+                    self.children,
+                    key=lambda key: (self.children[key].activity_name, key),
+                )
+            else:
+                self._order = sorted(self.children, key=lambda key: (key is None, key))
+        return self._order
+
+
+class StorageCatalogTree:
+    """
+    저장소 카탈로그 탐색 트리
+
+    트리는 프로세스 단위이므로 워커가 여러 개인 경우 각 워커가 따로 보관하며,
+    다른 워커의 쓰기는 반영되지 않습니다. (facet 캐시와 동일)
+    조회와 반영은 하나의 잠금으로 직렬화합니다.
+
+    Attributes:
+        loaded: 트리 구성 완료 여부
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self.loaded = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self._root = TreeNode()
+        self._locations: Dict[int, Tuple[Any, ...]] = {}
+
+    def build(self) -> int:
+        """
+        카탈로그 전체를 읽어 트리를 구성합니다.
+
+        Returns:
+            int: 트리에 담긴 카탈로그 수
+        """
+        with self._lock:
+            self._build()
+            return self._root.count
+
+    def _build(self) -> None:
+        db = self._session_factory()
+        try:
+            self._reset()
+            for catalog in db.query(StorageCatalog).yield_per(1000):
+                self._add(StorageCatalogResponse.model_validate(catalog))
+        finally:
+            db.close()
+        self.loaded = True
+
+    def invalidate(self) -> None:
+        """트리를 버립니다. (다음 조회 시 다시 구성)"""
+        with self._lock:
+            self.loaded = False
+            self._reset()
+
+    def upsert(self, catalog: StorageCatalog) -> None:
+        """생성/수정된 카탈로그를 반영합니다. (트리가 구성되지 않았으면 무시)"""
+        item = StorageCatalogResponse.model_validate(catalog)
+        with self._lock:
+            if not self.loaded:
+                return
+            self._remove(item.id)
+            self._add(item)
+
+    def remove(self, catalog_id: int) -> None:
+        """삭제된 카탈로그를 반영합니다. (트리가 구성되지 않았으면 무시)"""
+        with self._lock:
+            if self.loaded:
+                self._remove(catalog_id)
+
+    def _add(self, item: StorageCatalogResponse) -> None:
+        path = tuple(getattr(item, level) for level in TREE_LEVELS)
+        node = self._root
+        node.count += 1
+        for value in path:
+            child = node.children.get(value)
+            if child is None:
+                child = node.children[value] = TreeNode()
+                node.changed()
+            child.count += 1
+            node = child
+        node.children[item.id] = item
+        node.changed()
+        self._locations[item.id] = path
+
+    def _remove(self, catalog_id: int) -> None:
+        path = self._locations.pop(catalog_id, None)
+        if path is None:
+            return
+        nodes = [self._root]
+        for value in path:
+            nodes.append(nodes[-1].children[value])
+        del nodes[-1].children[catalog_id]
+        nodes[-1].changed()
+        for node in nodes:
+            node.count -= 1
+        # 비게 된 노드는 부모에서 제거
+        for parent, value, node in zip(nodes, path, nodes[1:]):
+            if node.count == 0:
+                del parent.children[value]
+                parent.changed()
+                break
+
+    def get_subtree(
+        self, path: Tuple[Any, ...], skip: int, limit: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        경로에 해당하는 노드와 자식 한 페이지를 조회합니다.
+
+        Args:
+            path: 루트부터의 노드 값 (storage, year, month 순서의 앞부분)
+            skip: 건너뛸 자식 수
+            limit: 조회할 자식 수
+
+        Returns:
+            Optional[Dict[str, Any]]: StorageCatalogTreeResponse 필드 (경로가 없으면 None)
+        """
+        with self._lock:
+            if not self.loaded:
+                self._build()
+            node = self._root
+            for value in path:
+                node = node.children.get(value)
+                if node is None:
+                    return None
+
+            leaf = len(path) == len(TREE_LEVELS)
+            keys = node.ordered_keys(leaf)[skip : skip + limit]
+            result = {
+                "level": (("root",) + TREE_LEVELS)[len(path)],
+                "count": node.count,
+                "child_level": "activity" if leaf else TREE_LEVELS[len(path)],
+                "total_children": len(node.children),
+            }
+            if leaf:
+                result["activities"] = [node.children[key] for key in keys]
+            else:
+                result["children"] = [
+                    {"value": key, "count": node.children[key].count} for key in keys
+                ]
+            return result
+
+
+# 저장소 카탈로그 탐색 트리 (첫 조회 시 구성, 카탈로그 쓰기 시 반영)
+storage_catalog_tree = StorageCatalogTree(SessionLocal)
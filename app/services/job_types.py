@@ -0,0 +1,279 @@
+"""
+백그라운드 작업 종류 모듈
+
+POST /jobs로 요청할 수 있는 작업 종류와 실행 함수를 정의합니다.
+"""
+
+import csv
+import json
+from typing import IO, Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import SessionLocal, WriteSessionLocal, desc_nulls_last
+from models.backup_status import BackupStatus
+from models.storage_catalog import StorageCatalog
+from schemas.backup_status import BackupStatusListResponse, BackupStatusSummaryResponse
+from schemas.storage_catalog import StorageCatalogResponse
+from services.backup_archive import archive_deleted_backups, count_archivable_backups
+from services.backup_list import (
+    backup_progress_columns,
+    build_backup_list_responses,
+    query_backup_list,
+)
+from services.jobs import JobContext, JobRunner, JobType
+
+settings = get_settings()
+
+# 내보내기 시 한 번에 조회할 행 수
+EXPORT_CHUNK_SIZE = 1000
+
+# 내보내기 형식 -> Content-Type
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+class ExportParams(BaseModel):
+    """내보내기 작업 파라미터"""
+
+    format: Literal["csv", "ndjson"] = Field("csv", description="파일 형식")
+
+
+class BackupArchiveParams(BaseModel):
+    """아카이브 작업 파라미터 (미지정 시 설정값 사용)"""
+
+    retention_days: Optional[int] = Field(None, ge=0, description="보존 기간 (일)")
+    batch_size: Optional[int] = Field(
+        None, ge=1, le=10000, description="트랜잭션당 이동할 행 수"
+    )
+
+
+def write_export_rows(
+    file: IO[str],
+    fmt: str,
+    columns: List[str],
+    rows: List[Dict[str, Any]],
+    header: bool,
+) -> None:
+    """
+    내보내기 행을 CSV 또는 NDJSON으로 씁니다.
+
+    CSV에서 리스트 값은 쉼표로 이어 붙입니다.
+
+    Args:
+        file: 출력 파일
+        fmt: 'csv' 또는 'ndjson'
+        columns: 출력 컬럼 순서
+        rows: JSON 호환 값으로 변환된 행 목록
+        header: CSV 헤더 출력 여부
+    """
+    if fmt == "ndjson":
+        for row in rows:
+            file.write(json.dumps(row, ensure_ascii=False))
+            file.write("\n")
+        return
+
+    writer = csv.DictWriter(file, fieldnames=columns)
+    if header:
+        writer.writeheader()
+    for row in rows:
+        writer.writerow(
+            {
+                key: ",".join(value) if isinstance(value, list) else value
+                for key, value in row.items()
+            }
+        )
+
+
+def export_backup_statuses(
+    db: Session, params: ExportParams, context: JobContext
+) -> Dict[str, Any]:
+    """
+    삭제되지 않은 백업 상태 전체를 목록 조회와 같은 형태로 내보냅니다.
+
+    ID 기준 keyset 페이지네이션으로 EXPORT_CHUNK_SIZE씩 조회하고,
+    청크마다 identity map을 비워 메모리 사용량을 일정하게 유지합니다.
+    """
+    context.set_total(
+        db.query(BackupStatus.id).filter(BackupStatus.deleted == False).count()
+    )
+    columns = list(BackupStatusListResponse.model_fields)
+    path = context.result_file(
+        f"backup_status_{context.job_id}.{params.format}",
+        EXPORT_MEDIA_TYPES[params.format],
+    )
+
+    last_id = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        while True:
+            results = (
+                query_backup_list(db)
+                .filter(BackupStatus.deleted == False, BackupStatus.id > last_id)
+                .order_by(BackupStatus.id)
+                .limit(EXPORT_CHUNK_SIZE)
+                .all()
+            )
+            if not results:
+                break
+            items = build_backup_list_responses(db, results)
+            write_export_rows(
+                file,
+                params.format,
+                columns,
+                [item.model_dump(mode="json") for item in items],
+                header=last_id == 0,
+            )
+            last_id = items[-1].id
+            context.advance(len(items))
+            db.expunge_all()
+
+    return {"rows": context.processed}
+
+
+def export_backup_summary(
+    db: Session, params: ExportParams, context: JobContext
+) -> Dict[str, Any]:
+    """
+    삭제되지 않은 백업 상태 전체의 이벤트별 진행 요약을 다시 집계해 내보냅니다.
+
+    GET /backup-status/events와 같은 집계(필터 없음)를 한 번의 쿼리로 계산하고,
+    이벤트는 가장 늦은 표시 날짜 기준 최신순으로 씁니다.
+    """
+    progress_columns = backup_progress_columns()
+    groups = (
+        db.query(BackupStatus.event_name, *progress_columns)
+        .filter(BackupStatus.deleted == False)
+        .group_by(BackupStatus.event_name)
+        .order_by(desc_nulls_last(progress_columns[-1]), BackupStatus.event_name)
+        .all()
+    )
+    context.set_total(len(groups))
+    columns = ["event_name", *BackupStatusSummaryResponse.model_fields]
+    path = context.result_file(
+        f"backup_summary_{context.job_id}.{params.format}",
+        EXPORT_MEDIA_TYPES[params.format],
+    )
+
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        write_export_rows(
+            file,
+            params.format,
+            columns,
+            [
+                {
+                    "event_name": row.event_name,
+                    **BackupStatusSummaryResponse(**row._mapping).model_dump(
+                        mode="json"
+                    ),
+                }
+                for row in groups
+            ],
+            header=True,
+        )
+    context.advance(len(groups))
+
+    return {"events": len(groups)}
+
+
+def export_storage_catalogs(
+    db: Session, params: ExportParams, context: JobContext
+) -> Dict[str, Any]:
+    """
+    저장소 카탈로그 전체를 내보냅니다.
+
+    가져오기(POST /storage-catalogs/import)와 같은 컬럼명을 사용합니다.
+    """
+    context.set_total(db.query(StorageCatalog.id).count())
+    columns = list(StorageCatalogResponse.model_fields)
+    path = context.result_file(
+        f"storage_catalog_{context.job_id}.{params.format}",
+        EXPORT_MEDIA_TYPES[params.format],
+    )
+
+    last_id = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        while True:
+            catalogs = (
+                db.query(StorageCatalog)
+                .filter(StorageCatalog.id > last_id)
+                .order_by(StorageCatalog.id)
+                .limit(EXPORT_CHUNK_SIZE)
+                .all()
+            )
+            if not catalogs:
+                break
+            write_export_rows(
+                file,
+                params.format,
+                columns,
+                [
+                    StorageCatalogResponse.model_validate(catalog).model_dump(
+                        mode="json"
+                    )
+                    for catalog in catalogs
+                ],
+                header=last_id == 0,
+            )
+            last_id = catalogs[-1].id
+            context.advance(len(catalogs))
+            db.expunge_all()
+
+    return {"rows": context.processed}
+
+
+def run_backup_archive(
+    db: Session, params: BackupArchiveParams, context: JobContext
+) -> Dict[str, Any]:
+    """
+    보존 기간이 지난 소프트 삭제 백업 상태를 아카이브합니다.
+
+    배치마다 커밋하므로 중단되어도 다음 실행에서 남은 항목을 이어서 처리합니다.
+    """
+    retention_days = (
+        params.retention_days
+        if params.retention_days is not None
+        else settings.backup_archive_retention_days
+    )
+    batch_size = params.batch_size or settings.backup_archive_batch_size
+
+    total = count_archivable_backups(db, retention_days)
+    # 진행률 기록 전에 트랜잭션을 끝내 SQLite 쓰기 잠금을 반납
+    db.commit()
+    context.set_total(total)
+    while True:
+        archived = archive_deleted_backups(
+            db, retention_days, batch_size, max_batches=1
+        )
+        if not archived:
+            break
+        context.advance(archived)
+
+    return {"archived": context.processed, "retention_days": retention_days}
+
+
+# 작업 종류 레지스트리
+JOB_TYPES: Dict[str, JobType] = {
+    job_type.name: job_type
+    for job_type in (
+        JobType("backup_status_export", ExportParams, export_backup_statuses),
+        JobType("backup_summary", ExportParams, export_backup_summary),
+        JobType("storage_catalog_export", ExportParams, export_storage_catalogs),
+        JobType("backup_archive", BackupArchiveParams, run_backup_archive, writes=True),
+    )
+}
+
+# 백그라운드 작업 실행기 (lifespan 또는 commands.run_jobs에서 시작)
+job_runner = JobRunner(
+    SessionLocal,
+    WriteSessionLocal,
+    JOB_TYPES,
+    workers=settings.job_workers,
+    poll_interval=settings.job_poll_interval_ms / 1000,
+    stale_seconds=settings.job_stale_seconds,
+    max_attempts=settings.job_max_attempts,
+    result_dir=settings.job_result_dir,
+)
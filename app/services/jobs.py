@@ -0,0 +1,435 @@
+"""
+백그라운드 작업 실행 모듈
+
+jobs 테이블을 작업 큐로 사용하여, 외부 브로커 없이
+제한된 수의 워커 스레드로 오래 걸리는 작업을 실행합니다.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Type
+
+from pydantic import BaseModel
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# 진행률을 DB에 반영하는 최소 간격 (초)
+PROGRESS_FLUSH_SECONDS = 1.0
+
+
+class JobInterrupted(Exception):
+    """서버 종료로 실행 중인 작업을 중단할 때 발생하는 예외"""
+
+
+@dataclass
+class JobType:
+    """
+    작업 종류 정의
+
+    Attributes:
+        name: 작업 종류 이름
+        params_model: 파라미터 검증용 Pydantic 모델
+        handler: 작업 함수 (db, params, context) -> 결과 요약 dict 또는 None
+        writes: 작업이 데이터를 변경하는지 여부 (쓰기 세션 사용)
+    """
+
+    name: str
+    params_model: Type[BaseModel]
+    handler: Callable[[Session, Any, "JobContext"], Optional[Dict[str, Any]]]
+    writes: bool = False
+
+
+class JobContext:
+    """
+    작업 함수에 전달되는 실행 컨텍스트
+
+    진행률 보고와 결과 파일 경로를 제공합니다.
+    진행률은 PROGRESS_FLUSH_SECONDS 간격으로만 DB에 반영하며,
+    서버 종료 중이면 advance()에서 JobInterrupted를 발생시켜 작업을 대기 상태로 되돌립니다.
+    """
+
+    def __init__(self, runner: "JobRunner", job_id: int):
+        self.job_id = job_id
+        self.processed = 0
+        self.total: Optional[int] = None
+        self.result_path: Optional[Path] = None
+        self.result_filename: Optional[str] = None
+        self.result_media_type: Optional[str] = None
+        self._runner = runner
+        self._last_flush = 0.0
+
+    def set_total(self, total: int) -> None:
+        """전체 항목 수를 설정합니다."""
+        self.total = total
+        self._flush()
+
+    def advance(self, count: int = 1) -> None:
+        """
+        처리한 항목 수를 늘립니다.
+
+        Raises:
+            JobInterrupted: 서버가 종료 중인 경우
+        """
+        self.processed += count
+        if self._runner.stopping:
+            raise JobInterrupted(self.job_id)
+        if time.monotonic() - self._last_flush >= PROGRESS_FLUSH_SECONDS:
+            self._flush()
+
+    def result_file(self, filename: str, media_type: str) -> Path:
+        """
+        결과 파일을 쓸 경로를 반환합니다. (작업이 성공해야 다운로드 가능)
+
+        Args:
+            filename: 다운로드 파일명
+            media_type: 결과 파일 Content-Type
+
+        Returns:
+            Path: 결과 파일 경로
+        """
+        directory = self._runner.result_dir / str(self.job_id)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.result_path = directory / filename
+        self.result_filename = filename
+        self.result_media_type = media_type
+        return self.result_path
+
+    @property
+    def stored_result_path(self) -> Optional[str]:
+        """
+        DB에 저장할 결과 파일 경로 (결과 디렉토리 기준 상대 경로)
+
+        API 서버와 워커가 같은 저장소를 서로 다른 경로에 마운트해도 찾을 수 있도록
+        절대 경로 대신 저장합니다. (JobRunner.resolve_result_path로 복원)
+        """
+        if self.result_path is None:
+            return None
+        return self.result_path.relative_to(self._runner.result_dir).as_posix()
+
+    def _flush(self) -> None:
+        """현재 진행률을 DB에 반영합니다."""
+        self._last_flush = time.monotonic()
+        self._runner.update_job(
+            self.job_id, {"processed": self.processed, "total": self.total}
+        )
+
+
+class JobRunner:
+    """
+    DB 기반 백그라운드 작업 실행기
+
+    작업 상태 갱신과 데이터를 변경하는 작업은 쓰기 세션을, 내보내기 등 읽기 작업은
+    읽기 세션을 사용합니다. (SQLite에서 긴 읽기 작업이 쓰기 잠금을 잡지 않도록)
+    워커 스레드는 대기(queued) 작업을 조건부 UPDATE로 선점하므로
+    여러 프로세스가 같은 테이블을 사용해도 한 작업은 한 워커만 실행합니다.
+    모니터 스레드는 실행 중인 작업의 heartbeat_at을 갱신하고,
+    stale_seconds 동안 갱신되지 않은 작업(프로세스 종료 등)을 다시 대기 상태로 되돌립니다.
+    max_attempts번 시도한 작업은 실패로 처리합니다.
+
+    Attributes:
+        workers: 워커 스레드 수
+        poll_interval: 대기 작업 확인 간격 (초)
+        stale_seconds: 중단된 작업으로 판단하는 시간 (초)
+        max_attempts: 최대 실행 시도 횟수
+        result_dir: 결과 파일 저장 디렉토리
+        worker_id: 이 프로세스의 워커 식별자
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        write_session_factory: Callable[[], Session],
+        job_types: Dict[str, JobType],
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        stale_seconds: int = 120,
+        max_attempts: int = 3,
+        result_dir: str = "job_results",
+    ):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.stale_seconds = stale_seconds
+        self.max_attempts = max_attempts
+        self.result_dir = Path(result_dir).resolve()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._session_factory = session_factory
+        self._write_session_factory = write_session_factory
+        self._job_types = job_types
+        self._threads = []
+        self._active: Set[int] = set()
+        self._active_lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    def resolve_result_path(self, result_path: str) -> Path:
+        """
+        저장된 결과 파일 경로를 이 프로세스의 결과 디렉토리 기준 경로로 바꿉니다.
+
+        이전에 저장된 절대 경로는 그대로 반환합니다.
+
+        Args:
+            result_path: jobs.result_path 값
+
+        Returns:
+            Path: 결과 파일 경로
+        """
+        return self.result_dir / result_path
+
+    @property
+    def running(self) -> bool:
+        """워커 스레드가 실행 중인지 여부"""
+        return any(thread.is_alive() for thread in self._threads)
+
+    @property
+    def stopping(self) -> bool:
+        """종료 요청 여부"""
+        return self._stopping.is_set()
+
+    def start(self) -> None:
+        """중단된 작업을 복구하고 워커/모니터 스레드를 시작합니다."""
+        if self.running or self.workers <= 0:
+            return
+        self._stopping.clear()
+        self.recover_stale_jobs()
+        self._threads = [
+            threading.Thread(
+                target=self._worker_loop, name=f"job-worker-{index}", daemon=True
+            )
+            for index in range(self.workers)
+        ]
+        self._threads.append(
+            threading.Thread(target=self._monitor_loop, name="job-monitor", daemon=True)
+        )
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        워커 스레드를 종료합니다.
+
+        실행 중인 작업은 다음 진행률 보고 시점에 중단되어 대기 상태로 돌아가며,
+        timeout 안에 끝나지 않은 작업은 다음 시작 시 heartbeat 기준으로 복구됩니다.
+        """
+        if not self.running:
+            return
+        self._stopping.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+
+    def update_job(self, job_id: int, values: Dict[str, Any]) -> None:
+        """
+        이 워커가 실행 중인 작업의 컬럼을 갱신합니다.
+
+        Args:
+            job_id: 작업 ID
+            values: 갱신할 컬럼 값
+        """
+        db = self._write_session_factory()
+        try:
+            db.execute(
+                update(Job)
+                .where(
+                    Job.id == job_id,
+                    Job.status == JOB_RUNNING,
+                    Job.worker_id == self.worker_id,
+                )
+                .values(**values)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def recover_stale_jobs(self) -> int:
+        """
+        heartbeat가 끊긴 실행 중 작업을 다시 대기 상태로 되돌립니다.
+
+        시도 횟수가 max_attempts에 도달한 작업은 실패로 처리합니다.
+
+        Returns:
+            int: 복구(또는 실패 처리)된 작업 수
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.stale_seconds)
+        stale = (
+            Job.status == JOB_RUNNING,
+            or_(Job.heartbeat_at.is_(None), Job.heartbeat_at < cutoff),
+        )
+        db = self._write_session_factory()
+        try:
+            failed = db.execute(
+                update(Job)
+                .where(*stale, Job.attempts >= self.max_attempts)
+                .values(
+                    status=JOB_FAILED,
+                    worker_id=None,
+                    error="작업이 반복해서 중단되어 실패로 처리되었습니다.",
+                    finished_at=datetime.utcnow(),
+                )
+            ).rowcount
+            requeued = db.execute(
+                update(Job).where(*stale).values(status=JOB_QUEUED, worker_id=None)
+            ).rowcount
+            db.commit()
+        finally:
+            db.close()
+        if failed or requeued:
+            logger.warning(
+                "중단된 작업 복구: 재대기 %d건, 실패 처리 %d건", requeued, failed
+            )
+        return failed + requeued
+
+    def _claim(self) -> Optional[Job]:
+        """
+        가장 오래된 대기 작업 하나를 선점합니다.
+
+        조건부 UPDATE의 영향 행 수로 선점 여부를 판단하므로
+        다른 워커와 경쟁해도 같은 작업을 두 번 실행하지 않습니다.
+
+        Returns:
+            Optional[Job]: 선점한 작업 (없으면 None)
+        """
+        db = self._write_session_factory()
+        try:
+            while True:
+                job_id = (
+                    db.query(Job.id)
+                    .filter(Job.status == JOB_QUEUED)
+                    .order_by(Job.id)
+                    .limit(1)
+                    .scalar()
+                )
+                if job_id is None:
+                    return None
+
+                now = datetime.utcnow()
+                claimed = db.execute(
+                    update(Job)
+                    .where(Job.id == job_id, Job.status == JOB_QUEUED)
+                    .values(
+                        status=JOB_RUNNING,
+                        worker_id=self.worker_id,
+                        attempts=Job.attempts + 1,
+                        processed=0,
+                        started_at=now,
+                        heartbeat_at=now,
+                        error=None,
+                    )
+                ).rowcount
+                db.commit()
+                if claimed:
+                    job = db.get(Job, job_id)
+                    db.expunge(job)
+                    return job
+        finally:
+            db.close()
+
+    def _worker_loop(self) -> None:
+        """대기 작업을 선점하여 실행하는 워커 루프"""
+        while not self._stopping.is_set():
+            try:
+                job = self._claim()
+            except Exception:
+                logger.exception("대기 작업 선점에 실패했습니다.")
+                job = None
+            if job is None:
+                self._stopping.wait(self.poll_interval)
+                continue
+            self._execute(job)
+
+    def _monitor_loop(self) -> None:
+        """실행 중인 작업의 heartbeat를 갱신하고 중단된 작업을 복구하는 루프"""
+        interval = max(1.0, self.stale_seconds / 3)
+        while not self._stopping.wait(interval):
+            try:
+                with self._active_lock:
+                    active = list(self._active)
+                if active:
+                    db = self._write_session_factory()
+                    try:
+                        db.execute(
+                            update(Job)
+                            .where(Job.id.in_(active), Job.worker_id == self.worker_id)
+                            .values(heartbeat_at=datetime.utcnow())
+                        )
+                        db.commit()
+                    finally:
+                        db.close()
+                self.recover_stale_jobs()
+            except Exception:
+                logger.exception("작업 heartbeat 갱신에 실패했습니다.")
+
+    def _execute(self, job: Job) -> None:
+        """선점한 작업을 실행하고 결과를 기록합니다."""
+        with self._active_lock:
+            self._active.add(job.id)
+        context = JobContext(self, job.id)
+        job_type = self._job_types.get(job.job_type)
+        if job_type is not None and job_type.writes:
+            db = self._write_session_factory()
+        else:
+            db = self._session_factory()
+        try:
+            if job_type is None:
+                raise ValueError(f"알 수 없는 작업 종류입니다: {job.job_type}")
+            params = job_type.params_model.model_validate(job.params or {})
+
+            result = job_type.handler(db, params, context)
+            # 작업 세션의 트랜잭션을 끝낸 뒤 결과를 기록 (SQLite 쓰기 잠금 반납)
+            db.commit()
+
+            self.update_job(
+                job.id,
+                {
+                    "status": JOB_SUCCEEDED,
+                    "processed": context.processed,
+                    "total": context.total,
+                    "result": result,
+                    "result_path": context.stored_result_path,
+                    "result_filename": context.result_filename,
+                    "result_media_type": context.result_media_type,
+                    "finished_at": datetime.utcnow(),
+                },
+            )
+        except JobInterrupted:
+            # 서버 종료로 중단된 작업은 시도 횟수에 포함하지 않고 대기 상태로 되돌림
+            db.rollback()
+            self.update_job(
+                job.id,
+                {
+                    "status": JOB_QUEUED,
+                    "worker_id": None,
+                    "attempts": Job.attempts - 1,
+                },
+            )
+        except Exception as e:
+            db.rollback()
+            logger.exception("작업 %d 실행에 실패했습니다.", job.id)
+            self.update_job(
+                job.id,
+                {
+                    "status": JOB_FAILED,
+                    "processed": context.processed,
+                    "error": str(e)[:2000],
+                    "finished_at": datetime.utcnow(),
+                },
+            )
+        finally:
+            db.close()
+            with self._active_lock:
+                self._active.discard(job.id)
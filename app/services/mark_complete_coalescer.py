@@ -0,0 +1,228 @@
+"""
+백업 완료 표시 쓰기 병합 모듈
+
+짧은 시간 동안 들어온 mark-complete 요청을 모아
+하나의 트랜잭션으로 일괄 반영합니다.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import WriteSessionLocal
+from models.backup_status import BackupStatus
+from schemas.backup_status import BackupStatusResponse
+from services.audit import audit_recorder, stage_change_entries
+
+settings = get_settings()
+
+# mark-complete로 변경할 수 있는 단계/확인자 필드
+STAGE_FIELDS = (
+    "cam",
+    "cam_checker",
+    "master",
+    "master_checker",
+    "clean",
+    "clean_checker",
+    "final_product",
+    "final_product_checker",
+)
+
+
+class BackupStatusNotFoundError(Exception):
+    """대상 백업 상태가 없거나 삭제된 경우 발생하는 예외"""
+
+
+def apply_stage_changes(
+    backup: BackupStatus, changes: Dict[str, Any]
+) -> List[Tuple[str, Any, Any]]:
+    """
+    백업 상태에 단계별 완료/확인자 변경을 적용합니다. (None 값은 무시)
+
+    Args:
+        backup: 변경할 백업 상태 객체
+        changes: 필드명 -> 값 (STAGE_FIELDS 중 일부)
+
+    Returns:
+        List[Tuple[str, Any, Any]]: 실제로 값이 바뀐 (필드명, 변경 전 값, 변경 후 값) 목록
+    """
+    diffs = []
+    for name in STAGE_FIELDS:
+        value = changes.get(name)
+        if value is not None:
+            old = getattr(backup, name)
+            setattr(backup, name, value)
+            if old != value:
+                diffs.append((name, old, value))
+    return diffs
+
+
+@dataclass
+class PendingMarkComplete:
+    """병합 대기 중인 mark-complete 요청"""
+
+    backup_id: int
+    changes: Dict[str, Any]
+    future: Future = field(default_factory=Future)
+    diffs: List[Tuple[str, Any, Any]] = field(default_factory=list)
+
+
+class MarkCompleteCoalescer:
+    """
+    mark-complete 쓰기 병합기
+
+    요청 스레드는 submit()으로 변경 사항을 넣고 Future로 결과를 기다립니다.
+    워커 스레드는 첫 요청이 들어온 뒤 window_ms 동안(또는 max_batch개까지) 요청을 모아
+    한 번의 SELECT ... IN과 한 번의 커밋으로 반영합니다.
+    요청마다 SAVEPOINT를 사용하므로, 한 요청의 실패가 같은 배치의 다른 요청에
+    영향을 주지 않고 각 호출자는 자신의 결과나 예외를 받습니다.
+
+    Attributes:
+        window_ms: 요청을 모으는 시간 (밀리초)
+        max_batch: 배치당 최대 요청 수
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        window_ms: int = 5,
+        max_batch: int = 200,
+    ):
+        self.window_ms = window_ms
+        self.max_batch = max_batch
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[PendingMarkComplete]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """워커 스레드가 실행 중인지 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """워커 스레드를 시작합니다."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="mark-complete-coalescer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """대기 중인 요청을 모두 처리한 뒤 워커 스레드를 종료합니다."""
+        if not self.running:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, backup_id: int, changes: Dict[str, Any]) -> Future:
+        """
+        mark-complete 요청을 병합 대기열에 넣습니다.
+
+        Args:
+            backup_id: 백업 상태 ID
+            changes: 변경할 단계/확인자 필드 (None 값은 무시)
+
+        Returns:
+            Future: BackupStatusResponse 또는 예외(BackupStatusNotFoundError 등)
+        """
+        if not self.running:
+            raise RuntimeError("mark-complete 병합기가 실행 중이 아닙니다.")
+        pending = PendingMarkComplete(backup_id=backup_id, changes=changes)
+        self._queue.put(pending)
+        return pending.future
+
+    def _run(self) -> None:
+        """요청을 모아 배치로 처리하는 워커 루프"""
+        while not (self._stopping.is_set() and self._queue.empty()):
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.window_ms / 1000
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._process(batch)
+
+    def _process(self, batch: List[PendingMarkComplete]) -> None:
+        """한 배치를 하나의 트랜잭션으로 반영하고 각 Future에 결과를 전달합니다."""
+        db = self._session_factory()
+        applied: List[PendingMarkComplete] = []
+        try:
+            backup_ids = {pending.backup_id for pending in batch}
+            backups = {
+                backup.id: backup
+                for backup in db.query(BackupStatus)
+                .filter(BackupStatus.id.in_(backup_ids), BackupStatus.deleted == False)
+                .all()
+            }
+
+            for pending in batch:
+                backup = backups.get(pending.backup_id)
+                if backup is None:
+                    pending.future.set_exception(
+                        BackupStatusNotFoundError(pending.backup_id)
+                    )
+                    continue
+                try:
+                    with db.begin_nested():
+                        pending.diffs = apply_stage_changes(backup, pending.changes)
+                except SQLAlchemyError as e:
+                    pending.future.set_exception(e)
+                    continue
+                applied.append(pending)
+
+            db.commit()
+
+            for pending in applied:
+                audit_recorder.record(
+                    stage_change_entries(
+                        pending.backup_id, pending.diffs, pending.changes
+                    )
+                )
+
+            # 커밋 후 만료된 객체를 한 번의 쿼리로 다시 로드
+            refreshed = {
+                backup.id: backup
+                for backup in db.query(BackupStatus)
+                .filter(BackupStatus.id.in_({p.backup_id for p in applied}))
+                .all()
+            }
+            for pending in applied:
+                pending.future.set_result(
+                    BackupStatusResponse.model_validate(refreshed[pending.backup_id])
+                )
+        except Exception as e:
+            db.rollback()
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+        finally:
+            db.close()
+
+
+# mark-complete 쓰기 병합기 (MARK_COMPLETE_COALESCING이 켜진 경우 lifespan에서 시작)
+mark_complete_coalescer = MarkCompleteCoalescer(
+    WriteSessionLocal,
+    window_ms=settings.mark_complete_coalesce_window_ms,
+    max_batch=settings.mark_complete_coalesce_max_batch,
+)
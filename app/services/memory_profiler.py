@@ -0,0 +1,250 @@
+"""
+메모리 프로파일링 모듈
+
+tracemalloc으로 라우트별 요청 처리 중 최대 할당량(peak)과 할당 위치 상위 항목을 집계하고,
+현재 열린 ORM 세션의 identity map 크기를 보고합니다.
+관리 API(/admin/memory)로 실행 중에 켜고 끌 수 있으며,
+꺼져 있을 때는 요청마다 tracemalloc.is_tracing() 확인만 합니다.
+"""
+
+import resource
+import sys
+import threading
+import tracemalloc
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# 할당 위치 집계에서 제외할 프레임 (프로파일러 자체와 import 시스템)
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+# 할당 위치 집계 기준 (tracemalloc.Snapshot.statistics의 key_type)
+GROUP_BY_OPTIONS = ("lineno", "filename", "traceback")
+
+
+@dataclass
+class RouteMemoryStats:
+    """라우트 하나의 요청별 최대 할당량 집계"""
+
+    requests: int = 0
+    peak_max_bytes: int = 0
+    peak_total_bytes: int = 0
+    last_peak_bytes: int = 0
+
+    def add(self, peak_bytes: int) -> None:
+        self.requests += 1
+        self.peak_max_bytes = max(self.peak_max_bytes, peak_bytes)
+        self.peak_total_bytes += peak_bytes
+        self.last_peak_bytes = peak_bytes
+
+
+def current_rss_bytes() -> Optional[int]:
+    """현재 프로세스의 RSS (Linux 외에는 None)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def max_rss_bytes() -> int:
+    """프로세스 시작 이후 최대 RSS (macOS는 바이트, Linux는 KB 단위로 보고됨)"""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class MemoryProfiler:
+    """
+    요청 메모리 프로파일러
+
+    요청 시작 시의 추적 메모리와 요청 중 최대 추적 메모리의 차이를 라우트별로 기록합니다.
+    tracemalloc의 최대값은 프로세스 전체 값이라, 처리 중인 다른 요청이 없을 때만 초기화합니다.
+    따라서 요청이 동시에 처리되면 다른 요청의 할당이 함께 잡힌 상한값이 됩니다.
+    (정확한 라우트별 값이 필요하면 동시 요청이 적을 때 측정)
+
+    ORM 세션은 프로파일링 중에 트랜잭션을 시작한 세션만 약한 참조로 추적합니다.
+
+    Attributes:
+        frames: 할당마다 저장하는 호출 스택 깊이
+    """
+
+    def __init__(self):
+        self.frames = 1
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._routes: Dict[str, RouteMemoryStats] = {}
+        self._sessions: "weakref.WeakSet[Session]" = weakref.WeakSet()
+        event.listen(Session, "after_begin", self._track_session)
+
+    @property
+    def enabled(self) -> bool:
+        """프로파일링 중인지 여부"""
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> None:
+        """
+        프로파일링을 시작합니다. (이미 실행 중이면 집계를 초기화하고 다시 시작)
+
+        Args:
+            frames: 할당마다 저장할 호출 스택 깊이 (클수록 느리고 메모리를 더 사용)
+        """
+        with self._lock:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self.frames = frames
+            self._routes.clear()
+            tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        """프로파일링을 멈추고 추적 데이터를 버립니다. (라우트별 집계는 유지)"""
+        with self._lock:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self._sessions.clear()
+
+    def reset(self) -> None:
+        """라우트별 집계와 최대 추적 메모리를 초기화합니다."""
+        with self._lock:
+            self._routes.clear()
+            if tracemalloc.is_tracing() and self._in_flight == 0:
+                tracemalloc.reset_peak()
+
+    def request_started(self) -> Optional[int]:
+        """
+        요청 처리 시작을 기록합니다.
+
+        Returns:
+            Optional[int]: 시작 시 추적 메모리 (프로파일링 중이 아니면 None)
+        """
+        if not tracemalloc.is_tracing():
+            return None
+        with self._lock:
+            if self._in_flight == 0:
+                tracemalloc.reset_peak()
+            self._in_flight += 1
+            return tracemalloc.get_traced_memory()[0]
+
+    def request_excluded(self) -> None:
+        """
+        측정하지 않을 요청(장시간 연결 등)을 처리 중 요청 수에서 뺍니다.
+
+        request_started가 값을 반환한 요청만 호출하며, 이후 request_finished는 호출하지 않습니다.
+        처리 중으로 남겨 두면 연결이 끝날 때까지 최대 추적 메모리가 초기화되지 않습니다.
+        """
+        with self._lock:
+            self._in_flight -= 1
+
+    def request_finished(self, route: str, started_bytes: int) -> None:
+        """
+        요청 처리 종료를 기록합니다. (request_started가 값을 반환한 요청만 호출)
+
+        Args:
+            route: "METHOD 라우트 경로 템플릿"
+            started_bytes: request_started가 반환한 값
+        """
+        with self._lock:
+            self._in_flight -= 1
+            if not tracemalloc.is_tracing():
+                return
+            peak = tracemalloc.get_traced_memory()[1]
+            stats = self._routes.setdefault(route, RouteMemoryStats())
+            stats.add(max(peak - started_bytes, 0))
+
+    def _track_session(self, session, transaction, connection) -> None:
+        if tracemalloc.is_tracing():
+            self._sessions.add(session)
+
+    def identity_maps(self) -> List[int]:
+        """추적 중인 세션 중 객체를 가진 세션의 identity map 크기 (큰 순서)"""
+        sizes = [len(session.identity_map) for session in list(self._sessions)]
+        return sorted((size for size in sizes if size), reverse=True)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        프로파일링 상태와 라우트별 집계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: MemoryProfileResponse 필드
+        """
+        traced = tracemalloc.get_traced_memory() if self.enabled else (0, 0)
+        with self._lock:
+            routes = [
+                {
+                    "route": route,
+                    "requests": stats.requests,
+                    "peak_max_bytes": stats.peak_max_bytes,
+                    "peak_avg_bytes": stats.peak_total_bytes // stats.requests,
+                    "last_peak_bytes": stats.last_peak_bytes,
+                }
+                for route, stats in self._routes.items()
+            ]
+        routes.sort(key=lambda row: row["peak_max_bytes"], reverse=True)
+        identity_maps = self.identity_maps()
+        return {
+            "enabled": self.enabled,
+            "frames": self.frames,
+            "traced_current_bytes": traced[0],
+            "traced_peak_bytes": traced[1],
+            "tracemalloc_overhead_bytes": (
+                tracemalloc.get_tracemalloc_memory() if self.enabled else 0
+            ),
+            "rss_bytes": current_rss_bytes(),
+            "max_rss_bytes": max_rss_bytes(),
+            "routes": routes,
+            "identity_map_sessions": len(identity_maps),
+            "identity_map_objects": sum(identity_maps),
+            "identity_map_sizes": identity_maps,
+        }
+
+    def top_allocations(self, group_by: str, limit: int) -> Dict[str, Any]:
+        """
+        현재 살아 있는 할당을 위치별로 묶어 크기 순으로 반환합니다.
+
+        스냅샷을 만드는 동안 다른 요청 처리가 멈추므로 필요할 때만 호출합니다.
+
+        Args:
+            group_by: 묶는 기준 (lineno, filename, traceback)
+            limit: 반환할 위치 수
+
+        Returns:
+            Dict[str, Any]: AllocationTopResponse 필드
+        """
+        # Traceback은 오래된 호출부터 정렬되어 있으므로 마지막 프레임이 할당 위치
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        statistics = snapshot.statistics(group_by)
+        return {
+            "group_by": group_by,
+            "total_bytes": sum(stat.size for stat in statistics),
+            "sites": [
+                {
+                    "site": (
+                        stat.traceback[-1].filename
+                        if group_by == "filename"
+                        else f"{stat.traceback[-1].filename}:{stat.traceback[-1].lineno}"
+                    ),
+                    "size_bytes": stat.size,
+                    "count": stat.count,
+                    "traceback": (
+                        [
+                            f"{frame.filename}:{frame.lineno}"
+                            for frame in reversed(stat.traceback)
+                        ]
+                        if group_by == "traceback"
+                        else None
+                    ),
+                }
+                for stat in statistics[:limit]
+            ],
+        }
+
+
+# 요청 메모리 프로파일러 (MEMORY_PROFILING 또는 관리 API로 시작)
+memory_profiler = MemoryProfiler()
@@ -0,0 +1,206 @@
+"""
+응답 형식 협상 모듈
+
+Accept / Accept-Encoding 헤더에 따라 목록 응답을
+JSON, 컬럼형 JSON, MessagePack 형식으로 인코딩하고 압축합니다.
+"""
+
+import gzip
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from config import get_settings
+from services.tracing import tracer
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+settings = get_settings()
+
+# 지원하는 미디어 타입
+MEDIA_JSON = "application/json"
+MEDIA_COLUMNAR = "application/vnd.ym.columnar+json"
+MEDIA_MSGPACK = "application/msgpack"
+
+# Accept 헤더 값 -> 응답 미디어 타입
+ACCEPT_MEDIA_TYPES = {
+    MEDIA_JSON: MEDIA_JSON,
+    MEDIA_COLUMNAR: MEDIA_COLUMNAR,
+    MEDIA_MSGPACK: MEDIA_MSGPACK,
+    "application/x-msgpack": MEDIA_MSGPACK,
+    "application/*": MEDIA_JSON,
+    "*/*": MEDIA_JSON,
+}
+
+
+def to_plain_rows(items: List[Any]) -> List[Any]:
+    """
+    응답 행을 JSON 호환 값(딕셔너리, 문자열 일시 등)으로 변환합니다.
+
+    Pydantic 모델은 jsonable_encoder보다 빠른 model_dump(mode="json")를 사용합니다.
+    """
+    return [
+        (
+            item.model_dump(mode="json")
+            if isinstance(item, BaseModel)
+            else jsonable_encoder(item)
+        )
+        for item in items
+    ]
+
+
+def encode_json(items: List[Any]) -> bytes:
+    """행 리스트를 JSON 배열로 인코딩합니다. (FastAPI 기본 JSON 응답과 동일한 형식)"""
+    return json.dumps(
+        items, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def to_columnar(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    행 리스트를 필드별 배열(컬럼형) 구조로 변환합니다.
+
+    반복되는 키를 한 번만 기록하므로 행이 많을수록 크기가 줄어듭니다.
+
+    Returns:
+        dict: {"count": 행 수, "columns": {필드명: 값 배열}}
+    """
+    fields = list(items[0].keys()) if items else []
+    return {
+        "count": len(items),
+        "columns": {field: [item[field] for item in items] for field in fields},
+    }
+
+
+def encode_columnar(items: List[Dict[str, Any]]) -> bytes:
+    """행 리스트를 컬럼형 JSON으로 인코딩합니다."""
+    return encode_json(to_columnar(items))
+
+
+def encode_msgpack(items: List[Any]) -> bytes:
+    """행 리스트를 MessagePack 배열로 인코딩합니다."""
+    return msgpack.packb(items, use_bin_type=True)
+
+
+# 미디어 타입 -> 인코더
+ENCODERS = {
+    MEDIA_JSON: encode_json,
+    MEDIA_COLUMNAR: encode_columnar,
+    MEDIA_MSGPACK: encode_msgpack,
+}
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문을 지정한 방식(gzip, br)으로 압축합니다."""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.response_brotli_quality)
+    return gzip.compress(body, compresslevel=settings.response_gzip_level)
+
+
+def parse_quality_header(value: Optional[str]) -> List[Tuple[str, float]]:
+    """
+    Accept 계열 헤더를 (값, q) 리스트로 해석합니다. q가 높은 순으로 정렬됩니다.
+
+    Args:
+        value: 헤더 값 (예: "application/msgpack, application/json;q=0.5")
+
+    Returns:
+        List[Tuple[str, float]]: (소문자 값, 품질) 리스트
+    """
+    if not value:
+        return []
+
+    parsed = []
+    for part in value.split(","):
+        token, *params = [piece.strip() for piece in part.split(";")]
+        if not token:
+            continue
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        parsed.append((token.lower(), quality))
+    return sorted(parsed, key=lambda item: item[1], reverse=True)
+
+
+def choose_media_type(accept: Optional[str]) -> str:
+    """
+    Accept 헤더에서 지원하는 미디어 타입을 선택합니다.
+
+    지원하는 타입이 없거나 MessagePack 모듈이 없으면 JSON을 사용합니다.
+    """
+    for token, quality in parse_quality_header(accept):
+        media_type = ACCEPT_MEDIA_TYPES.get(token)
+        if quality <= 0 or media_type is None:
+            continue
+        if media_type == MEDIA_MSGPACK and msgpack is None:
+            continue
+        return media_type
+    return MEDIA_JSON
+
+
+def choose_content_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 압축 방식을 선택합니다.
+
+    같은 품질이면 brotli(br)를 gzip보다 우선하며, brotli 모듈이 없으면 gzip만 사용합니다.
+    """
+    candidates = {
+        token: quality
+        for token, quality in parse_quality_header(accept_encoding)
+        if quality > 0
+    }
+    supported = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_quality = None, 0.0
+    for encoding in supported:
+        quality = candidates.get(encoding, candidates.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def negotiate_list_response(request: Request, items: List[Any]) -> Response:
+    """
+    요청 헤더에 맞춰 목록 응답을 인코딩하고 압축합니다.
+
+    - Accept: application/json(기본), application/vnd.ym.columnar+json,
+      application/msgpack
+    - Accept-Encoding: br, gzip (본문이 설정된 최소 크기 이상일 때만)
+
+    Args:
+        request: 현재 요청
+        items: 응답 행 리스트 (Pydantic 모델 또는 딕셔너리)
+
+    Returns:
+        Response: 인코딩/압축된 응답
+    """
+    media_type = choose_media_type(request.headers.get("accept"))
+    with tracer.span("response.encode", media_type=media_type, rows=len(items)) as span:
+        rows = to_plain_rows(items)
+        body = ENCODERS[media_type](rows)
+
+        headers = {"Vary": "Accept, Accept-Encoding"}
+        if len(body) >= settings.response_compression_min_bytes:
+            encoding = choose_content_encoding(request.headers.get("accept-encoding"))
+            if encoding:
+                body = compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+        if span is not None:
+            span.attributes["body_bytes"] = len(body)
+
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -0,0 +1,448 @@
+"""
+요청 추적(tracing) 모듈
+
+요청마다 루트 span을 만들고, 그 안에서 일어나는 DB 세션 생성(get_db),
+SQL 문장 실행, 응답 모델 검증/직렬화, 목록 응답 인코딩을 하위 span으로 기록합니다.
+샘플링된 trace는 요청이 끝나면 큐에 넣고(논블로킹), 백그라운드 스레드가
+JSONL 파일 또는 OTLP/HTTP(JSON) 수집기로 내보냅니다.
+"""
+
+import json
+import logging
+import queue
+import random
+import re
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# W3C Trace Context traceparent 헤더 (버전 00)
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# span 속성에 기록할 SQL 문장 최대 길이
+MAX_STATEMENT_LENGTH = 1000
+
+# OTLP span 종류 코드
+OTLP_SPAN_KINDS = {"internal": 1, "server": 2}
+
+# 내보내기 한 번에 보낼 최대 span 수
+EXPORT_BATCH_SIZE = 512
+
+
+@dataclass
+class Span:
+    """
+    추적 구간 하나
+
+    같은 trace의 span은 루트 span의 spans 리스트를 공유하며,
+    끝난 순서대로 추가됩니다.
+    """
+
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    sampled: bool
+    kind: str = "internal"
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    spans: List["Span"] = field(default_factory=list, repr=False)
+
+    def child(self, name: str, attributes: Dict[str, Any]) -> "Span":
+        """하위 span을 시작합니다."""
+        return Span(
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=self.span_id,
+            name=name,
+            sampled=self.sampled,
+            attributes=attributes,
+            spans=self.spans,
+        )
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """span을 끝내고 trace의 span 목록에 추가합니다."""
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.error = f"{error.__class__.__name__}: {error}"
+        self.spans.append(self)
+
+    @property
+    def traceparent(self) -> str:
+        """이 span을 부모로 하는 traceparent 헤더 값"""
+        flags = "01" if self.sampled else "00"
+        return f"00-{self.trace_id}-{self.span_id}-{flags}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONL 파일에 기록할 딕셔너리로 변환합니다."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    traceparent 헤더를 해석합니다.
+
+    Args:
+        value: 헤더 값
+
+    Returns:
+        Optional[Tuple[str, str, bool]]: (trace ID, 부모 span ID, 샘플링 여부), 형식이 틀리면 None
+    """
+    if not value:
+        return None
+    match = TRACEPARENT_PATTERN.match(value.strip().lower())
+    if not match:
+        return None
+    trace_id, parent_id, flags = match.groups()
+    if trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 1)
+
+
+class FileSpanExporter:
+    """span을 한 줄에 하나씩 JSONL 파일에 추가합니다."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def export(self, spans: List[Span]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            for span in spans:
+                file.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str))
+                file.write("\n")
+
+
+def otlp_value(value: Any) -> Dict[str, Any]:
+    """속성 값을 OTLP/JSON AnyValue로 변환합니다."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OtlpSpanExporter:
+    """span을 OTLP/HTTP(JSON) 형식으로 수집기에 전송합니다."""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def export(self, spans: List[Span]) -> None:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": otlp_value(self.service_name),
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [self._to_otlp(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(payload, default=str).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+    @staticmethod
+    def _to_otlp(span: Span) -> Dict[str, Any]:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": OTLP_SPAN_KINDS[span.kind],
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [
+                {"key": key, "value": otlp_value(value)}
+                for key, value in span.attributes.items()
+            ],
+            "status": (
+                {"code": 2, "message": span.error} if span.error else {"code": 1}
+            ),
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        return otlp_span
+
+
+class Tracer:
+    """
+    요청 추적기
+
+    현재 span은 contextvar로 전달되므로 스레드풀에서 실행되는 동기 라우트와
+    의존성에서도 같은 trace에 하위 span이 기록됩니다.
+    샘플링되지 않은 요청은 trace ID만 만들고 하위 span은 기록하지 않습니다.
+    끝난 trace는 크기가 제한된 큐에 넣고, 가득 차면 버리고 dropped를 올립니다.
+
+    Attributes:
+        sample_rate: 새 trace를 기록할 비율 (0~1, 부모가 있으면 부모의 결정을 따름)
+        dropped: 큐가 가득 차 버린 trace 수
+        exported: 내보낸 span 수
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        exporter: Any = None,
+        max_queue_size: int = 1000,
+    ):
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+        self.dropped = 0
+        self.exported = 0
+        self._current: ContextVar[Optional[Span]] = ContextVar(
+            "current_span", default=None
+        )
+        self._queue: "queue.Queue[List[Span]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """내보내기 스레드가 실행 중인지 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """내보내기 스레드를 시작합니다."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """큐에 남은 span을 모두 내보낸 뒤 스레드를 종료합니다."""
+        if not self.running:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def current_span(self) -> Optional[Span]:
+        """현재 컨텍스트의 span을 반환합니다."""
+        return self._current.get()
+
+    def start_trace(
+        self, name: str, traceparent: Optional[str] = None
+    ) -> Tuple[Span, Token]:
+        """
+        루트 span을 시작하고 현재 span으로 설정합니다.
+
+        Args:
+            name: span 이름
+            traceparent: 요청의 traceparent 헤더 (있으면 trace ID와 샘플링 결정을 이어받음)
+
+        Returns:
+            Tuple[Span, Token]: 루트 span과 end_trace()에 넘길 토큰
+        """
+        parent = parse_traceparent(traceparent)
+        if parent:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = secrets.token_hex(16), None
+            sampled = random.random() < self.sample_rate
+        span = Span(
+            trace_id=trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent_id,
+            name=name,
+            sampled=sampled,
+            kind="server",
+        )
+        return span, self._current.set(span)
+
+    def end_trace(
+        self, span: Span, token: Token, error: Optional[BaseException] = None
+    ) -> None:
+        """루트 span을 끝내고, 샘플링된 trace면 내보내기 큐에 넣습니다."""
+        self._current.reset(token)
+        span.finish(error)
+        if not span.sampled:
+            return
+        try:
+            self._queue.put_nowait(span.spans)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    "span 큐가 가득 차 trace %d건을 버렸습니다.", self.dropped
+                )
+
+    def start_span(self, name: str, **attributes: Any) -> Optional[Span]:
+        """
+        현재 span의 하위 span을 시작합니다. (현재 span은 바꾸지 않음)
+
+        SQL 문장처럼 시작과 끝이 서로 다른 콜백에서 일어나는 구간에 사용합니다.
+
+        Returns:
+            Optional[Span]: 시작한 span (기록 중인 trace가 없으면 None)
+        """
+        parent = self._current.get()
+        if parent is None or not parent.sampled:
+            return None
+        return parent.child(name, attributes)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """
+        블록 실행 구간을 하위 span으로 기록합니다.
+
+        블록 안에서 시작한 span은 이 span의 하위 span이 됩니다.
+        """
+        span = self.start_span(name, **attributes)
+        if span is None:
+            yield None
+            return
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.finish(e)
+            raise
+        else:
+            span.finish()
+        finally:
+            self._current.reset(token)
+
+    def _run(self) -> None:
+        """끝난 trace를 모아 내보내는 워커 루프"""
+        while not (self._stopping.is_set() and self._queue.empty()):
+            try:
+                batch = list(self._queue.get(timeout=0.1))
+            except queue.Empty:
+                continue
+            while len(batch) < EXPORT_BATCH_SIZE:
+                try:
+                    batch.extend(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.exporter.export(batch)
+                self.exported += len(batch)
+            except Exception:
+                logger.exception("span %d개 내보내기에 실패했습니다.", len(batch))
+
+
+def instrument_engine(engine) -> None:
+    """
+    엔진이 실행하는 SQL 문장마다 db.query span을 기록합니다.
+
+    Args:
+        engine: SQLAlchemy 엔진
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_statement_span(conn, cursor, statement, parameters, context, executemany):
+        span = tracer.start_span(
+            "db.query",
+            **{
+                "db.system": engine.dialect.name,
+                "db.statement": statement[:MAX_STATEMENT_LENGTH],
+            },
+        )
+        if span is not None:
+            conn.info.setdefault("trace_spans", []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def end_statement_span(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get("trace_spans")
+        if spans:
+            span = spans.pop()
+            if cursor.rowcount is not None and cursor.rowcount >= 0:
+                span.attributes["db.rowcount"] = cursor.rowcount
+            span.finish()
+
+    @event.listens_for(engine, "handle_error")
+    def end_failed_statement_span(exception_context):
+        conn = exception_context.connection
+        spans = conn.info.get("trace_spans") if conn is not None else None
+        if spans:
+            spans.pop().finish(exception_context.original_exception)
+
+
+def instrument_fastapi() -> None:
+    """
+    FastAPI의 응답 모델 검증/직렬화 구간을 response.serialize span으로 기록합니다.
+
+    라우트 핸들러가 호출하는 fastapi.routing.serialize_response를 감쌉니다.
+    """
+    import fastapi.routing
+
+    serialize_response = fastapi.routing.serialize_response
+    if getattr(serialize_response, "__traced__", False):
+        return
+
+    async def traced_serialize_response(*args, **kwargs):
+        field_info = getattr(kwargs.get("field"), "field_info", None)
+        response_model = getattr(field_info, "annotation", None)
+        with tracer.span(
+            "response.serialize",
+            response_model=getattr(response_model, "__name__", str(response_model)),
+        ):
+            return await serialize_response(*args, **kwargs)
+
+    traced_serialize_response.__traced__ = True
+    fastapi.routing.serialize_response = traced_serialize_response
+
+
+def create_exporter():
+    """설정(TRACING_EXPORTER)에 맞는 span 내보내기 객체를 만듭니다."""
+    if settings.tracing_exporter == "otlp":
+        return OtlpSpanExporter(
+            settings.tracing_otlp_endpoint, settings.tracing_service_name
+        )
+    return FileSpanExporter(settings.tracing_file_path)
+
+
+# 요청 추적기 (TRACING이 켜져 있으면 lifespan에서 내보내기 스레드 시작)
+tracer = Tracer(
+    sample_rate=settings.tracing_sample_rate,
+    exporter=create_exporter(),
+)
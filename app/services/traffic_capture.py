@@ -0,0 +1,213 @@
+"""
+요청 트래픽 수집 모듈
+
+부하 테스트에서 실제 요청 구성을 재현할 수 있도록 API 요청의 메타데이터
+(메서드, 라우트, 쿼리 파라미터, 본문 구조, 응답 상태, 처리 시간)를
+회전하는 JSONL 파일에 기록합니다. (scripts/replay_traffic.py로 재생)
+요청 경로에서는 큐에 넣기만 하고(논블로킹), 백그라운드 스레드가 파일에 씁니다.
+"""
+
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# 비밀 값을 가린 자리에 기록하는 값 (재생 시 --secret 값으로 바뀜)
+REDACTED = "[REDACTED]"
+
+# 값을 가릴 키 (본문 필드, 쿼리 파라미터, 헤더)
+SECRET_KEY_PATTERN = re.compile(
+    r"pass(word)?|secret|token|authorization|cookie|api[_-]?key", re.IGNORECASE
+)
+
+# 응답 형식에 영향을 주어 함께 기록하는 요청 헤더
+CAPTURED_HEADERS = ("accept", "accept-encoding", "content-type", "last-event-id")
+
+
+def redact(value: Any) -> Any:
+    """
+    JSON 값에서 비밀 키의 값을 REDACTED로 바꿉니다. (중첩 객체/배열 포함)
+
+    Args:
+        value: JSON으로 해석한 값
+
+    Returns:
+        Any: 비밀 값을 가린 값
+    """
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if SECRET_KEY_PATTERN.search(key) else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+def body_shape(value: Any) -> Any:
+    """
+    JSON 값을 키와 값 종류만 남긴 구조로 바꿉니다. (값 자체는 기록하지 않음)
+
+    값은 종류 이름(str, int, float, bool, null)으로 바뀌며,
+    비밀 키는 재생 시 --secret 값을 넣을 수 있도록 REDACTED로 남깁니다.
+
+    Args:
+        value: JSON으로 해석한 값
+
+    Returns:
+        Any: 본문 구조
+    """
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if SECRET_KEY_PATTERN.search(key) else body_shape(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [body_shape(item) for item in value]
+    if value is None:
+        return "null"
+    return type(value).__name__
+
+
+def redact_pairs(pairs: Iterable[Tuple[str, str]]) -> List[List[str]]:
+    """(키, 값) 목록(쿼리 파라미터, 헤더)에서 비밀 키의 값을 가립니다."""
+    return [
+        [key, REDACTED if SECRET_KEY_PATTERN.search(key) else value]
+        for key, value in pairs
+    ]
+
+
+class RotatingJsonlWriter:
+    """
+    크기 기준으로 회전하는 JSONL 파일
+
+    파일이 max_bytes를 넘으면 path.1, path.2, ...로 밀어내고 새 파일에 씁니다.
+    (가장 오래된 파일은 path.<backup_count>, 넘치는 파일은 삭제)
+    """
+
+    def __init__(self, path: str, max_bytes: int, backup_count: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(
+            json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            for record in records
+        ).encode("utf-8")
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if size and size + len(data) > self.max_bytes:
+            self._rotate()
+        with open(self.path, "ab") as file:
+            file.write(data)
+
+    def _rotate(self) -> None:
+        if self.backup_count <= 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+
+
+class TrafficRecorder:
+    """
+    요청 트래픽 비동기 기록기
+
+    record()는 크기가 제한된 큐에 put_nowait로 넣기만 하므로 요청을 막지 않습니다.
+    큐가 가득 차면 기록을 버리고 dropped 카운터를 올립니다.
+    워커 스레드는 큐에 쌓인 기록을 모아 한 번에 파일에 쓰고,
+    stop() 시 남은 기록을 모두 씁니다.
+
+    Attributes:
+        dropped: 큐가 가득 차 버린 기록 수
+        written: 파일에 쓴 기록 수
+    """
+
+    def __init__(self, writer: RotatingJsonlWriter, max_queue_size: int = 10000):
+        self.writer = writer
+        self.dropped = 0
+        self.written = 0
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """워커 스레드가 실행 중인지 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """워커 스레드를 시작합니다."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="traffic-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """큐에 남은 기록을 모두 쓴 뒤 워커 스레드를 종료합니다."""
+        if not self.running:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        """
+        요청 기록을 큐에 넣습니다. (논블로킹)
+
+        Args:
+            entry: 요청 기록 (JSON으로 변환 가능한 딕셔너리)
+        """
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    "트래픽 기록 큐가 가득 차 %d건을 버렸습니다.", self.dropped
+                )
+
+    def _run(self) -> None:
+        """기록을 모아 파일에 쓰는 워커 루프"""
+        while not (self._stopping.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=0.1)]
+            except queue.Empty:
+                continue
+            while len(batch) < 1000:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.writer.write(batch)
+                self.written += len(batch)
+            except Exception:
+                logger.exception("트래픽 기록 %d건 쓰기에 실패했습니다.", len(batch))
+
+
+# 요청 트래픽 기록기 (TRAFFIC_CAPTURE가 켜져 있으면 lifespan에서 시작)
+traffic_recorder = TrafficRecorder(
+    RotatingJsonlWriter(
+        settings.traffic_capture_path,
+        max_bytes=settings.traffic_capture_max_mb * 1024 * 1024,
+        backup_count=settings.traffic_capture_backup_count,
+    )
+)
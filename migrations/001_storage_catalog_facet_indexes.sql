@@ -0,0 +1,4 @@
+-- 저장소 카탈로그 필터 및 facet 집계(GROUP BY)용 인덱스
+ALTER TABLE storage_catalog
+    ADD INDEX ix_storage_catalog_storage_category_year_month (storage, category, year, month),
+    ADD INDEX ix_storage_catalog_year_month (year, month);
@@ -0,0 +1,5 @@
+-- 저장소 카탈로그 활동명/설명 n-gram 전문 검색 인덱스
+-- ngram_token_size 기본값(2)을 기준으로 검색어를 처리합니다.
+ALTER TABLE storage_catalog
+    ADD FULLTEXT INDEX ft_storage_catalog_activity_name_description (activity_name, description)
+    WITH PARSER ngram;
@@ -0,0 +1,39 @@
+-- 소프트 삭제 일시 컬럼 및 아카이브 대상 조회용 인덱스
+ALTER TABLE backup_status
+    ADD COLUMN deleted_at DATETIME NULL COMMENT '삭제 일시' AFTER deleted_by,
+    ADD INDEX ix_backup_status_deleted_deleted_at (deleted, deleted_at);
+
+-- 백업 상태 아카이브 테이블
+CREATE TABLE backup_status_archive (
+    id INTEGER NOT NULL COMMENT '원본 ID',
+    event_name VARCHAR(100) COMMENT '이벤트명',
+    displayed_date DATETIME COMMENT '표시 날짜',
+    name VARCHAR(100) NOT NULL COMMENT '콘텐츠/파일 이름',
+    description VARCHAR(1000) COMMENT '상세 설명',
+    cam BOOL COMMENT '카메라 원본 백업 여부',
+    cam_checker INTEGER COMMENT '카메라 원본 확인자',
+    master BOOL COMMENT '마스터 파일 백업 여부',
+    master_checker INTEGER COMMENT '마스터 파일 확인자',
+    clean BOOL COMMENT '정리본 백업 여부',
+    clean_checker INTEGER COMMENT '정리본 확인자',
+    final_product BOOL COMMENT '최종 산출물 백업 여부',
+    final_product_checker INTEGER COMMENT '최종 산출물 확인자',
+    deleted BOOL NOT NULL COMMENT '삭제 여부',
+    deleted_by INTEGER COMMENT '삭제한 사용자 ID',
+    deleted_at DATETIME COMMENT '삭제 일시',
+    created_at DATETIME NOT NULL COMMENT '생성 일시',
+    archived_at DATETIME NOT NULL COMMENT '아카이브 일시',
+    PRIMARY KEY (id)
+) COMMENT='백업 상태 아카이브 테이블';
+
+-- 작업자 매핑 아카이브 테이블
+CREATE TABLE m_user_backup_status_archive (
+    id INTEGER NOT NULL COMMENT '원본 ID',
+    user_id INTEGER NOT NULL COMMENT '사용자 ID',
+    backup_status_id INTEGER NOT NULL COMMENT '백업 상태 ID',
+    created_at DATETIME COMMENT '생성 일시',
+    created_by INTEGER NOT NULL COMMENT '생성자 ID',
+    archived_at DATETIME NOT NULL COMMENT '아카이브 일시',
+    PRIMARY KEY (id),
+    INDEX ix_m_user_backup_status_archive_backup_status_id (backup_status_id)
+) COMMENT='작업자 매핑 아카이브 테이블';
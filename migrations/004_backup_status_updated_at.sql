@@ -0,0 +1,17 @@
+-- 변경분 동기화용 수정 일시 컬럼 (애플리케이션이 UTC로 갱신)
+ALTER TABLE backup_status
+    ADD COLUMN updated_at DATETIME(6) NULL COMMENT '수정 일시' AFTER created_at;
+
+UPDATE backup_status SET updated_at = COALESCE(deleted_at, created_at);
+
+ALTER TABLE backup_status
+    MODIFY COLUMN updated_at DATETIME(6) NOT NULL COMMENT '수정 일시',
+    ADD INDEX ix_backup_status_updated_at (updated_at);
+
+ALTER TABLE backup_status_archive
+    ADD COLUMN updated_at DATETIME(6) NULL COMMENT '수정 일시' AFTER created_at;
+
+UPDATE backup_status_archive SET updated_at = COALESCE(deleted_at, created_at);
+
+ALTER TABLE backup_status_archive
+    MODIFY COLUMN updated_at DATETIME(6) NOT NULL COMMENT '수정 일시';
@@ -0,0 +1,3 @@
+-- 사용자별 작업 항목 조회/집계용 인덱스
+ALTER TABLE m_user_backup_status
+    ADD INDEX ix_m_user_backup_status_user_id_backup_status_id (user_id, backup_status_id);
@@ -0,0 +1,13 @@
+-- 백업 상태 변경 이력 테이블 (추가 전용, 아카이브 후에도 유지되도록 외래키 없음)
+CREATE TABLE backup_status_history (
+    id BIGINT NOT NULL AUTO_INCREMENT COMMENT '고유 식별자',
+    backup_status_id INT NOT NULL COMMENT '백업 상태 ID',
+    action VARCHAR(20) NOT NULL COMMENT '작업 종류',
+    field VARCHAR(50) NULL COMMENT '변경된 필드명',
+    old_value VARCHAR(1000) NULL COMMENT '변경 전 값',
+    new_value VARCHAR(1000) NULL COMMENT '변경 후 값',
+    changed_by INT NULL COMMENT '변경한 사용자 ID',
+    changed_at DATETIME(6) NOT NULL COMMENT '변경 일시',
+    PRIMARY KEY (id),
+    INDEX ix_backup_status_history_backup_status_id_changed_at (backup_status_id, changed_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='백업 상태 변경 이력 테이블';
@@ -0,0 +1,23 @@
+-- 백그라운드 작업 테이블
+CREATE TABLE jobs (
+    id INT NOT NULL AUTO_INCREMENT COMMENT '고유 식별자',
+    job_type VARCHAR(50) NOT NULL COMMENT '작업 종류',
+    params JSON NULL COMMENT '작업 파라미터',
+    status VARCHAR(20) NOT NULL COMMENT '상태',
+    processed INT NOT NULL DEFAULT 0 COMMENT '처리한 항목 수',
+    total INT NULL COMMENT '전체 항목 수',
+    attempts INT NOT NULL DEFAULT 0 COMMENT '실행 시도 횟수',
+    worker_id VARCHAR(100) NULL COMMENT '실행 중인 워커 식별자',
+    result JSON NULL COMMENT '작업 결과 요약',
+    result_path VARCHAR(500) NULL COMMENT '결과 파일 경로',
+    result_filename VARCHAR(255) NULL COMMENT '다운로드 파일명',
+    result_media_type VARCHAR(100) NULL COMMENT '결과 파일 Content-Type',
+    error TEXT NULL COMMENT '실패 사유',
+    created_by INT NULL COMMENT '요청한 사용자 ID',
+    created_at DATETIME NOT NULL COMMENT '생성 일시',
+    started_at DATETIME NULL COMMENT '실행 시작 일시',
+    heartbeat_at DATETIME NULL COMMENT '마지막 실행 확인 일시',
+    finished_at DATETIME NULL COMMENT '완료 일시',
+    PRIMARY KEY (id),
+    INDEX ix_jobs_status_id (status, id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='백그라운드 작업 테이블';
@@ -0,0 +1,3 @@
+-- 목록 조회(표시 날짜 범위 필터, 최신순 정렬)용 인덱스
+ALTER TABLE backup_status
+    ADD INDEX ix_backup_status_deleted_displayed_date (deleted, displayed_date);
@@ -0,0 +1,8 @@
+-- 단계 완료 비트마스크 생성 컬럼 (cam=1, master=2, clean=4, final_product=8)
+-- 단계 완료 여부 필터/집계용 인덱스
+ALTER TABLE backup_status
+    ADD COLUMN stage_mask SMALLINT
+        AS (COALESCE(cam, 0) * 1 + COALESCE(master, 0) * 2 + COALESCE(clean, 0) * 4 + COALESCE(final_product, 0) * 8) STORED NOT NULL
+        COMMENT '단계 완료 비트마스크'
+        AFTER final_product_checker,
+    ADD INDEX ix_backup_status_deleted_stage_mask (deleted, stage_mask, displayed_date);
@@ -0,0 +1,32 @@
+-- 저장소 카탈로그 자연 키(저장소, 카테고리, 연도, 월, 활동명) 유니크 인덱스 (업서트용)
+-- 연도/월의 NULL은 0으로 바꿔 비교 (MySQL 8.0.13+ 함수 키 파트)
+
+-- 중복 항목 정리: 자연 키마다 최소 ID 항목을 남기고, 설명은 가장 최근 항목의 값으로 맞춤
+UPDATE storage_catalog AS keep_row
+    JOIN (
+        SELECT MIN(id) AS keep_id, MAX(id) AS latest_id
+        FROM storage_catalog
+        GROUP BY storage, category, COALESCE(year, 0), COALESCE(month, 0), activity_name
+        HAVING COUNT(*) > 1
+    ) AS duplicates ON keep_row.id = duplicates.keep_id
+    JOIN storage_catalog AS latest_row ON latest_row.id = duplicates.latest_id
+SET keep_row.description = latest_row.description;
+
+DELETE duplicate_row FROM storage_catalog AS duplicate_row
+    JOIN (
+        SELECT storage, category, COALESCE(year, 0) AS year_key, COALESCE(month, 0) AS month_key,
+               activity_name, MIN(id) AS keep_id
+        FROM storage_catalog
+        GROUP BY storage, category, COALESCE(year, 0), COALESCE(month, 0), activity_name
+        HAVING COUNT(*) > 1
+    ) AS duplicates
+        ON duplicate_row.storage = duplicates.storage
+        AND duplicate_row.category = duplicates.category
+        AND COALESCE(duplicate_row.year, 0) = duplicates.year_key
+        AND COALESCE(duplicate_row.month, 0) = duplicates.month_key
+        AND duplicate_row.activity_name = duplicates.activity_name
+        AND duplicate_row.id <> duplicates.keep_id;
+
+ALTER TABLE storage_catalog
+    ADD UNIQUE INDEX uq_storage_catalog_natural_key
+        (storage, category, (COALESCE(year, 0)), (COALESCE(month, 0)), activity_name);
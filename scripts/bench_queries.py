@@ -0,0 +1,201 @@
+"""
+목록 조회 쿼리 벤치마크
+
+합성 데이터를 적재한 DB에 주요 목록 조회 API를 반복 호출하여
+엔드포인트별 응답 시간을 측정합니다.
+DATABASE_URL만 바꾸면 MySQL과 SQLite에서 같은 측정을 실행할 수 있습니다.
+
+- SQLite (기본): 임시 파일 DB를 만들어 데이터를 적재합니다.
+- MySQL: migrations/ 가 적용된 빈 DB를 지정합니다.
+  (데이터가 이미 있으면 적재하지 않고 기존 데이터로 측정)
+
+사용 예:
+    python scripts/bench_queries.py
+    python scripts/bench_queries.py --backups 50000 --catalogs 20000 --repeat 20
+    python scripts/bench_queries.py --database-url mysql+pymysql://user:pw@localhost/ym_bench
+    python scripts/bench_queries.py --snapshot
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# app 디렉토리를 import 경로에 추가 (서버와 동일한 모듈 경로 사용)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+# 측정 대상 요청 (이름, 경로)
+REQUESTS = [
+    ("backup list", "/api/v1/backup-status?limit=100"),
+    ("backup list (deep page)", "/api/v1/backup-status?skip=5000&limit=100"),
+    ("backup list (event)", "/api/v1/backup-status?event_name=행사 7&limit=100"),
+    ("backup list (fields)", "/api/v1/backup-status?fields=id,name,cam&limit=1000"),
+    ("backup summary", "/api/v1/backup-status/summary"),
+    ("user backups", "/api/v1/auth/users/1/backups"),
+    ("user stats", "/api/v1/auth/users/1/stats"),
+    ("catalog list", "/api/v1/storage-catalogs?limit=100"),
+    ("catalog search", "/api/v1/storage-catalogs?q=수련회&limit=100"),
+    ("catalog search (2 chars)", "/api/v1/storage-catalogs?q=수련&limit=100"),
+    ("catalog facets", "/api/v1/storage-catalogs/facets"),
+    ("catalog tree", "/api/v1/storage-catalogs/tree?storage=HDD-07"),
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="목록 조회 쿼리 벤치마크")
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        help="대상 DB URL (기본: 임시 SQLite 파일)",
+    )
+    parser.add_argument("--users", type=int, default=20, help="사용자 수")
+    parser.add_argument("--backups", type=int, default=20000, help="백업 상태 수")
+    parser.add_argument("--catalogs", type=int, default=10000, help="카탈로그 수")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="백업 상태 인메모리 스냅샷을 적재한 상태로 측정",
+    )
+    return parser.parse_args()
+
+
+def seed(engine, users: int, backups: int, catalogs: int) -> None:
+    """백업 상태 목록/카탈로그와 같은 형태의 합성 데이터를 적재합니다."""
+    from sqlalchemy import insert
+
+    from models.backup_status import BackupStatus
+    from models.m_user_backup_status import MUserBackupStatus
+    from models.storage_catalog import StorageCatalog
+    from models.user import User
+
+    base_date = datetime(2024, 1, 1)
+    activities = ["수련회", "정기 예배", "찬양 집회", "성경 학교", "체육 대회"]
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [
+                {"name": f"user{i:03d}", "nickname": f"닉네임{i}", "password": "x"}
+                for i in range(users)
+            ],
+        )
+        conn.execute(
+            insert(BackupStatus),
+            [
+                {
+                    "event_name": f"2024 행사 {i % 50}",
+                    "displayed_date": (
+                        base_date + timedelta(hours=i) if i % 10 else None
+                    ),
+                    "name": f"콘텐츠_{i:06d}.mov",
+                    "cam": i % 2 == 0,
+                    "cam_checker": i % users + 1 if i % 2 == 0 else None,
+                    "master": i % 3 == 0,
+                    "master_checker": (i + 1) % users + 1 if i % 3 == 0 else None,
+                    "clean": i % 4 == 0,
+                    "final_product": i % 7 == 0,
+                    "deleted": i % 20 == 0,
+                    "created_by": i % users + 1,
+                }
+                for i in range(backups)
+            ],
+        )
+        conn.execute(
+            insert(MUserBackupStatus),
+            [
+                {
+                    "user_id": (i + offset) % users + 1,
+                    "backup_status_id": i + 1,
+                    "created_by": 1,
+                }
+                for i in range(backups)
+                for offset in range(i % 3)
+            ],
+        )
+        conn.execute(
+            insert(StorageCatalog),
+            [
+                {
+                    "storage": f"HDD-{i % 30:02d}",
+                    "category": "ACTIVITY" if i % 4 else "ETC",
+                    "year": 2015 + i % 10,
+                    "month": i % 12 + 1,
+                    "activity_name": f"{2015 + i % 10} {activities[i % 5]} {i}",
+                    "description": f"{activities[(i + 2) % 5]} 촬영 원본",
+                }
+                for i in range(catalogs)
+            ],
+        )
+
+
+def measure(client, path: str, repeat: int):
+    """요청을 repeat회 실행하여 (상태 코드, 중앙값 ms, 최대 ms)를 반환합니다."""
+    timings = []
+    status_code = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+        status_code = response.status_code
+    return status_code, statistics.median(timings), max(timings)
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.database_url:
+        db_path = Path(tempfile.mkdtemp(prefix="ym_bench_")) / "bench.db"
+        args.database_url = f"sqlite:///{db_path}"
+    # 앱 모듈이 설정을 읽기 전에 대상 DB를 지정
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["DEBUG"] = "False"
+
+    from fastapi.testclient import TestClient
+
+    from database import IS_SQLITE, SessionLocal, create_sqlite_schema, engine
+    from main import app
+    from models.backup_status import BackupStatus
+
+    if IS_SQLITE:
+        create_sqlite_schema()
+
+    db = SessionLocal()
+    try:
+        existing = db.query(BackupStatus.id).count()
+    finally:
+        db.close()
+
+    print(f"DB: {engine.url.render_as_string(hide_password=True)}")
+    if existing:
+        print(f"기존 데이터로 측정합니다. (백업 상태 {existing}건)")
+    else:
+        started = time.perf_counter()
+        seed(engine, args.users, args.backups, args.catalogs)
+        print(
+            f"데이터 적재: 사용자 {args.users}, 백업 상태 {args.backups}, "
+            f"카탈로그 {args.catalogs} ({time.perf_counter() - started:.1f}s)"
+        )
+    if args.snapshot:
+        from services.backup_snapshot import backup_snapshot
+
+        started = time.perf_counter()
+        loaded = backup_snapshot.load()
+        print(f"스냅샷 적재: {loaded}건 ({time.perf_counter() - started:.1f}s)")
+    print(f"반복: {args.repeat}회\n")
+
+    header = f"{'request':<26} {'status':>6} {'median ms':>10} {'max ms':>9}"
+    print(header)
+    print("-" * len(header))
+
+    client = TestClient(app)
+    for name, path in REQUESTS:
+        status_code, median_ms, max_ms = measure(client, path, args.repeat)
+        print(f"{name:<26} {status_code:>6} {median_ms:>10.1f} {max_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
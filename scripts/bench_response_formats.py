@@ -0,0 +1,127 @@
+"""
+목록 응답 형식 벤치마크
+
+백업 상태 목록 응답과 같은 형태의 합성 데이터로
+형식(JSON, 컬럼형 JSON, MessagePack)과 압축(없음, gzip, brotli)별
+전송 크기와 인코딩 시간을 측정합니다.
+
+사용 예:
+    python scripts/bench_response_formats.py
+    python scripts/bench_response_formats.py --rows 10000 --repeat 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# app 디렉토리를 import 경로에 추가 (서버와 동일한 모듈 경로 사용)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from schemas.backup_status import BackupStatusListResponse  # noqa: E402
+from services import response_formats  # noqa: E402
+
+FORMATS = {
+    "json": response_formats.MEDIA_JSON,
+    "columnar": response_formats.MEDIA_COLUMNAR,
+    "msgpack": response_formats.MEDIA_MSGPACK,
+}
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+def make_rows(count: int) -> list:
+    """백업 상태 목록 응답과 같은 형태의 합성 행을 생성합니다."""
+    base_date = datetime(2024, 1, 1)
+    names = ["김철수", "이영희", "박민수", "최지은", None]
+    rows = []
+    for i in range(count):
+        rows.append(
+            BackupStatusListResponse(
+                id=i + 1,
+                event_name=f"2024 행사 {i % 50}",
+                displayed_date=base_date + timedelta(hours=i),
+                name=f"콘텐츠_{i:05d}.mov",
+                description="촬영 원본 및 편집본 백업 메모 " * (i % 4),
+                cam=i % 2 == 0,
+                cam_checker=i % 5 or None,
+                cam_checker_name=names[i % 5],
+                master=i % 3 == 0,
+                master_checker=(i + 1) % 5 or None,
+                master_checker_name=names[(i + 1) % 5],
+                clean=i % 4 == 0,
+                clean_checker=None,
+                clean_checker_name=None,
+                final_product=i % 7 == 0,
+                final_product_checker=None,
+                final_product_checker_name=None,
+                created_at=base_date + timedelta(minutes=i),
+                updated_at=base_date + timedelta(minutes=i, seconds=30),
+                producers=names[: i % 3],
+            )
+        )
+    return rows
+
+
+def measure(func, repeat: int):
+    """함수를 repeat회 실행하여 (마지막 결과, 중앙값 ms)를 반환합니다."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="목록 응답 형식 벤치마크")
+    parser.add_argument("--rows", type=int, default=10000, help="행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    plain_rows, serialize_ms = measure(
+        lambda: response_formats.to_plain_rows(rows), args.repeat
+    )
+    print(f"행 수: {args.rows}, 반복: {args.repeat}회 (중앙값)")
+    print(f"공통 직렬화(to_plain_rows): {serialize_ms:.1f} ms\n")
+
+    header = (
+        f"{'format':<10} {'encoding':<9} {'bytes':>12} {'ratio':>7} {'encode ms':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    baseline = None
+    for name, media_type in FORMATS.items():
+        if (
+            media_type == response_formats.MEDIA_MSGPACK
+            and not response_formats.msgpack
+        ):
+            print(f"{name:<10} (msgpack 미설치로 건너뜀)")
+            continue
+
+        encoder = response_formats.ENCODERS[media_type]
+        body, encode_ms = measure(lambda: encoder(plain_rows), args.repeat)
+        baseline = baseline or len(body)
+
+        for encoding in ENCODINGS:
+            if encoding == "br" and not response_formats.brotli:
+                continue
+            if encoding == "identity":
+                size, total_ms = len(body), encode_ms
+            else:
+                compressed, compress_ms = measure(
+                    lambda: response_formats.compress(body, encoding), args.repeat
+                )
+                size, total_ms = len(compressed), encode_ms + compress_ms
+            print(
+                f"{name:<10} {encoding:<9} {size:>12,} "
+                f"{size / baseline:>7.2f} {total_ms:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
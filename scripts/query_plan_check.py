@@ -0,0 +1,506 @@
+"""
+쿼리 실행 계획 회귀 검사
+
+합성 데이터를 적재한 DB에 routers/의 주요 엔드포인트를 호출하여 실행된 SQL을 수집하고,
+각 쿼리의 실행 계획(SQLite: EXPLAIN QUERY PLAN, MySQL: EXPLAIN)을
+저장된 스냅샷(scripts/query_plans/<dialect>.json)과 비교합니다.
+
+다음의 경우 실패(종료 코드 1)로 처리합니다.
+- 스냅샷에서 인덱스로 접근하던 테이블을 전체 스캔하는 경우
+- 쿼리의 예상 행 수가 스냅샷의 row_budget을 넘는 경우
+- 스냅샷에 없는 쿼리가 --scan-threshold보다 큰 테이블을 전체 스캔하는 경우
+
+예상 행 수는 SQLite에서는 ANALYZE 통계(sqlite_stat1), MySQL에서는 EXPLAIN의 rows 값입니다.
+row_budget은 --update 시 예상 행 수 × --row-tolerance로 기록되며,
+스냅샷 파일에서 직접 수정한 값은 다음 --update에서도 유지됩니다.
+
+사용 예:
+    python scripts/query_plan_check.py
+    python scripts/query_plan_check.py --update
+    python scripts/query_plan_check.py --database-url mysql+pymysql://user:pw@localhost/ym_plan
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# app 디렉토리를 import 경로에 추가 (서버와 동일한 모듈 경로 사용)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from bench_queries import seed  # noqa: E402
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "query_plans"
+
+# 적재할 합성 데이터 규모 (스냅샷의 예상 행 수가 이 규모에 맞춰 기록됨)
+SEED_SIZES = {"users": 20, "backups": 20000, "catalogs": 10000}
+
+# 검사 대상 요청 (이름, 메서드, 경로, JSON 본문)
+# 경로의 {yesterday}는 실행 시점 하루 전(UTC)으로 바뀝니다.
+# 쓰기 요청은 데이터를 바꾸므로 조회 요청 뒤에 둡니다.
+REQUESTS = [
+    ("backup list", "GET", "/api/v1/backup-status?limit=100", None),
+    ("backup list deep page", "GET", "/api/v1/backup-status?skip=5000&limit=100", None),
+    ("backup list event", "GET", "/api/v1/backup-status?event_name=행사 7", None),
+    ("backup list fields", "GET", "/api/v1/backup-status?fields=id,name,cam", None),
+    (
+        "backup list filters",
+        "GET",
+        "/api/v1/backup-status?displayed_date_from=2024-03-01&displayed_date_to=2024-04-01"
+        "&incomplete_stage=clean",
+        None,
+    ),
+    ("backup list producer", "GET", "/api/v1/backup-status?producer_id=3", None),
+    (
+        "backup list fully backed up",
+        "GET",
+        "/api/v1/backup-status?fully_backed_up=true",
+        None,
+    ),
+    ("backup summary", "GET", "/api/v1/backup-status/summary", None),
+    ("backup events", "GET", "/api/v1/backup-status/events?preview_limit=5", None),
+    (
+        "backup changes",
+        "GET",
+        "/api/v1/backup-status/changes?since={yesterday}",
+        None,
+    ),
+    ("backup detail", "GET", "/api/v1/backup-status/2", None),
+    ("backup history", "GET", "/api/v1/backup-status/2/history", None),
+    ("backup batch get", "POST", "/api/v1/backup-status/batch-get", {"ids": [2, 3, 5]}),
+    ("users", "GET", "/api/v1/auth/users", None),
+    ("user backups", "GET", "/api/v1/auth/users/1/backups", None),
+    ("user stats", "GET", "/api/v1/auth/users/1/stats", None),
+    ("catalog list", "GET", "/api/v1/storage-catalogs?limit=100", None),
+    (
+        "catalog filter",
+        "GET",
+        "/api/v1/storage-catalogs?storage=HDD-03&year=2020",
+        None,
+    ),
+    ("catalog search", "GET", "/api/v1/storage-catalogs?q=수련회", None),
+    ("catalog search short", "GET", "/api/v1/storage-catalogs?q=수련", None),
+    ("catalog facets", "GET", "/api/v1/storage-catalogs/facets?year=2020", None),
+    ("catalog detail", "GET", "/api/v1/storage-catalogs/5", None),
+    ("jobs", "GET", "/api/v1/jobs?status=queued", None),
+    (
+        "login",
+        "POST",
+        "/api/v1/auth/login",
+        {"nickname": "닉네임1", "password": "x"},
+    ),
+    (
+        "backup mark complete",
+        "PATCH",
+        "/api/v1/backup-status/2/mark-complete?master=true&master_checker=1",
+        None,
+    ),
+    (
+        "backup update",
+        "PUT",
+        "/api/v1/backup-status/3",
+        {"description": "수정", "user_ids": [1, 2], "updated_by": 1},
+    ),
+    ("backup delete", "DELETE", "/api/v1/backup-status/4?deleted_by=1", None),
+    ("backup restore", "POST", "/api/v1/backup-status/4/restore", None),
+    ("catalog update", "PUT", "/api/v1/storage-catalogs/5", {"description": "수정"}),
+]
+
+# 실행 계획을 확인할 문장 (단순 INSERT ... VALUES는 제외)
+EXPLAINABLE = re.compile(
+    r"^\s*(SELECT|UPDATE|DELETE|WITH|INSERT\b.*\bSELECT\b)", re.I | re.S
+)
+
+# 인덱스를 사용하는 접근 방식
+INDEXED_ACCESS = ("search", "index_scan", "unique", "virtual")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="쿼리 실행 계획 회귀 검사")
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("DATABASE_URL"),
+        help="대상 DB URL (기본: 임시 SQLite 파일, MySQL은 migrations/가 적용된 빈 DB)",
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="현재 실행 계획으로 스냅샷을 갱신"
+    )
+    parser.add_argument(
+        "--row-tolerance",
+        type=float,
+        default=2.0,
+        help="--update 시 row_budget = 예상 행 수 × 이 값",
+    )
+    parser.add_argument(
+        "--scan-threshold",
+        type=int,
+        default=1000,
+        help="새 쿼리의 전체 스캔을 실패로 처리할 최소 테이블 행 수",
+    )
+    return parser.parse_args()
+
+
+def normalize_sql(statement: str) -> str:
+    """공백과 IN 목록의 바인드 파라미터 개수 차이를 없앤 비교용 SQL을 반환합니다."""
+    sql = " ".join(statement.split())
+    return re.sub(r"\((?:\?|%s)(?:, (?:\?|%s))+\)", "(?)", sql)
+
+
+def capture_requests(client, engine) -> Dict[str, List[tuple]]:
+    """
+    요청별로 실행된 SQL과 파라미터를 수집합니다.
+
+    Returns:
+        Dict[str, List[tuple]]: 요청 이름 -> [(SQL, 파라미터)] (비교용 SQL 기준 중복 제거)
+    """
+    from sqlalchemy import event
+
+    captured: List[tuple] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if not many and EXPLAINABLE.match(statement):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yesterday = (datetime.utcnow() - timedelta(days=1)).isoformat(timespec="seconds")
+    results = {}
+    try:
+        for name, method, path, body in REQUESTS:
+            captured.clear()
+            path = path.format(yesterday=yesterday)
+            response = client.request(method, path, json=body)
+            if response.status_code >= 400:
+                print(
+                    f"⚠️  {method} {path}: {response.status_code} {response.text[:200]}"
+                )
+            unique = {}
+            for statement, parameters in captured:
+                unique.setdefault(normalize_sql(statement), (statement, parameters))
+            results[name] = list(unique.values())
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return results
+
+
+class SQLitePlanner:
+    """EXPLAIN QUERY PLAN과 sqlite_stat1 통계로 테이블 접근 방식과 예상 행 수를 구합니다."""
+
+    def __init__(self, conn, table_names):
+        self.conn = conn
+        self.table_names = set(table_names)
+        conn.exec_driver_sql("ANALYZE")
+        self.stats: Dict[tuple, List[int]] = {}
+        for tbl, idx, stat in conn.exec_driver_sql(
+            "SELECT tbl, idx, stat FROM sqlite_stat1"
+        ):
+            self.stats[(tbl, idx)] = [int(n) for n in stat.split()[:8] if n.isdigit()]
+
+    def table_rows(self, table: str) -> int:
+        for (tbl, _), stat in self.stats.items():
+            if tbl == table and stat:
+                return stat[0]
+        return 0
+
+    def resolve_table(self, name: str) -> Optional[str]:
+        """별칭(users_1 등)을 실제 테이블명으로 바꿉니다. (서브쿼리면 None)"""
+        if name in self.table_names:
+            return name
+        base = re.sub(r"_\d+$", "", name)
+        return base if base in self.table_names else None
+
+    def explain(self, statement: str, parameters) -> Dict[str, Any]:
+        accesses = []
+        notes = set()
+        for row in self.conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ):
+            detail = row[-1]
+            if detail.startswith("USE TEMP B-TREE"):
+                notes.add("temp_btree")
+                continue
+            match = re.match(r"(SCAN|SEARCH) (\S+)(?: (.*))?$", detail)
+            if not match or match.group(2) == "CONSTANT":
+                continue
+            op, name, rest = match.group(1), match.group(2), match.group(3) or ""
+            table = self.resolve_table(name)
+            index_match = re.search(r"USING (?:COVERING )?INDEX (\S+)", rest)
+            index = index_match.group(1) if index_match else None
+
+            if "VIRTUAL TABLE" in rest:
+                access, rows = "virtual", None
+            elif "PRIMARY KEY" in rest:
+                access, rows = "unique", 1
+            elif op == "SEARCH" and index:
+                access = "search"
+                eq_count = len(re.findall(r"=\?", rest))
+                stat = self.stats.get((table, index), [])
+                rows = (
+                    stat[eq_count]
+                    if 0 < eq_count < len(stat)
+                    else self.table_rows(table)
+                )
+            elif index:
+                access, rows = "index_scan", self.table_rows(table)
+            elif table:
+                access, rows = "scan", self.table_rows(table)
+            else:
+                # 서브쿼리/CTE 결과 스캔 (원본 테이블 접근은 별도로 기록됨)
+                continue
+            accesses.append(
+                {"table": table or name, "access": access, "index": index, "rows": rows}
+            )
+        return {"accesses": accesses, "notes": sorted(notes)}
+
+
+class MySQLPlanner:
+    """EXPLAIN 결과로 테이블 접근 방식과 예상 행 수를 구합니다."""
+
+    ACCESS_TYPES = {
+        "ALL": "scan",
+        "index": "index_scan",
+        "const": "unique",
+        "eq_ref": "unique",
+        "system": "unique",
+        "fulltext": "virtual",
+    }
+
+    def __init__(self, conn, table_names):
+        self.conn = conn
+        self.table_names = set(table_names)
+        for table in self.table_names:
+            conn.exec_driver_sql(f"ANALYZE TABLE `{table}`")
+
+    def table_rows(self, table: str) -> int:
+        row = self.conn.exec_driver_sql(
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+            (table,),
+        ).first()
+        return int(row[0] or 0) if row else 0
+
+    def resolve_table(self, name: str) -> Optional[str]:
+        if name in self.table_names:
+            return name
+        base = re.sub(r"_\d+$", "", name)
+        return base if base in self.table_names else None
+
+    def explain(self, statement: str, parameters) -> Dict[str, Any]:
+        accesses = []
+        notes = set()
+        result = self.conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        for row in result.mappings():
+            extra = row.get("Extra") or ""
+            if "Using filesort" in extra or "Using temporary" in extra:
+                notes.add("temp_btree")
+            table = self.resolve_table(row.get("table") or "")
+            if table is None:
+                continue
+            accesses.append(
+                {
+                    "table": table,
+                    "access": self.ACCESS_TYPES.get(row.get("type"), "search"),
+                    "index": row.get("key"),
+                    "rows": int(row["rows"]) if row.get("rows") is not None else None,
+                }
+            )
+        return {"accesses": accesses, "notes": sorted(notes)}
+
+
+def build_snapshot(planner, captured, old_snapshot, tolerance: float) -> Dict:
+    """수집한 SQL의 실행 계획으로 스냅샷을 만듭니다."""
+    endpoints = {}
+    for name, method, path, _ in REQUESTS:
+        old_queries = {
+            query["sql"]: query
+            for query in old_snapshot.get("endpoints", {})
+            .get(name, {})
+            .get("queries", [])
+        }
+        queries = []
+        for statement, parameters in captured[name]:
+            sql = normalize_sql(statement)
+            plan = planner.explain(statement, parameters)
+            rows = sum(access["rows"] or 0 for access in plan["accesses"])
+            budget = max(math.ceil(rows * tolerance), 10)
+            old = old_queries.get(sql)
+            if old and old.get("row_budget", 0) >= rows:
+                # 직접 조정한 예산은 유지
+                budget = old["row_budget"]
+            queries.append({"sql": sql, **plan, "rows": rows, "row_budget": budget})
+        endpoints[name] = {"request": f"{method} {path}", "queries": queries}
+    return {"seed": SEED_SIZES, "endpoints": endpoints}
+
+
+def describe_access(access: Optional[Dict]) -> str:
+    if access is None:
+        return "(없음)"
+    if access["index"]:
+        return f"{access['access'].upper()} {access['index']}"
+    return access["access"].upper()
+
+
+def compare(old: Dict, new: Dict, planner, scan_threshold: int) -> tuple:
+    """
+    스냅샷과 현재 실행 계획을 비교합니다.
+
+    Returns:
+        tuple: (실패 수, 변경 수, 보고서 줄 목록)
+    """
+    failures = changes = 0
+    lines = []
+    for name, endpoint in new["endpoints"].items():
+        old_queries = {
+            query["sql"]: query
+            for query in old["endpoints"].get(name, {}).get("queries", [])
+        }
+        endpoint_lines = []
+        endpoint_failed = False
+
+        for query in endpoint["queries"]:
+            old_query = old_queries.pop(query["sql"], None)
+            if old_query is None:
+                changes += 1
+                endpoint_lines.append(f"  + 새 쿼리: {query['sql'][:120]}")
+                for access in query["accesses"]:
+                    if (
+                        access["access"] == "scan"
+                        and planner.table_rows(access["table"]) > scan_threshold
+                    ):
+                        endpoint_failed = True
+                        endpoint_lines.append(
+                            f"    ✗ {access['table']}: 전체 스캔 ({access['rows']}행)"
+                        )
+                continue
+
+            query_lines = []
+            old_accesses = {a["table"]: a for a in old_query["accesses"]}
+            new_accesses = {a["table"]: a for a in query["accesses"]}
+            for table in sorted(old_accesses.keys() | new_accesses.keys()):
+                before, after = old_accesses.get(table), new_accesses.get(table)
+                if describe_access(before) == describe_access(after):
+                    continue
+                lost_index = (
+                    before is not None
+                    and after is not None
+                    and before["access"] in INDEXED_ACCESS
+                    and after["access"] == "scan"
+                )
+                mark = "✗" if lost_index else "~"
+                endpoint_failed = endpoint_failed or lost_index
+                query_lines.append(
+                    f"    {mark} {table}: {describe_access(before)} → "
+                    f"{describe_access(after)}"
+                    + (" [인덱스를 사용하지 않음]" if lost_index else "")
+                )
+            if query["notes"] != old_query["notes"]:
+                query_lines.append(
+                    f"    ~ 정렬/임시 테이블: {old_query['notes'] or '없음'} → "
+                    f"{query['notes'] or '없음'}"
+                )
+            if query["rows"] > old_query["row_budget"]:
+                endpoint_failed = True
+                query_lines.append(
+                    f"    ✗ 예상 행 수 {old_query['rows']} → {query['rows']} "
+                    f"(예산 {old_query['row_budget']} 초과)"
+                )
+            elif query["rows"] != old_query["rows"]:
+                query_lines.append(
+                    f"    ~ 예상 행 수 {old_query['rows']} → {query['rows']}"
+                )
+            if query_lines:
+                changes += 1
+                endpoint_lines.append(f"  쿼리: {query['sql'][:120]}")
+                endpoint_lines.extend(query_lines)
+
+        for sql in old_queries:
+            changes += 1
+            endpoint_lines.append(f"  - 사라진 쿼리: {sql[:120]}")
+
+        if endpoint_lines:
+            failures += endpoint_failed
+            mark = "✗" if endpoint_failed else "~"
+            lines.append(f"{mark} {name}  ({endpoint['request']})")
+            lines.extend(endpoint_lines)
+            lines.append("")
+    return failures, changes, lines
+
+
+def main() -> None:
+    args = parse_args()
+    if not args.database_url:
+        db_path = Path(tempfile.mkdtemp(prefix="ym_plan_")) / "plan.db"
+        args.database_url = f"sqlite:///{db_path}"
+    # 앱 모듈이 설정을 읽기 전에 대상 DB를 지정
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["DEBUG"] = "False"
+
+    from fastapi.testclient import TestClient
+
+    from database import IS_SQLITE, Base, SessionLocal, create_sqlite_schema, engine
+    from main import app
+    from models.backup_status import BackupStatus
+
+    if IS_SQLITE:
+        create_sqlite_schema()
+    db = SessionLocal()
+    try:
+        if db.query(BackupStatus.id).count():
+            sys.exit("❌ 빈 DB를 지정해야 합니다. (스냅샷과 같은 데이터로 비교)")
+    finally:
+        db.close()
+    seed(engine, SEED_SIZES["users"], SEED_SIZES["backups"], SEED_SIZES["catalogs"])
+
+    captured = capture_requests(TestClient(app), engine)
+
+    snapshot_path = SNAPSHOT_DIR / f"{engine.dialect.name}.json"
+    old_snapshot = (
+        json.loads(snapshot_path.read_text(encoding="utf-8"))
+        if snapshot_path.exists()
+        else {}
+    )
+
+    with engine.connect() as conn:
+        planner_class = SQLitePlanner if IS_SQLITE else MySQLPlanner
+        planner = planner_class(conn, Base.metadata.tables)
+        new_snapshot = build_snapshot(
+            planner, captured, old_snapshot, args.row_tolerance
+        )
+        query_count = sum(
+            len(endpoint["queries"]) for endpoint in new_snapshot["endpoints"].values()
+        )
+
+        if args.update:
+            SNAPSHOT_DIR.mkdir(exist_ok=True)
+            snapshot_path.write_text(
+                json.dumps(new_snapshot, ensure_ascii=False, indent=2) + "\n",
+                encoding="utf-8",
+            )
+            print(f"✅ 스냅샷 갱신: {snapshot_path} (쿼리 {query_count}개)")
+            return
+
+        if not old_snapshot:
+            sys.exit(f"❌ 스냅샷이 없습니다: {snapshot_path} (--update로 생성)")
+
+        failures, changes, lines = compare(
+            old_snapshot, new_snapshot, planner, args.scan_threshold
+        )
+
+    print(
+        f"쿼리 실행 계획 검사: {engine.dialect.name} "
+        f"(엔드포인트 {len(REQUESTS)}개, 쿼리 {query_count}개)\n"
+    )
+    print("\n".join(lines) if lines else "변경 없음\n")
+    print(f"결과: 실패 {failures}, 변경 {changes}")
+    if failures:
+        print("의도한 변경이면 --update로 스냅샷을 갱신하세요.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+요청 트래픽 재생 도구
+
+TRAFFIC_CAPTURE=true로 수집한 트래픽 파일(JSONL)의 요청을 테스트 서버에
+수집 당시의 간격대로(1배속), N배속으로, 또는 최대한 빠르게 다시 보내고
+라우트별로 수집 당시와 재생 시의 응답 시간을 비교합니다.
+
+- 회전된 파일(capture.jsonl.1, .2, ...)도 함께 읽어 시간순으로 재생합니다.
+- 가려진 비밀 값([REDACTED])은 --secret 값으로 바꿔 보냅니다. (없으면 그대로 전송)
+- 구조만 기록한 본문(body_kind: shape)은 값 종류별 대체 값으로 채워 보냅니다.
+  (값이 달라 수집 당시와 응답 상태가 다를 수 있음, 값까지 재현하려면 TRAFFIC_CAPTURE_FULL_BODIES)
+- 본문을 기록하지 않은 요청(파일 업로드 등)은 건너뜁니다.
+- 쓰기 요청도 재생하므로 운영 서버가 아닌 테스트 서버를 대상으로 실행합니다.
+
+사용 예:
+    python scripts/replay_traffic.py app/traffic/capture.jsonl
+    python scripts/replay_traffic.py app/traffic/capture.jsonl --speed 5 --target http://localhost:8001
+    python scripts/replay_traffic.py app/traffic/capture.jsonl --speed 0 --read-only --report report.json
+"""
+
+import argparse
+import json
+import math
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# app 디렉토리를 import 경로에 추가 (서버와 동일한 모듈 경로 사용)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from services.traffic_capture import REDACTED  # noqa: E402
+
+# 재생 시 보내지 않는 요청 헤더 (본문에 맞춰 httpx가 설정)
+SKIPPED_HEADERS = ("content-type", "content-length")
+
+# 구조만 기록한 본문의 값 종류별 대체 값
+SHAPE_PLACEHOLDERS = {
+    "str": "replay",
+    "int": 1,
+    "float": 1.0,
+    "bool": False,
+    "null": None,
+}
+
+
+@dataclass
+class ReplayResult:
+    """요청 하나의 수집/재생 결과"""
+
+    route: str
+    captured_status: int
+    captured_ms: float
+    status: Optional[int] = None
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="요청 트래픽 재생")
+    parser.add_argument("capture", help="트래픽 파일 경로 (회전된 파일 포함)")
+    parser.add_argument(
+        "--target", default="http://localhost:8000", help="재생 대상 서버 주소"
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="재생 배속 (1: 수집 당시 간격, N: N배 빠르게, 0: 최대한 빠르게)",
+    )
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수")
+    parser.add_argument("--secret", help="가려진 비밀 값 대신 보낼 값")
+    parser.add_argument("--read-only", action="store_true", help="GET 요청만 재생")
+    parser.add_argument("--limit", type=int, help="재생할 최대 요청 수")
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="요청 타임아웃 (초)"
+    )
+    parser.add_argument("--report", help="요청별 결과와 요약을 저장할 JSON 파일 경로")
+    return parser.parse_args()
+
+
+def capture_files(path: Path) -> List[Path]:
+    """트래픽 파일과 회전된 파일을 오래된 순서로 반환합니다."""
+    rotated = sorted(
+        (
+            candidate
+            for candidate in path.parent.glob(f"{path.name}.*")
+            if candidate.suffix[1:].isdigit()
+        ),
+        key=lambda candidate: int(candidate.suffix[1:]),
+        reverse=True,
+    )
+    return rotated + ([path] if path.exists() else [])
+
+
+def load_entries(path: Path) -> List[Dict[str, Any]]:
+    """트래픽 파일의 기록을 시간순으로 읽습니다. (깨진 줄은 건너뜀)"""
+    entries = []
+    for file in capture_files(path):
+        with open(file, encoding="utf-8") as lines:
+            for line in lines:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+    entries.sort(key=lambda entry: entry["ts"])
+    return entries
+
+
+def fill_secret(value: Any, secret: Optional[str]) -> Any:
+    """가려진 비밀 값을 secret으로 바꿉니다. (secret이 없으면 그대로)"""
+    if secret is None:
+        return value
+    if value == REDACTED:
+        return secret
+    if isinstance(value, dict):
+        return {key: fill_secret(item, secret) for key, item in value.items()}
+    if isinstance(value, list):
+        return [fill_secret(item, secret) for item in value]
+    return value
+
+
+def fill_shape(shape: Any) -> Any:
+    """구조만 기록한 본문의 값 종류를 대체 값으로 바꿉니다. (REDACTED는 그대로)"""
+    if isinstance(shape, dict):
+        return {key: fill_shape(item) for key, item in shape.items()}
+    if isinstance(shape, list):
+        return [fill_shape(item) for item in shape]
+    return SHAPE_PLACEHOLDERS.get(shape, shape)
+
+
+def request_body(entry: Dict[str, Any], secret: Optional[str]) -> Any:
+    """기록된 본문으로 재생할 JSON 본문을 만듭니다. (본문이 없으면 None)"""
+    if entry["body_kind"] == "json":
+        return fill_secret(entry["body"], secret)
+    if entry["body_kind"] == "shape":
+        return fill_secret(fill_shape(entry["body"]), secret)
+    return None
+
+
+def replay_entry(
+    client: httpx.Client, entry: Dict[str, Any], secret: Optional[str]
+) -> ReplayResult:
+    """기록된 요청 하나를 다시 보냅니다."""
+    result = ReplayResult(
+        route=f"{entry['method']} {entry['route'] or entry['path']}",
+        captured_status=entry["status"],
+        captured_ms=entry["duration_ms"],
+    )
+    headers = [
+        (key, fill_secret(value, secret))
+        for key, value in entry["headers"]
+        if key not in SKIPPED_HEADERS
+    ]
+    started = time.perf_counter()
+    try:
+        response = client.request(
+            entry["method"],
+            entry["path"],
+            params=[tuple(fill_secret(pair, secret)) for pair in entry["query"]],
+            headers=headers,
+            json=request_body(entry, secret),
+        )
+        result.status = response.status_code
+    except httpx.HTTPError as e:
+        result.error = f"{e.__class__.__name__}: {e}"
+    result.duration_ms = (time.perf_counter() - started) * 1000
+    return result
+
+
+def percentile(values: List[float], percent: float) -> Optional[float]:
+    """최근접 순위 방식의 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(results: List[ReplayResult]) -> List[Dict[str, Any]]:
+    """라우트별(요청 수 내림차순)과 전체 응답 시간 비교 요약을 만듭니다."""
+    groups: Dict[str, List[ReplayResult]] = {}
+    for result in results:
+        groups.setdefault(result.route, []).append(result)
+    ordered = sorted(groups.items(), key=lambda item: (-len(item[1]), item[0]))
+
+    rows = []
+    for route, group in ordered + [("TOTAL", results)]:
+        captured = [result.captured_ms for result in group]
+        replayed = [result.duration_ms for result in group if result.error is None]
+        captured_p50 = percentile(captured, 50)
+        replay_p50 = percentile(replayed, 50)
+        rows.append(
+            {
+                "route": route,
+                "count": len(group),
+                "captured_p50_ms": captured_p50,
+                "captured_p95_ms": percentile(captured, 95),
+                "replay_p50_ms": replay_p50,
+                "replay_p95_ms": percentile(replayed, 95),
+                "p50_change_pct": (
+                    (replay_p50 - captured_p50) / captured_p50 * 100
+                    if captured_p50 and replay_p50 is not None
+                    else None
+                ),
+                "status_mismatches": sum(
+                    1
+                    for result in group
+                    if result.error is None and result.status != result.captured_status
+                ),
+                "errors": sum(1 for result in group if result.error is not None),
+            }
+        )
+    return rows
+
+
+def format_ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    width = max(len(row["route"]) for row in rows)
+    header = (
+        f"{'route':<{width}} {'count':>6} {'cap p50':>8} {'cap p95':>8} "
+        f"{'rep p50':>8} {'rep p95':>8} {'Δp50':>8} {'status≠':>7} {'errors':>6}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        if row["route"] == "TOTAL":
+            print("-" * len(header))
+        change = row["p50_change_pct"]
+        change_text = "-" if change is None else f"{change:+.0f}%"
+        print(
+            f"{row['route']:<{width}} {row['count']:>6} "
+            f"{format_ms(row['captured_p50_ms']):>8} "
+            f"{format_ms(row['captured_p95_ms']):>8} "
+            f"{format_ms(row['replay_p50_ms']):>8} "
+            f"{format_ms(row['replay_p95_ms']):>8} "
+            f"{change_text:>8} {row['status_mismatches']:>7} {row['errors']:>6}"
+        )
+
+
+def main() -> None:
+    args = parse_args()
+    entries = load_entries(Path(args.capture))
+    skipped = 0
+    replayable = []
+    for entry in entries:
+        if entry["body_kind"] == "omitted" or (
+            args.read_only and entry["method"] != "GET"
+        ):
+            skipped += 1
+            continue
+        replayable.append(entry)
+    if args.limit is not None:
+        replayable = replayable[: args.limit]
+    if not replayable:
+        print("재생할 요청이 없습니다.")
+        return
+
+    first_ts = replayable[0]["ts"]
+    captured_seconds = replayable[-1]["ts"] - first_ts
+    speed_text = "최대 속도" if args.speed <= 0 else f"{args.speed:g}배속"
+    print(f"대상: {args.target}")
+    print(
+        f"요청: {len(replayable)}건 (건너뜀 {skipped}건), "
+        f"수집 구간 {captured_seconds:.1f}s, {speed_text}, 동시 {args.concurrency}\n"
+    )
+
+    results: List[ReplayResult] = []
+    results_lock = threading.Lock()
+    max_lag = 0.0
+
+    def run(entry: Dict[str, Any]) -> None:
+        result = replay_entry(client, entry, args.secret)
+        with results_lock:
+            results.append(result)
+
+    started = time.perf_counter()
+    with httpx.Client(
+        base_url=args.target,
+        timeout=args.timeout,
+        limits=httpx.Limits(max_connections=args.concurrency),
+    ) as client, ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for entry in replayable:
+            if args.speed > 0:
+                due = (entry["ts"] - first_ts) / args.speed
+                delay = due - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    max_lag = max(max_lag, -delay)
+            executor.submit(run, entry)
+    elapsed = time.perf_counter() - started
+
+    rows = summarize(results)
+    print_report(rows)
+    print(
+        f"\n재생 시간 {elapsed:.1f}s ({len(results) / elapsed:.1f} req/s)"
+        + (f", 최대 일정 지연 {max_lag * 1000:.0f}ms" if args.speed > 0 else "")
+    )
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "target": args.target,
+                    "speed": args.speed,
+                    "elapsed_seconds": elapsed,
+                    "summary": rows,
+                    "results": [asdict(result) for result in results],
+                },
+                file,
+                ensure_ascii=False,
+                indent=2,
+                default=str,
+            )
+        print(f"결과 저장: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
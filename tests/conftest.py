@@ -0,0 +1,63 @@
+"""
+테스트 공통 설정
+
+앱 모듈이 설정을 읽기 전에 임시 SQLite DB와 결과 파일 경로를 지정하고,
+테스트마다 빈 스키마로 시작하는 TestClient를 제공합니다.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+TEST_DIR = Path(tempfile.mkdtemp(prefix="ym_test_"))
+
+# 앱 모듈 import 전에 설정 (settings는 import 시점에 읽힘)
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DIR / 'test.db'}"
+os.environ["DEBUG"] = "False"
+os.environ["JOB_RESULT_DIR"] = str(TEST_DIR / "job_results")
+os.environ["TRACING_FILE_PATH"] = str(TEST_DIR / "traces" / "spans.jsonl")
+os.environ["TRAFFIC_CAPTURE_PATH"] = str(TEST_DIR / "traffic" / "capture.jsonl")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+
+def reset_state() -> None:
+    """DB 테이블과 프로세스 내 캐시/스냅샷을 비웁니다."""
+    from database import engine
+    from services.backup_snapshot import backup_snapshot
+    from services.cache import storage_catalog_facet_cache
+    from services.catalog_tree import storage_catalog_tree
+
+    # 모델 밖의 객체(FTS5 테이블, 트리거)까지 지우도록 DB 파일을 삭제
+    engine.dispose()
+    (TEST_DIR / "test.db").unlink(missing_ok=True)
+    storage_catalog_facet_cache.invalidate()
+    storage_catalog_tree.invalidate()
+    backup_snapshot.loaded = False
+
+
+@pytest.fixture
+def client():
+    """빈 DB로 시작한 앱의 TestClient (lifespan에서 SQLite 스키마 생성)"""
+    from fastapi.testclient import TestClient
+
+    from main import app
+
+    reset_state()
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(client):
+    """테스트용 DB 세션"""
+    from database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
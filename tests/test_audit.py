@@ -0,0 +1,84 @@
+"""
+백업 상태 변경 이력(감사 로그) 테스트
+"""
+
+from datetime import datetime
+
+from database import WriteSessionLocal
+from models.user import User
+from services.audit import (
+    ACTION_COMPLETED,
+    AuditRecorder,
+    HistoryEntry,
+    audit_recorder,
+    format_history_value,
+    stage_change_entries,
+)
+
+
+def flush_history():
+    """큐에 쌓인 이력을 모두 기록합니다. (stop()은 남은 이력을 쓴 뒤 종료)"""
+    audit_recorder.stop()
+    audit_recorder.start()
+
+
+def test_format_history_value():
+    assert format_history_value(None) is None
+    assert format_history_value(True) == "true"
+    assert format_history_value([1, 2]) == "1,2"
+    assert format_history_value(datetime(2024, 1, 2)) == "2024-01-02T00:00:00"
+    assert len(format_history_value("x" * 2000)) == 1000
+
+
+def test_stage_change_entries_record_checker():
+    entries = stage_change_entries(
+        1,
+        [("cam", False, True), ("master_checker", None, 3), ("clean", None, None)],
+        {"cam": True, "cam_checker": 2, "master_checker": 3},
+    )
+    assert [
+        (entry.action, entry.field, entry.old_value, entry.new_value, entry.changed_by)
+        for entry in entries
+    ] == [
+        (ACTION_COMPLETED, "cam", "false", "true", 2),
+        (ACTION_COMPLETED, "master_checker", None, "3", 3),
+    ]
+
+
+def test_full_queue_drops_entries():
+    recorder = AuditRecorder(WriteSessionLocal, max_queue_size=2)
+    recorder.record(
+        HistoryEntry(backup_status_id=1, action="updated") for _ in range(5)
+    )
+    assert recorder.dropped == 3
+    assert recorder.written == 0
+
+
+def test_history_endpoint(client, db):
+    db.add(User(name="김작업", nickname="worker", password="pw"))
+    db.commit()
+    backup_id = client.post(
+        "/api/v1/backup-status", json={"name": "백업", "created_by": 1}
+    ).json()["id"]
+    client.put(
+        f"/api/v1/backup-status/{backup_id}",
+        json={"name": "수정", "description": None, "updated_by": 1},
+    )
+    client.patch(
+        f"/api/v1/backup-status/{backup_id}/mark-complete",
+        params={"cam": True, "cam_checker": 1},
+    )
+    client.delete(f"/api/v1/backup-status/{backup_id}", params={"deleted_by": 1})
+    flush_history()
+
+    response = client.get(f"/api/v1/backup-status/{backup_id}/history")
+    assert response.status_code == 200
+    history = [
+        (item["action"], item["field"], item["old_value"], item["new_value"])
+        for item in response.json()
+    ]
+    assert history[0][0] == "deleted"
+    assert history[-1][0] == "created"
+    assert ("updated", "name", "백업", "수정") in history
+    assert ("completed", "cam", None, "true") in history
+    assert ("completed", "cam_checker", None, "1") in history
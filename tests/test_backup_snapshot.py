@@ -0,0 +1,134 @@
+"""
+백업 상태 인메모리 스냅샷 테스트
+
+스냅샷 조회가 DB 조회와 같은 결과를 반환하는지 확인합니다.
+"""
+
+import pytest
+from sqlalchemy import event
+
+pytest.importorskip("numpy")
+
+from database import engine  # noqa: E402
+from models.user import User  # noqa: E402
+from services.backup_snapshot import backup_snapshot  # noqa: E402
+
+EVENT_NAMES = ["Spring Festival", "spring camp", "SPRING", "Autumn", None]
+
+
+def create_backups(client):
+    for index, event_name in enumerate(EVENT_NAMES):
+        response = client.post(
+            "/api/v1/backup-status",
+            json={
+                "name": f"backup {index}",
+                "event_name": event_name,
+                "displayed_date": f"2024-01-0{index + 1}T00:00:00",
+                "cam": index % 2 == 0,
+                "created_by": 1,
+            },
+        )
+        assert response.status_code == 201
+
+
+def list_ids(client, **params):
+    response = client.get("/api/v1/backup-status", params=params)
+    assert response.status_code == 200
+    return [item["id"] for item in response.json()]
+
+
+@pytest.mark.parametrize("event_name", ["spring", "SPRING", "Festival", "tum"])
+def test_event_name_filter_matches_db(client, event_name):
+    create_backups(client)
+    from_db = list_ids(client, event_name=event_name)
+
+    backup_snapshot.load()
+    assert backup_snapshot.loaded
+    assert list_ids(client, event_name=event_name) == from_db
+
+
+def test_summary_matches_db(client):
+    create_backups(client)
+    from_db = client.get("/api/v1/backup-status/summary").json()
+
+    backup_snapshot.load()
+    assert client.get("/api/v1/backup-status/summary").json() == from_db
+
+
+def db_and_snapshot_ids(client, **params):
+    """같은 조건의 DB 조회 결과와 스냅샷 조회 결과"""
+    backup_snapshot.loaded = False
+    from_db = list_ids(client, **params)
+    backup_snapshot.load()
+    return from_db, list_ids(client, **params)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"incomplete_stage": "cam"},
+        {"fully_backed_up": False},
+        {"displayed_date_from": "2024-01-02T00:00:00", "limit": 2, "skip": 1},
+        {"fields": "id,name,producers"},
+    ],
+)
+def test_filters_match_db(client, params):
+    create_backups(client)
+    from_db, from_snapshot = db_and_snapshot_ids(client, **params)
+    assert from_snapshot == from_db
+
+
+def test_snapshot_follows_writes(client, db):
+    db.add(User(name="김작업", nickname="worker", password="pw"))
+    db.commit()
+    create_backups(client)
+    backup_snapshot.load()
+    first, second = list_ids(client)[:2]
+
+    client.patch(f"/api/v1/backup-status/{first}/mark-complete", params={"cam": False})
+    response = client.delete(
+        f"/api/v1/backup-status/{second}", params={"deleted_by": 1}
+    )
+    assert response.status_code == 204
+    client.post(
+        "/api/v1/backup-status",
+        json={"name": "new", "displayed_date": "2025-01-01T00:00:00", "created_by": 1},
+    )
+
+    assert second not in list_ids(client)
+    snapshot_ids = list_ids(client, incomplete_stage="cam")
+    from_db, _ = db_and_snapshot_ids(client, incomplete_stage="cam")
+    assert snapshot_ids == from_db
+
+
+def test_same_date_pages_match_db(client):
+    for index in range(5):
+        client.post(
+            "/api/v1/backup-status",
+            json={
+                "name": f"same day {index}",
+                "displayed_date": "2024-01-01T00:00:00",
+                "created_by": 1,
+            },
+        )
+
+    def all_pages():
+        return [list_ids(client, skip=skip, limit=2) for skip in range(0, 6, 2)]
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    backup_snapshot.loaded = False
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        from_db = all_pages()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    # SQLite는 인덱스 순서로 우연히 맞을 수 있으므로 정렬 조건도 확인
+    assert any("backup_status.id DESC" in statement for statement in statements)
+
+    backup_snapshot.load()
+    # 같은 날짜는 ID 역순으로 고정되어 페이지 사이에 겹치거나 빠지는 항목이 없음
+    assert from_db == all_pages() == [[5, 4], [3, 2], [1]]
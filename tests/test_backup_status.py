@@ -0,0 +1,284 @@
+"""
+백업 상태 API 테스트
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.backup_status import STAGE_MASK_ALL, STAGE_MASK_BITS, BackupStatus
+from models.backup_status_archive import BackupStatusArchive
+from models.m_user_backup_status_archive import MUserBackupStatusArchive
+from models.user import User
+from services.backup_archive import archive_deleted_backups
+
+
+def create_users(db):
+    db.add_all(
+        [
+            User(name="김작업", nickname="worker", password="pw"),
+            User(name="이확인", nickname="checker", password="pw"),
+        ]
+    )
+    db.commit()
+
+
+def create_backup(client, **fields):
+    response = client.post(
+        "/api/v1/backup-status",
+        json={"name": "backup", "created_by": 1, **fields},
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def delete_backup(client, backup_id):
+    response = client.delete(
+        f"/api/v1/backup-status/{backup_id}", params={"deleted_by": 1}
+    )
+    assert response.status_code == 204
+
+
+def list_ids(client, **params):
+    response = client.get("/api/v1/backup-status", params=params)
+    assert response.status_code == 200, response.text
+    return [item["id"] for item in response.json()]
+
+
+def test_archive_and_restore(client, db):
+    create_users(db)
+    kept = create_backup(client, user_ids=[1])
+    archived = [create_backup(client, user_ids=[1, 2]) for _ in range(2)]
+    for backup_id in archived:
+        delete_backup(client, backup_id)
+
+    assert archive_deleted_backups(db, retention_days=0, batch_size=1) == 2
+    assert [row.id for row in db.query(BackupStatus)] == [kept]
+    assert db.query(BackupStatusArchive).count() == 2
+    assert db.query(MUserBackupStatusArchive).count() == 4
+
+    response = client.post(f"/api/v1/backup-status/{archived[0]}/restore")
+    assert response.status_code == 200
+    assert sorted(list_ids(client)) == [kept, archived[0]]
+    restored = client.get("/api/v1/auth/users/2/backups").json()
+    assert [item["producers"] for item in restored] == [["김작업", "이확인"]]
+    db.rollback()
+    assert db.query(BackupStatusArchive).count() == 1
+
+
+def test_archive_keeps_recently_deleted(client, db):
+    create_users(db)
+    backup_id = create_backup(client)
+    delete_backup(client, backup_id)
+
+    assert archive_deleted_backups(db, retention_days=30, batch_size=10) == 0
+    assert client.post(f"/api/v1/backup-status/{backup_id}/restore").status_code == 200
+
+
+def test_restore_errors(client):
+    backup_id = create_backup(client)
+
+    assert client.post(f"/api/v1/backup-status/{backup_id}/restore").status_code == 409
+    assert client.post("/api/v1/backup-status/999/restore").status_code == 404
+
+
+def get_changes(client, **params):
+    response = client.get("/api/v1/backup-status/changes", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_changes_pages_and_tombstones(client, db):
+    create_users(db)
+    since = (datetime.utcnow() - timedelta(minutes=1)).isoformat()
+    first, second, third = (create_backup(client) for _ in range(3))
+    delete_backup(client, second)
+
+    changes = get_changes(client, since=since, limit=2)
+    assert changes["has_more"] is True
+    assert changes["resync_required"] is False
+    seen = [item["id"] for item in changes["items"]] + changes["deleted_ids"]
+
+    changes = get_changes(
+        client,
+        since=changes["next_since"],
+        since_id=changes["next_since_id"],
+        limit=2,
+    )
+    assert changes["has_more"] is False
+    seen += [item["id"] for item in changes["items"]] + changes["deleted_ids"]
+    assert sorted(seen) == [first, second, third]
+    assert changes["deleted_ids"] == [second]
+
+
+def test_changes_requires_resync_after_retention(client):
+    changes = get_changes(client, since="2000-01-01T00:00:00")
+    assert changes["resync_required"] is True
+    assert changes["items"] == [] and changes["deleted_ids"] == []
+
+
+def test_list_sparse_fields(client, db):
+    create_users(db)
+    backup_id = create_backup(client, user_ids=[2], cam=True, cam_checker=1)
+
+    response = client.get(
+        "/api/v1/backup-status",
+        params={"fields": "producers,cam_checker_name, id,id"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": backup_id, "cam_checker_name": "김작업", "producers": ["이확인"]}
+    ]
+
+    response = client.get("/api/v1/backup-status", params={"fields": "id,password"})
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+
+def test_batch_get_keeps_request_order(client, db):
+    create_users(db)
+    first, second, deleted = (create_backup(client, user_ids=[1]) for _ in range(3))
+    delete_backup(client, deleted)
+
+    response = client.post(
+        "/api/v1/backup-status/batch-get",
+        json={"ids": [second, 999, first, second, deleted]},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [second, first]
+    assert body["items"][0]["producers"] == ["김작업"]
+    assert body["missing_ids"] == [999, deleted]
+
+    response = client.post("/api/v1/backup-status/batch-get", json={"ids": []})
+    assert response.status_code == 422
+
+
+@pytest.fixture
+def filter_rows(client, db):
+    """필터 테스트용 항목 (이름 -> ID)"""
+    create_users(db)
+    rows = {
+        "done": dict(
+            cam=True,
+            master=True,
+            clean=True,
+            final_product=True,
+            displayed_date="2024-01-10T00:00:00",
+        ),
+        "cam_only": dict(
+            cam=True,
+            cam_checker=2,
+            user_ids=[1],
+            displayed_date="2024-02-10T00:00:00",
+        ),
+        "empty": dict(master=False, user_ids=[2], displayed_date="2024-03-10T00:00:00"),
+        "undated": dict(clean=True, clean_checker=2),
+    }
+    return {name: create_backup(client, **fields) for name, fields in rows.items()}
+
+
+@pytest.mark.parametrize(
+    "params, expected",
+    [
+        ({}, ["empty", "cam_only", "done", "undated"]),
+        (
+            {
+                "displayed_date_from": "2024-02-01T00:00:00",
+                "displayed_date_to": "2024-03-10T00:00:00",
+            },
+            ["cam_only"],
+        ),
+        ({"incomplete_stage": "cam"}, ["empty", "undated"]),
+        ({"incomplete_stage": "master"}, ["empty", "cam_only", "undated"]),
+        ({"checker_id": 2}, ["cam_only", "undated"]),
+        ({"producer_id": 1}, ["cam_only"]),
+        ({"fully_backed_up": True}, ["done"]),
+        ({"fully_backed_up": False, "producer_id": 2}, ["empty"]),
+    ],
+)
+def test_list_filters(client, filter_rows, params, expected):
+    assert list_ids(client, **params) == [filter_rows[name] for name in expected]
+
+
+def test_list_rejects_empty_date_range(client):
+    response = client.get(
+        "/api/v1/backup-status",
+        params={
+            "displayed_date_from": "2024-02-01T00:00:00",
+            "displayed_date_to": "2024-02-01T00:00:00",
+        },
+    )
+    assert response.status_code == 400
+    response = client.get("/api/v1/backup-status", params={"incomplete_stage": "x"})
+    assert response.status_code == 422
+
+
+def test_events_group_progress_and_preview(client, db):
+    create_users(db)
+    spring = [
+        create_backup(
+            client,
+            event_name="봄 행사",
+            cam=index == 0,
+            displayed_date=f"2024-04-0{index + 1}T00:00:00",
+        )
+        for index in range(3)
+    ]
+    winter = create_backup(
+        client, event_name="겨울 행사", displayed_date="2024-01-01T00:00:00"
+    )
+    no_event = create_backup(client)
+    delete_backup(client, create_backup(client, event_name="봄 행사"))
+
+    response = client.get("/api/v1/backup-status/events", params={"preview_limit": 2})
+    assert response.status_code == 200
+    events = response.json()
+    assert [event["event_name"] for event in events] == ["봄 행사", "겨울 행사", None]
+
+    assert events[0]["item_count"] == 3
+    assert events[0]["cam_count"] == 1
+    assert events[0]["first_displayed_date"] == "2024-04-01T00:00:00"
+    assert events[0]["last_displayed_date"] == "2024-04-03T00:00:00"
+    assert [item["id"] for item in events[0]["items"]] == [spring[2], spring[1]]
+    assert [item["id"] for item in events[1]["items"]] == [winter]
+    assert [item["id"] for item in events[2]["items"]] == [no_event]
+
+    response = client.get(
+        "/api/v1/backup-status/events",
+        params={"limit": 1, "preview_skip": 2, "incomplete_stage": "cam"},
+    )
+    events = response.json()
+    assert [(event["event_name"], event["item_count"]) for event in events] == [
+        ("봄 행사", 2)
+    ]
+    assert events[0]["items"] == []
+
+    response = client.get("/api/v1/backup-status/events", params={"preview_limit": 0})
+    assert all(event["items"] == [] for event in response.json())
+
+
+def test_stage_mask_tracks_stage_columns(client, db):
+    backup_id = create_backup(client, cam=True, clean=False)
+
+    def stage_mask():
+        db.rollback()
+        return db.get(BackupStatus, backup_id).stage_mask
+
+    assert stage_mask() == STAGE_MASK_BITS["cam"]
+    client.put(f"/api/v1/backup-status/{backup_id}", json={"master": True})
+    assert stage_mask() == STAGE_MASK_BITS["cam"] | STAGE_MASK_BITS["master"]
+    client.patch(
+        f"/api/v1/backup-status/{backup_id}/mark-complete",
+        params={"clean": True, "final_product": True},
+    )
+    assert stage_mask() == STAGE_MASK_ALL
+
+    backup = db.get(BackupStatus, backup_id)
+    assert backup.backup_progress == {
+        "cam": True,
+        "master": True,
+        "clean": True,
+        "final_product": True,
+    }
+    assert "stage_mask" not in client.get(f"/api/v1/backup-status/{backup_id}").json()
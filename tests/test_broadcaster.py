@@ -0,0 +1,140 @@
+"""
+백업 상태 변경 이벤트 브로드캐스터 테스트
+"""
+
+import asyncio
+
+from models.user import User
+
+from services.broadcaster import (
+    EVENT_COMPLETED,
+    EVENT_CREATED,
+    EVENT_DELETED,
+    EVENT_RESYNC,
+    EVENT_UPDATED,
+    BroadcastEvent,
+    Broadcaster,
+    backup_status_broadcaster,
+)
+
+
+def drain(queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+def test_publish_reaches_every_subscriber():
+    async def scenario():
+        broadcaster = Broadcaster()
+        async with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+            assert broadcaster.subscriber_count == 2
+            broadcaster.publish(EVENT_CREATED, {"id": 1})
+            await asyncio.sleep(0)
+            received = [drain(first), drain(second)]
+        assert broadcaster.subscriber_count == 0
+        return received
+
+    for events in asyncio.run(scenario()):
+        assert [(event.id, event.type, event.data) for event in events] == [
+            (1, EVENT_CREATED, {"id": 1})
+        ]
+
+
+def test_reconnect_replays_missed_events():
+    async def scenario():
+        broadcaster = Broadcaster(history_size=3)
+        for backup_id in range(1, 6):
+            broadcaster.publish(EVENT_UPDATED, {"id": backup_id})
+        async with broadcaster.subscribe(last_event_id=3) as queue:
+            replayed = drain(queue)
+        async with broadcaster.subscribe(last_event_id=1) as queue:
+            too_old = drain(queue)
+        return replayed, too_old
+
+    replayed, too_old = asyncio.run(scenario())
+    assert [event.id for event in replayed] == [4, 5]
+    assert [(event.id, event.type) for event in too_old] == [(5, EVENT_RESYNC)]
+
+
+def test_reconnect_after_restart_gets_resync():
+    async def scenario():
+        # 재시작된 프로세스는 이벤트 ID를 1부터 다시 발행
+        broadcaster = Broadcaster()
+        async with broadcaster.subscribe(last_event_id=500) as queue:
+            before_publish = drain(queue)
+        broadcaster.publish(EVENT_UPDATED, {"id": 1})
+        async with broadcaster.subscribe(last_event_id=500) as queue:
+            after_publish = drain(queue)
+        async with broadcaster.subscribe(last_event_id=1) as queue:
+            up_to_date = drain(queue)
+        return before_publish, after_publish, up_to_date
+
+    before_publish, after_publish, up_to_date = asyncio.run(scenario())
+    assert [(event.id, event.type) for event in before_publish] == [(0, EVENT_RESYNC)]
+    assert [(event.id, event.type) for event in after_publish] == [(1, EVENT_RESYNC)]
+    assert up_to_date == []
+
+
+def test_slow_subscriber_gets_resync():
+    async def scenario():
+        broadcaster = Broadcaster(queue_size=2)
+        async with broadcaster.subscribe() as queue:
+            for backup_id in range(1, 4):
+                broadcaster.publish(EVENT_UPDATED, {"id": backup_id})
+            await asyncio.sleep(0)
+            return drain(queue)
+
+    events = asyncio.run(scenario())
+    assert [(event.id, event.type) for event in events] == [(3, EVENT_RESYNC)]
+
+
+def test_close_ends_stream():
+    async def scenario():
+        broadcaster = Broadcaster()
+        async with broadcaster.subscribe() as queue:
+            broadcaster.close()
+            return await asyncio.wait_for(queue.get(), timeout=1)
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_to_sse():
+    event = BroadcastEvent(id=7, type=EVENT_DELETED, data={"id": 3, "name": "백업"})
+    assert (
+        event.to_sse() == 'id: 7\nevent: deleted\ndata: {"id": 3, "name": "백업"}\n\n'
+    )
+
+
+def test_write_endpoints_publish_events(client, db, monkeypatch):
+    db.add(User(name="김작업", nickname="worker", password="pw"))
+    db.commit()
+    published = []
+    monkeypatch.setattr(
+        backup_status_broadcaster,
+        "publish",
+        lambda event_type, data: published.append((event_type, data)),
+    )
+
+    response = client.post(
+        "/api/v1/backup-status", json={"name": "백업", "created_by": 1}
+    )
+    backup_id = response.json()["id"]
+    client.put(
+        f"/api/v1/backup-status/{backup_id}", json={"name": "수정", "updated_by": 1}
+    )
+    client.patch(
+        f"/api/v1/backup-status/{backup_id}/mark-complete",
+        params={"cam": True, "cam_checker": 1},
+    )
+    client.delete(f"/api/v1/backup-status/{backup_id}", params={"deleted_by": 1})
+
+    assert [event_type for event_type, _ in published] == [
+        EVENT_CREATED,
+        EVENT_UPDATED,
+        EVENT_COMPLETED,
+        EVENT_DELETED,
+    ]
+    assert published[1][1]["name"] == "수정"
+    assert published[-1][1] == {"id": backup_id}
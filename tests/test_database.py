@@ -0,0 +1,140 @@
+"""
+SQLite 스키마 생성 테스트
+
+create_sqlite_schema가 인덱스를 일정한 순서로 만들고,
+검색 인덱스(FTS5)와 생성 컬럼이 없는 기존 DB에도 추가하는지,
+SQLite 연결 설정과 요청 기한이 적용되는지 확인합니다.
+"""
+
+import sqlite3
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from config import get_settings
+from database import (
+    Base,
+    DeadlineExceeded,
+    SessionLocal,
+    WriteSessionLocal,
+    create_sqlite_schema,
+    engine,
+)
+from middleware.load_shedding import is_timeout_error
+
+settings = get_settings()
+
+
+def index_names(conn, table):
+    return [
+        row[0]
+        for row in conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+            "AND sql IS NOT NULL ORDER BY rowid",
+            (table,),
+        )
+    ]
+
+
+def test_indexes_are_created_in_name_order(client):
+    with engine.connect() as conn:
+        for table in Base.metadata.sorted_tables:
+            names = index_names(conn, table.name)
+            # MySQL 전용 인덱스(FULLTEXT)는 SQLite에서 만들지 않음
+            assert set(names) <= {index.name for index in table.indexes}
+            assert names == sorted(names)
+        assert index_names(conn, "backup_status")
+
+
+def test_missing_fts_index_is_rebuilt(client):
+    response = client.post(
+        "/api/v1/storage-catalogs",
+        json={"storage": "NAS1", "activity_name": "여름 수련회", "year": 2024},
+    )
+    assert response.status_code == 201
+    with engine.begin() as conn:
+        for trigger in ("ai", "ad", "au"):
+            conn.exec_driver_sql(f"DROP TRIGGER storage_catalog_fts_{trigger}")
+        conn.exec_driver_sql("DROP TABLE storage_catalog_fts")
+
+    create_sqlite_schema()
+
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            "SELECT rowid FROM storage_catalog_fts WHERE storage_catalog_fts MATCH '수련회'"
+        ).all()
+    assert [row[0] for row in rows] == [response.json()["id"]]
+
+
+def test_sqlite_connection_pragmas(client):
+    with engine.connect() as conn:
+        pragma = lambda name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+        assert pragma("journal_mode") == "wal"
+        assert pragma("foreign_keys") == 1
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == settings.sqlite_busy_timeout_ms
+
+
+def test_write_session_takes_write_lock_at_begin(client):
+    db = WriteSessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+        other = sqlite3.connect(engine.url.database, timeout=0)
+        try:
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                other.execute("BEGIN IMMEDIATE")
+        finally:
+            other.close()
+    finally:
+        db.close()
+
+
+def run_with_deadline(seconds, statement):
+    db = SessionLocal()
+    db.info["deadline"] = time.monotonic() + seconds
+    try:
+        return db.execute(text(statement)).scalar()
+    finally:
+        db.close()
+
+
+def test_deadline_interrupts_statements(client):
+    with pytest.raises(DeadlineExceeded):
+        run_with_deadline(-1, "SELECT 1")
+
+    with pytest.raises(OperationalError) as error:
+        run_with_deadline(
+            0.05,
+            "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) "
+            "SELECT count(*) FROM (SELECT x FROM c LIMIT 1000000000)",
+        )
+    assert is_timeout_error(error.value)
+    assert run_with_deadline(1, "SELECT 1") == 1
+
+
+def test_stage_mask_is_added_to_existing_table(client):
+    response = client.post(
+        "/api/v1/backup-status",
+        json={"name": "backup", "cam": True, "master": True, "created_by": 1},
+    )
+    assert response.status_code == 201
+    with engine.begin() as conn:
+        for name in index_names(conn, "backup_status"):
+            if "stage_mask" in name:
+                conn.exec_driver_sql(f"DROP INDEX {name}")
+        conn.exec_driver_sql("ALTER TABLE backup_status DROP COLUMN stage_mask")
+
+    create_sqlite_schema()
+
+    with engine.connect() as conn:
+        assert (
+            conn.exec_driver_sql("SELECT stage_mask FROM backup_status").scalar() == 3
+        )
+        names = index_names(conn, "backup_status")
+    assert {
+        index.name
+        for index in Base.metadata.tables["backup_status"].indexes
+        if "stage_mask" in index.name
+    } <= set(names)
@@ -0,0 +1,177 @@
+"""
+백그라운드 작업 API 테스트
+"""
+
+import csv
+import io
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import BaseModel
+
+from database import SessionLocal, WriteSessionLocal
+from models.job import Job
+from services.job_types import JOB_TYPES, job_runner
+from services.jobs import JOB_FAILED, JOB_QUEUED, JobRunner, JobType
+
+
+class EmptyParams(BaseModel):
+    pass
+
+
+def fail_job(db, params, context):
+    context.set_total(2)
+    context.advance()
+    raise RuntimeError("일부러 실패")
+
+
+@pytest.fixture
+def runner(client, tmp_path, monkeypatch):
+    """테스트 DB와 API 서버와 같은 결과 디렉토리를 사용하는 워커 1개짜리 작업 실행기"""
+    monkeypatch.setattr(job_runner, "result_dir", tmp_path)
+    runner = JobRunner(
+        SessionLocal,
+        WriteSessionLocal,
+        {**JOB_TYPES, "fail": JobType("fail", EmptyParams, fail_job)},
+        workers=1,
+        poll_interval=0.05,
+        result_dir=str(tmp_path),
+    )
+    yield runner
+    runner.stop()
+
+
+def create_job(client, job_type, **params):
+    response = client.post(
+        "/api/v1/jobs", json={"job_type": job_type, "params": params}
+    )
+    assert response.status_code == 202, response.text
+    assert response.json()["status"] == JOB_QUEUED
+    return response.json()["id"]
+
+
+def wait_for_job(client, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/v1/jobs/{job_id}").json()
+        if job["status"] not in ("queued", "running"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"작업 {job_id}이 끝나지 않았습니다: {job}")
+
+
+def test_export_and_summary_jobs(client, runner):
+    for index in range(3):
+        client.post(
+            "/api/v1/backup-status",
+            json={
+                "name": f"backup-{index}",
+                "event_name": "행사" if index else None,
+                "cam": index == 1,
+                "created_by": 1,
+            },
+        )
+    export_id = create_job(client, "backup_status_export", format="ndjson")
+    summary_id = create_job(client, "backup_summary", format="csv")
+    assert client.get(f"/api/v1/jobs/{export_id}/download").status_code == 409
+
+    runner.start()
+    export_job = wait_for_job(client, export_id)
+    summary_job = wait_for_job(client, summary_id)
+
+    assert export_job["status"] == "succeeded"
+    assert (export_job["processed"], export_job["total"]) == (3, 3)
+    assert export_job["result"] == {"rows": 3}
+    assert export_job["has_result_file"] is True
+    response = client.get(f"/api/v1/jobs/{export_id}/download")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["name"] for row in rows] == ["backup-0", "backup-1", "backup-2"]
+
+    assert summary_job["result"] == {"events": 2}
+    response = client.get(f"/api/v1/jobs/{summary_id}/download")
+    summary = {
+        row["event_name"]: row for row in csv.DictReader(io.StringIO(response.text))
+    }
+    assert summary["행사"]["item_count"] == "2"
+    assert summary["행사"]["cam_count"] == "1"
+
+
+def test_failed_job_records_error(client, db, runner):
+    # 테스트용 작업 종류는 API에 등록되어 있지 않으므로 직접 대기 상태로 저장
+    job = Job(job_type="fail", params={}, status=JOB_QUEUED)
+    db.add(job)
+    db.commit()
+    job_id = job.id
+    runner.start()
+    job = wait_for_job(client, job_id)
+
+    assert job["status"] == JOB_FAILED
+    assert job["error"] == "일부러 실패"
+    assert job["processed"] == 1
+    assert client.get(f"/api/v1/jobs/{job_id}/download").status_code == 409
+
+
+def test_create_job_validation(client):
+    assert client.post("/api/v1/jobs", json={"job_type": "nope"}).status_code == 400
+    response = client.post(
+        "/api/v1/jobs",
+        json={"job_type": "backup_status_export", "params": {"format": "xml"}},
+    )
+    assert response.status_code == 422
+    assert client.get("/api/v1/jobs/999").status_code == 404
+
+
+def test_recover_stale_jobs(client, db, runner):
+    stale = datetime.utcnow() - timedelta(seconds=runner.stale_seconds + 1)
+    requeued = Job(job_type="fail", status="running", attempts=1, heartbeat_at=stale)
+    exhausted = Job(
+        job_type="fail",
+        status="running",
+        attempts=runner.max_attempts,
+        heartbeat_at=stale,
+    )
+    alive = Job(job_type="fail", status="running", heartbeat_at=datetime.utcnow())
+    db.add_all([requeued, exhausted, alive])
+    db.commit()
+
+    assert runner.recover_stale_jobs() == 2
+    db.expire_all()
+    assert [job.status for job in (requeued, exhausted, alive)] == [
+        JOB_QUEUED,
+        JOB_FAILED,
+        "running",
+    ]
+
+
+def test_download_from_separate_worker_process(client, db, tmp_path, monkeypatch):
+    """워커와 API 서버가 같은 결과 저장소를 서로 다른 경로에 마운트한 경우"""
+    storage = tmp_path / "volume"
+    storage.mkdir()
+    for mount in ("worker_mount", "api_mount"):
+        (tmp_path / mount).symlink_to(storage)
+    worker = JobRunner(
+        SessionLocal, WriteSessionLocal, JOB_TYPES, workers=1, poll_interval=0.05
+    )
+    # 생성자는 symlink를 풀어 버리므로 컨테이너별 마운트 경로를 직접 지정
+    worker.result_dir = tmp_path / "worker_mount"
+    monkeypatch.setattr(job_runner, "result_dir", tmp_path / "api_mount")
+
+    client.post("/api/v1/backup-status", json={"name": "백업", "created_by": 1})
+    job_id = create_job(client, "backup_status_export", format="ndjson")
+    worker.start()
+    try:
+        assert wait_for_job(client, job_id)["status"] == "succeeded"
+    finally:
+        worker.stop()
+
+    # 워커의 마운트 경로가 아닌 결과 디렉토리 기준 상대 경로로 저장
+    assert db.get(Job, job_id).result_path == f"{job_id}/backup_status_{job_id}.ndjson"
+    response = client.get(f"/api/v1/jobs/{job_id}/download")
+    assert response.status_code == 200
+    assert json.loads(response.text.splitlines()[0])["name"] == "백업"
+
+    # 저장소를 공유하지 않으면 결과 파일을 찾을 수 없음
+    monkeypatch.setattr(job_runner, "result_dir", tmp_path / "elsewhere")
+    assert client.get(f"/api/v1/jobs/{job_id}/download").status_code == 410
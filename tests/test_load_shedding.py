@@ -0,0 +1,135 @@
+"""
+부하 제어(load shedding) 테스트
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from middleware.load_shedding import (
+    PRIORITY_READ,
+    PRIORITY_WRITE,
+    AdmissionController,
+    LoadSheddingMiddleware,
+    Overloaded,
+    is_timeout_error,
+)
+
+
+def test_write_reserved_slots():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=2, write_reserved=1)
+        await controller.acquire(PRIORITY_READ, None, timeout=0)
+        with pytest.raises(Overloaded):
+            await controller.acquire(PRIORITY_READ, None, timeout=0)
+        await controller.acquire(PRIORITY_WRITE, None, timeout=0)
+        return controller
+
+    controller = asyncio.run(scenario())
+    assert (controller.in_flight, controller.shed) == (2, 1)
+
+
+def test_waiters_are_admitted_by_priority():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1)
+        await controller.acquire(PRIORITY_READ, None, timeout=0)
+        order = []
+
+        async def wait(priority, name):
+            await controller.acquire(priority, None, timeout=1)
+            order.append(name)
+            controller.release(None)
+
+        tasks = [
+            asyncio.create_task(wait(PRIORITY_READ, "read")),
+            asyncio.create_task(wait(PRIORITY_WRITE, "write")),
+        ]
+        await asyncio.sleep(0)
+        assert controller.queued == 2
+        controller.release(None)
+        await asyncio.gather(*tasks)
+        return order, controller
+
+    order, controller = asyncio.run(scenario())
+    assert order == ["write", "read"]
+    assert (controller.in_flight, controller.queued) == (0, 0)
+
+
+def test_route_limit_does_not_block_other_routes():
+    async def scenario():
+        controller = AdmissionController(
+            max_concurrency=3, route_limits={"GET /big": 1}
+        )
+        await controller.acquire(PRIORITY_READ, "GET /big", timeout=0)
+        blocked = asyncio.create_task(
+            controller.acquire(PRIORITY_READ, "GET /big", timeout=0.05)
+        )
+        await asyncio.sleep(0)
+        await controller.acquire(PRIORITY_READ, None, timeout=0.05)
+        with pytest.raises(Overloaded):
+            await blocked
+        return controller
+
+    controller = asyncio.run(scenario())
+    assert (controller.in_flight, controller.shed) == (2, 1)
+
+
+def make_app(**options):
+    """요청 기한을 그대로 돌려주는 테스트 앱"""
+    app = FastAPI()
+
+    @app.get("/api/items/{item_id}")
+    async def get_item(item_id: int, request: Request):
+        return {"deadline": getattr(request.state, "deadline", None)}
+
+    @app.post("/api/import")
+    async def import_items(request: Request):
+        return {"deadline": getattr(request.state, "deadline", None)}
+
+    app.add_middleware(LoadSheddingMiddleware, **options)
+    return app
+
+
+def test_middleware_sheds_when_full():
+    app = make_app(
+        max_concurrency=1,
+        route_limits={"GET /api/items/{item_id}": 0},
+        exempt_routes=["POST /api/import"],
+        max_queue_wait_ms=0,
+        retry_after_seconds=3,
+    )
+    with TestClient(app) as client:
+        response = client.get("/api/items/1")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "3"
+
+        # 제외 라우트는 슬롯과 요청 기한을 사용하지 않음
+        response = client.post("/api/import")
+        assert response.status_code == 200
+        assert response.json() == {"deadline": None}
+
+
+def test_middleware_sets_deadline():
+    with TestClient(make_app(max_concurrency=1)) as client:
+        response = client.get("/api/items/1")
+    assert response.status_code == 200
+    assert response.json()["deadline"] is not None
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (3024, True),
+        (1205, True),
+        (1062, False),
+        ("database is locked", True),
+        ("no such table: x", False),
+    ],
+)
+def test_is_timeout_error(error, expected):
+    assert (
+        is_timeout_error(OperationalError("SELECT 1", {}, Exception(error))) is expected
+    )
@@ -0,0 +1,65 @@
+"""
+mark-complete 쓰기 병합기 테스트
+"""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from database import WriteSessionLocal
+from models.backup_status import BackupStatus
+from models.user import User
+from services.mark_complete_coalescer import (
+    BackupStatusNotFoundError,
+    MarkCompleteCoalescer,
+    apply_stage_changes,
+)
+
+
+@pytest.fixture
+def coalescer(db):
+    coalescer = MarkCompleteCoalescer(WriteSessionLocal, window_ms=200)
+    coalescer.start()
+    yield coalescer
+    coalescer.stop()
+
+
+def create_backups(db, count):
+    db.add(User(name="김확인", nickname="checker", password="pw"))
+    backups = [BackupStatus(name=f"backup-{index}") for index in range(count)]
+    db.add_all(backups)
+    db.commit()
+    return [backup.id for backup in backups]
+
+
+def test_apply_stage_changes_ignores_none():
+    backup = BackupStatus(name="backup", cam=False, master=True)
+    diffs = apply_stage_changes(backup, {"cam": True, "master": True, "clean": None})
+    assert diffs == [("cam", False, True)]
+    assert backup.cam is True and backup.clean is None
+
+
+def test_batch_isolates_failures(coalescer, db):
+    first, second = create_backups(db, 2)
+
+    futures = [
+        coalescer.submit(first, {"cam": True, "cam_checker": 1}),
+        coalescer.submit(second, {"master": True, "master_checker": 999}),
+        coalescer.submit(404, {"cam": True}),
+        coalescer.submit(first, {"master": True}),
+    ]
+
+    assert futures[0].result(timeout=5).cam is True
+    with pytest.raises(IntegrityError):
+        futures[1].result(timeout=5)
+    with pytest.raises(BackupStatusNotFoundError):
+        futures[2].result(timeout=5)
+    result = futures[3].result(timeout=5)
+    assert (result.cam, result.cam_checker, result.master) == (True, 1, True)
+
+    db.expire_all()
+    assert db.get(BackupStatus, second).master is not True
+
+
+def test_submit_requires_running_worker(db):
+    with pytest.raises(RuntimeError):
+        MarkCompleteCoalescer(WriteSessionLocal).submit(1, {"cam": True})
@@ -0,0 +1,179 @@
+"""
+관리 API 메모리 프로파일링 테스트
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from config import get_settings
+from middleware.memory_profiling import MemoryProfilingMiddleware
+from services.memory_profiler import MemoryProfiler, memory_profiler
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture
+def admin(client, monkeypatch):
+    """관리 토큰을 설정한 테스트 클라이언트 (끝나면 프로파일링 중지)"""
+    monkeypatch.setattr(get_settings(), "admin_token", "secret")
+    yield client
+    memory_profiler.stop()
+    memory_profiler.reset()
+
+
+def test_admin_token_required(client, monkeypatch):
+    response = client.get("/api/v1/admin/memory")
+    assert response.status_code == 403
+
+    monkeypatch.setattr(get_settings(), "admin_token", "secret")
+    assert client.get("/api/v1/admin/memory").status_code == 401
+    response = client.get("/api/v1/admin/memory", headers={"X-Admin-Token": "nope"})
+    assert response.status_code == 401
+
+
+def test_memory_profiling_lifecycle(admin):
+    assert admin.get("/api/v1/admin/memory/top", headers=ADMIN).status_code == 409
+
+    response = admin.post("/api/v1/admin/memory/start?frames=3", headers=ADMIN)
+    assert response.status_code == 200
+    assert (response.json()["enabled"], response.json()["frames"]) == (True, 3)
+
+    admin.get("/api/v1/backup-status")
+    admin.get("/api/v1/backup-status")
+    profile = admin.get("/api/v1/admin/memory", headers=ADMIN).json()
+    routes = {row["route"]: row for row in profile["routes"]}
+    assert routes["GET /api/v1/backup-status"]["requests"] == 2
+    assert profile["traced_current_bytes"] > 0
+
+    response = admin.get(
+        "/api/v1/admin/memory/top",
+        params={"group_by": "traceback", "limit": 5},
+        headers=ADMIN,
+    )
+    top = response.json()
+    assert top["group_by"] == "traceback"
+    assert 0 < len(top["sites"]) <= 5
+    assert top["sites"][0]["traceback"]
+    response = admin.get(
+        "/api/v1/admin/memory/top", params={"group_by": "nope"}, headers=ADMIN
+    )
+    assert response.status_code == 422
+
+    # 멈춰도 라우트별 집계는 초기화 전까지 유지
+    profile = admin.post("/api/v1/admin/memory/stop", headers=ADMIN).json()
+    assert profile["enabled"] is False
+    assert profile["routes"]
+    profile = admin.post("/api/v1/admin/memory/reset", headers=ADMIN).json()
+    assert profile["routes"] == []
+
+
+def test_middleware_groups_unmatched_routes():
+    profiler = MemoryProfiler()
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return {"data": [item_id] * 1000}
+
+    app.add_middleware(MemoryProfilingMiddleware, profiler=profiler)
+    client = TestClient(app)
+
+    # 꺼져 있을 때는 기록하지 않음
+    client.get("/items/1")
+    assert profiler.status()["routes"] == []
+
+    profiler.start()
+    try:
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/missing/1")
+        routes = {row["route"]: row for row in profiler.status()["routes"]}
+    finally:
+        profiler.stop()
+
+    assert set(routes) == {"GET /items/{item_id}", "GET (unmatched)"}
+    item = routes["GET /items/{item_id}"]
+    assert item["requests"] == 2
+    assert item["peak_max_bytes"] >= item["peak_avg_bytes"] > 0
+
+
+async def call(app, path, started=None):
+    """ASGI 앱을 직접 호출합니다. (started: 응답 시작 시 설정할 이벤트)"""
+    scope = {
+        "type": "http",
+        # 2.4 이상이면 스트리밍 응답이 연결 종료 수신을 기다리지 않음
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start" and started is not None:
+            started.set()
+
+    await app(scope, receive, send)
+
+
+@pytest.mark.parametrize(
+    "exclude_stream, small_peak_is_reset", [(True, True), (False, False)]
+)
+def test_open_stream_does_not_hold_peak(exclude_stream, small_peak_is_reset):
+    profiler = MemoryProfiler()
+    app = FastAPI()
+    closed = asyncio.Event()
+
+    @app.get("/stream")
+    def stream():
+        async def events():
+            yield b"open\n"
+            await closed.wait()
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/alloc/{size}")
+    def alloc(size: int):
+        data = bytearray(size)
+        return {"size": len(data)}
+
+    wrapped = MemoryProfilingMiddleware(
+        app, profiler, exclude_routes=["GET /stream"] if exclude_stream else []
+    )
+
+    async def scenario():
+        started = asyncio.Event()
+        stream_task = asyncio.create_task(call(wrapped, "/stream", started))
+        await started.wait()
+        await call(wrapped, "/alloc/5000000")
+        await call(wrapped, "/alloc/10")
+        closed.set()
+        await stream_task
+
+    profiler.start()
+    try:
+        asyncio.run(scenario())
+        routes = {row["route"]: row for row in profiler.status()["routes"]}
+    finally:
+        profiler.stop()
+
+    assert routes["GET /alloc/{size}"]["peak_max_bytes"] >= 5000000
+    # 스트림을 제외하지 않으면 연결이 열려 있는 동안 최대값이 초기화되지 않아
+    # 작은 요청에도 앞선 큰 요청의 할당이 잡힘
+    small_peak = routes["GET /alloc/{size}"]["last_peak_bytes"]
+    assert (small_peak < 1000000) is small_peak_is_reset
+    assert ("GET /stream" in routes) is not exclude_stream
+    assert profiler._in_flight == 0
@@ -0,0 +1,90 @@
+"""
+쿼리 실행 계획 회귀 테스트
+
+scripts/query_plan_check.py를 별도 프로세스로 실행하여
+저장된 스냅샷(scripts/query_plans/sqlite.json) 대비 실패가 없는지 확인합니다.
+(검사기는 자체 임시 DB에 합성 데이터를 적재하므로 다른 테스트와 DB를 공유하지 않음)
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "query_plan_check.py"
+
+
+def test_query_plans_match_snapshot(tmp_path):
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(SCRIPT),
+            "--database-url",
+            f"sqlite:///{tmp_path / 'plan.db'}",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "결과: 실패 0," in result.stdout
+
+
+def load_checker():
+    sys.path.insert(0, str(SCRIPT.parent))
+    import query_plan_check
+
+    return query_plan_check
+
+
+class FakePlanner:
+    def table_rows(self, table):
+        return 20000
+
+
+def snapshot(access, index, rows=10):
+    return {
+        "endpoints": {
+            "backup list": {
+                "request": "GET /api/v1/backup-status",
+                "queries": [
+                    {
+                        "sql": "SELECT * FROM backup_status",
+                        "accesses": [
+                            {
+                                "table": "backup_status",
+                                "access": access,
+                                "index": index,
+                                "rows": rows,
+                            }
+                        ],
+                        "notes": [],
+                        "rows": rows,
+                        "row_budget": rows * 2,
+                    }
+                ],
+            }
+        }
+    }
+
+
+def test_lost_index_is_failure():
+    checker = load_checker()
+    failures, _, lines = checker.compare(
+        snapshot("search", "ix_backup_status_deleted"),
+        snapshot("scan", None),
+        FakePlanner(),
+        scan_threshold=1000,
+    )
+    assert failures == 1
+    assert any("인덱스를 사용하지 않음" in line for line in lines)
+
+
+def test_row_budget_exceeded_is_failure():
+    checker = load_checker()
+    failures, _, _ = checker.compare(
+        snapshot("search", "ix_backup_status_deleted", rows=10),
+        snapshot("search", "ix_backup_status_deleted", rows=50),
+        FakePlanner(),
+        scan_threshold=1000,
+    )
+    assert failures == 1
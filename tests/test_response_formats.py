@@ -0,0 +1,113 @@
+"""
+응답 형식 협상 테스트
+"""
+
+import pytest
+
+from services import response_formats
+from services.response_formats import (
+    MEDIA_COLUMNAR,
+    MEDIA_JSON,
+    MEDIA_MSGPACK,
+    choose_content_encoding,
+    choose_media_type,
+    parse_quality_header,
+    to_columnar,
+)
+
+
+def create_backups(client, count):
+    for index in range(count):
+        response = client.post(
+            "/api/v1/backup-status",
+            json={"name": f"backup-{index}", "event_name": "행사", "created_by": 1},
+        )
+        assert response.status_code == 201
+
+
+def test_parse_quality_header():
+    assert parse_quality_header("text/html;q=0.2, Application/JSON, */*;q=x") == [
+        ("application/json", 1.0),
+        ("text/html", 0.2),
+        ("*/*", 0.0),
+    ]
+    assert parse_quality_header(None) == []
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, MEDIA_JSON),
+        ("text/html", MEDIA_JSON),
+        ("application/json;q=0.5, application/vnd.ym.columnar+json", MEDIA_COLUMNAR),
+        ("application/x-msgpack", MEDIA_MSGPACK),
+        ("application/msgpack;q=0, */*", MEDIA_JSON),
+    ],
+)
+def test_choose_media_type(accept, expected):
+    if expected == MEDIA_MSGPACK:
+        pytest.importorskip("msgpack")
+    assert choose_media_type(accept) == expected
+
+
+def test_msgpack_falls_back_to_json_without_module(monkeypatch):
+    monkeypatch.setattr(response_formats, "msgpack", None)
+    assert choose_media_type("application/msgpack") == MEDIA_JSON
+
+
+def test_choose_content_encoding(monkeypatch):
+    assert choose_content_encoding(None) is None
+    assert choose_content_encoding("gzip, identity") == "gzip"
+    assert choose_content_encoding("gzip;q=0.5, *;q=0.1") == "gzip"
+    assert choose_content_encoding("br;q=0") is None
+
+    monkeypatch.setattr(response_formats, "brotli", None)
+    assert choose_content_encoding("br, *;q=0.5") == "gzip"
+
+
+def test_choose_content_encoding_prefers_brotli():
+    pytest.importorskip("brotli")
+    assert choose_content_encoding("gzip, br") == "br"
+
+
+def test_to_columnar():
+    assert to_columnar([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]) == {
+        "count": 2,
+        "columns": {"id": [1, 2], "name": ["a", "b"]},
+    }
+    assert to_columnar([]) == {"count": 0, "columns": {}}
+
+
+def test_list_formats_match_json(client):
+    create_backups(client, 30)
+    rows = client.get("/api/v1/backup-status").json()
+
+    response = client.get("/api/v1/backup-status", headers={"Accept": MEDIA_COLUMNAR})
+    assert response.headers["content-type"] == MEDIA_COLUMNAR
+    columnar = response.json()
+    assert columnar["count"] == 30
+    assert columnar["columns"]["id"] == [row["id"] for row in rows]
+
+    response = client.get(
+        "/api/v1/backup-status",
+        headers={"Accept": MEDIA_JSON, "Accept-Encoding": "gzip"},
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"].startswith("Accept, Accept-Encoding")
+    assert response.json() == rows
+
+
+def test_list_msgpack(client):
+    msgpack = pytest.importorskip("msgpack")
+    create_backups(client, 2)
+    rows = client.get("/api/v1/backup-status").json()
+
+    response = client.get("/api/v1/backup-status", headers={"Accept": MEDIA_MSGPACK})
+    assert response.headers["content-type"] == MEDIA_MSGPACK
+    assert msgpack.unpackb(response.content) == rows
+
+
+def test_small_body_is_not_compressed(client):
+    create_backups(client, 1)
+    response = client.get("/api/v1/backup-status", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,281 @@
+"""
+저장소 카탈로그 API 테스트
+"""
+
+import pytest
+
+from database import DeadlineExceeded
+from routers import storage_catalog
+from routers.storage_catalog import build_boolean_query, build_fts5_query
+from services.cache import QueryCache
+
+CATALOGS = [
+    {
+        "storage": "NAS1",
+        "category": "행사",
+        "year": 2023,
+        "month": 7,
+        "activity_name": "여름 수련회",
+    },
+    {
+        "storage": "NAS1",
+        "category": "행사",
+        "year": 2024,
+        "month": 7,
+        "activity_name": "여름 수련회",
+    },
+    {
+        "storage": "NAS1",
+        "category": "예배",
+        "year": 2024,
+        "month": 12,
+        "activity_name": "성탄 예배",
+    },
+    {
+        "storage": "NAS2",
+        "category": "행사",
+        "year": 2024,
+        "activity_name": "체육대회",
+        "description": "운동장 촬영본",
+    },
+]
+
+
+def create_catalogs(client, catalogs=CATALOGS):
+    ids = []
+    for catalog in catalogs:
+        response = client.post("/api/v1/storage-catalogs", json=catalog)
+        assert response.status_code == 201, response.text
+        ids.append(response.json()["id"])
+    return ids
+
+
+def facet_values(facets, name):
+    return {item["value"]: item["count"] for item in facets[name]}
+
+
+def test_facets_exclude_own_filter(client):
+    create_catalogs(client)
+
+    facets = client.get(
+        "/api/v1/storage-catalogs/facets", params={"storage": "NAS1", "year": 2024}
+    ).json()
+
+    # storage facet은 storage 필터를 제외한 year=2024로만 좁혀짐
+    assert facet_values(facets, "storage") == {"NAS1": 2, "NAS2": 1}
+    assert facet_values(facets, "year") == {2023: 1, 2024: 2}
+    assert facet_values(facets, "month") == {7: 1, 12: 1}
+
+
+def test_facets_refresh_after_write(client):
+    create_catalogs(client)
+    before = client.get("/api/v1/storage-catalogs/facets").json()
+    assert facet_values(before, "storage") == {"NAS1": 3, "NAS2": 1}
+
+    create_catalogs(client, [{"storage": "NAS3", "activity_name": "새 항목"}])
+
+    after = client.get("/api/v1/storage-catalogs/facets").json()
+    assert facet_values(after, "storage") == {"NAS1": 3, "NAS2": 1, "NAS3": 1}
+    assert facet_values(after, "year")[None] == 1
+
+
+def test_query_cache_drops_result_computed_across_invalidate():
+    cache = QueryCache()
+
+    def compute():
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get_or_compute("key", compute) == "stale"
+    assert cache.get_or_compute("key", lambda: "fresh") == "fresh"
+
+
+def search(client, q):
+    response = client.get("/api/v1/storage-catalogs", params={"q": q})
+    assert response.status_code == 200
+    return [item["activity_name"] for item in response.json()]
+
+
+def test_search_uses_full_text_index(client):
+    create_catalogs(client)
+
+    assert search(client, "수련회") == ["여름 수련회", "여름 수련회"]
+    assert search(client, "운동장") == ["체육대회"]
+    assert search(client, "성탄 예배") == ["성탄 예배"]
+
+
+def test_short_search_terms_fall_back_to_like(client):
+    create_catalogs(client)
+
+    # trigram으로 찾을 수 없는 2자 검색어는 LIKE로 검색
+    assert search(client, "체육") == ["체육대회"]
+    assert search(client, "100%") == []
+
+
+def test_search_query_builders():
+    assert build_boolean_query('여름 +수련회* "x"') == "+여름 +수련회"
+    assert build_fts5_query('수련회 "여름"') == '"수련회" """여름"""'
+    assert build_fts5_query("수련회 여") == ""
+
+
+def import_file(client, name, content, **params):
+    return client.post(
+        "/api/v1/storage-catalogs/import",
+        params=params,
+        files={"file": (name, content.encode("utf-8"))},
+    )
+
+
+def test_import_csv_reports_invalid_lines(client):
+    content = (
+        "storage,category,year,month,activity_name\n"
+        "NAS1,행사,2024,5,체육대회\n"
+        "NAS1,행사,이천,5,잘못된 연도\n"
+        "NAS2,,2024,,\n"
+        "NAS2,예배,2024,12,성탄 예배\n"
+    )
+
+    result = import_file(client, "catalogs.csv", content, batch_size=1).json()
+
+    assert (result["total"], result["inserted"], result["failed"]) == (4, 2, 2)
+    assert [error["line"] for error in result["errors"]] == [3, 4]
+    assert sorted(search(client, "대회") + search(client, "예배")) == [
+        "성탄 예배",
+        "체육대회",
+    ]
+
+
+def test_import_ndjson_dry_run_does_not_store(client):
+    content = '{"storage": "NAS1", "activity_name": "a"}\nnot json\n'
+
+    result = import_file(client, "catalogs.ndjson", content, dry_run=True).json()
+
+    assert (result["inserted"], result["failed"]) == (1, 1)
+    assert client.get("/api/v1/storage-catalogs").json() == []
+
+
+def test_import_rejects_unknown_format(client):
+    assert import_file(client, "catalogs.txt", "x").status_code == 400
+
+
+def test_interrupted_import_refreshes_committed_batches(client, monkeypatch):
+    create_catalogs(client)
+    assert client.get("/api/v1/storage-catalogs/tree").json()["count"] == 4
+    client.get("/api/v1/storage-catalogs/facets")
+
+    def interrupted_rows(file, fmt):
+        yield 2, {"storage": "NAS3", "activity_name": "첫 배치"}
+        yield 3, {"storage": "NAS3", "activity_name": "둘째 배치"}
+        raise DeadlineExceeded()
+
+    monkeypatch.setattr(storage_catalog, "iter_import_rows", interrupted_rows)
+    with pytest.raises(DeadlineExceeded):
+        import_file(client, "catalogs.csv", "", batch_size=1)
+
+    facets = client.get("/api/v1/storage-catalogs/facets").json()
+    assert facet_values(facets, "storage")["NAS3"] == 2
+    assert client.get("/api/v1/storage-catalogs/tree").json()["count"] == 6
+
+
+def tree(client, **params):
+    response = client.get("/api/v1/storage-catalogs/tree", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def children(node):
+    return [(child["value"], child["count"]) for child in node["children"]]
+
+
+def test_tree_levels_and_pagination(client):
+    create_catalogs(client)
+
+    root = tree(client)
+    assert (root["level"], root["count"], root["child_level"]) == ("root", 4, "storage")
+    assert children(root) == [("NAS1", 3), ("NAS2", 1)]
+
+    assert children(tree(client, storage="NAS1")) == [(2023, 1), (2024, 2)]
+    assert children(tree(client, storage="NAS2", year=2024)) == [(None, 1)]
+
+    month = tree(client, storage="NAS1", year=2024, month=12)
+    assert month["child_level"] == "activity"
+    assert [item["activity_name"] for item in month["activities"]] == ["성탄 예배"]
+    assert tree(client, storage="NAS2", year=2024, month=0)["count"] == 1
+
+    page = tree(client, storage="NAS1", skip=1, limit=1)
+    assert page["total_children"] == 2
+    assert children(page) == [(2024, 2)]
+
+    response = client.get("/api/v1/storage-catalogs/tree", params={"year": 2024})
+    assert response.status_code == 400
+    response = client.get("/api/v1/storage-catalogs/tree", params={"storage": "NAS9"})
+    assert response.status_code == 404
+
+
+def test_tree_follows_catalog_writes(client):
+    ids = create_catalogs(client)
+    assert children(tree(client)) == [("NAS1", 3), ("NAS2", 1)]
+
+    client.put(f"/api/v1/storage-catalogs/{ids[0]}", json={"storage": "NAS2"})
+    client.delete(f"/api/v1/storage-catalogs/{ids[2]}")
+    create_catalogs(client, [{"storage": "NAS3", "activity_name": "새 항목"}])
+
+    assert children(tree(client)) == [("NAS1", 1), ("NAS2", 2), ("NAS3", 1)]
+    assert children(tree(client, storage="NAS2")) == [(2023, 1), (2024, 1)]
+
+
+def test_create_duplicate_natural_key_conflicts(client):
+    create_catalogs(client)
+    response = client.post("/api/v1/storage-catalogs", json=CATALOGS[3])
+    assert response.status_code == 409
+
+
+def test_upsert_updates_description_in_place(client):
+    catalog_id = create_catalogs(client)[3]
+
+    response = client.put(
+        "/api/v1/storage-catalogs/upsert",
+        json={**CATALOGS[3], "description": "새 설명"},
+    )
+    assert response.status_code == 200
+    assert response.json()["id"] == catalog_id
+    assert response.json()["description"] == "새 설명"
+
+    response = client.put(
+        "/api/v1/storage-catalogs/upsert",
+        json={**CATALOGS[3], "month": 3},
+    )
+    assert response.json()["id"] != catalog_id
+    assert tree(client)["count"] == 5
+
+
+def test_bulk_upsert_is_idempotent(client):
+    items = [{**catalog, "description": "동기화"} for catalog in CATALOGS]
+    for _ in range(2):
+        response = client.put(
+            "/api/v1/storage-catalogs/bulk-upsert", json={"items": items}
+        )
+        assert response.status_code == 200
+        assert response.json() == {"upserted": 4}
+
+    catalogs = client.get("/api/v1/storage-catalogs").json()
+    assert len(catalogs) == 4
+    assert {catalog["description"] for catalog in catalogs} == {"동기화"}
+    assert facet_values(
+        client.get("/api/v1/storage-catalogs/facets").json(), "storage"
+    ) == {"NAS1": 3, "NAS2": 1}
+
+
+def test_mysql_upsert_uses_on_duplicate_key_update():
+    from sqlalchemy.dialects import mysql
+
+    class MySQLBind:
+        dialect = mysql.dialect()
+
+    sql = str(
+        storage_catalog.build_catalog_upsert(MySQLBind()).compile(
+            dialect=mysql.dialect()
+        )
+    )
+    assert "ON DUPLICATE KEY UPDATE" in sql
+    assert "id = last_insert_id(storage_catalog.id)" in sql
@@ -0,0 +1,161 @@
+"""
+요청 추적(tracing) 테스트
+"""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import create_engine, text
+
+from middleware.tracing import TracingMiddleware, route_template
+from services import tracing
+from services.tracing import (
+    FileSpanExporter,
+    OtlpSpanExporter,
+    Tracer,
+    instrument_engine,
+    instrument_fastapi,
+    parse_traceparent,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+class ListExporter:
+    """내보낸 span을 리스트에 모읍니다."""
+
+    def __init__(self):
+        self.spans = []
+
+    def export(self, spans):
+        self.spans.extend(spans)
+
+
+class Item(BaseModel):
+    id: int
+    total: int
+
+
+@pytest.fixture
+def traced(monkeypatch):
+    """모든 요청을 기록하는 전역 추적기와 추적 미들웨어를 붙인 테스트 앱"""
+    exporter = ListExporter()
+    monkeypatch.setattr(tracing.tracer, "sample_rate", 1.0)
+    monkeypatch.setattr(tracing.tracer, "exporter", exporter)
+
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    instrument_fastapi()
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}", response_model=Item)
+    def get_item(item_id: int):
+        with engine.connect() as conn:
+            total = conn.execute(text("SELECT 40 + 2")).scalar()
+        return {"id": item_id, "total": total}
+
+    app.add_middleware(TracingMiddleware)
+    tracing.tracer.start()
+    with TestClient(app) as client:
+        yield client, exporter
+    tracing.tracer.stop()
+    engine.dispose()
+
+
+def test_parse_traceparent():
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01") == (
+        TRACE_ID,
+        PARENT_ID,
+        True,
+    )
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00")[2] is False
+    assert parse_traceparent(f"00-{'0' * 32}-{PARENT_ID}-01") is None
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent(None) is None
+
+
+def test_route_template():
+    assert (
+        route_template("/api/v1/backup-status/3", "/backup-status/{backup_id}")
+        == "/api/v1/backup-status/{backup_id}"
+    )
+    assert route_template("/items/3", "/items/{item_id}") == "/items/{item_id}"
+
+
+def test_request_spans(traced):
+    client, exporter = traced
+    response = client.get("/items/7")
+    tracing.tracer.stop()
+
+    assert response.json() == {"id": 7, "total": 42}
+    trace_id = response.headers["x-trace-id"]
+    assert response.headers["traceparent"].startswith(f"00-{trace_id}-")
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["GET /items/{item_id}"]
+    assert root.parent_id is None
+    assert root.kind == "server"
+    assert root.attributes["http.status_code"] == 200
+    assert spans["db.query"].attributes["db.statement"] == "SELECT 40 + 2"
+    assert spans["response.serialize"].attributes["response_model"] == "Item"
+    assert {span.trace_id for span in exporter.spans} == {trace_id}
+    assert all(span.parent_id == root.span_id for span in exporter.spans[:-1])
+
+
+def test_incoming_traceparent_is_continued(traced):
+    client, exporter = traced
+
+    response = client.get(
+        "/items/1", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"}
+    )
+    tracing.tracer.stop()
+
+    # 호출자가 샘플링하지 않은 trace는 ID만 이어받고 기록하지 않음
+    assert response.headers["x-trace-id"] == TRACE_ID
+    assert exporter.spans == []
+
+
+def test_unsampled_trace_records_nothing():
+    exporter = ListExporter()
+    tracer = Tracer(sample_rate=0.0, exporter=exporter)
+    tracer.start()
+    span, token = tracer.start_trace("GET /")
+    assert tracer.start_span("child") is None
+    tracer.end_trace(span, token)
+    tracer.stop()
+    assert span.sampled is False
+    assert exporter.spans == []
+
+
+def test_full_queue_drops_traces():
+    tracer = Tracer(sample_rate=1.0, exporter=ListExporter(), max_queue_size=1)
+    for _ in range(3):
+        span, token = tracer.start_trace("GET /")
+        tracer.end_trace(span, token)
+    assert tracer.dropped == 2
+
+
+def test_exporters(tmp_path):
+    tracer = Tracer(sample_rate=1.0)
+    root, token = tracer.start_trace("GET /")
+    with pytest.raises(ValueError):
+        with tracer.span("work", rows=3):
+            raise ValueError("boom")
+    tracer.end_trace(root, token)
+
+    path = tmp_path / "spans.jsonl"
+    FileSpanExporter(str(path)).export(root.spans)
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["name"] for record in records] == ["work", "GET /"]
+    assert records[0]["error"] == "ValueError: boom"
+    assert records[0]["parent_span_id"] == root.span_id
+
+    otlp = OtlpSpanExporter._to_otlp(root.spans[0])
+    assert otlp["status"] == {"code": 2, "message": "ValueError: boom"}
+    assert otlp["parentSpanId"] == root.span_id
+    assert otlp["attributes"] == [{"key": "rows", "value": {"intValue": "3"}}]
@@ -0,0 +1,203 @@
+"""
+요청 트래픽 수집/재생 테스트
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from middleware.traffic_capture import TrafficCaptureMiddleware
+from services.traffic_capture import (
+    REDACTED,
+    RotatingJsonlWriter,
+    TrafficRecorder,
+    body_shape,
+    redact,
+    redact_pairs,
+)
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "replay_traffic.py"
+spec = importlib.util.spec_from_file_location("replay_traffic", SCRIPT_PATH)
+replay_traffic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(replay_traffic)
+
+
+class ListRecorder:
+    """기록을 리스트에 모읍니다."""
+
+    def __init__(self):
+        self.entries = []
+
+    def record(self, entry):
+        self.entries.append(entry)
+
+
+def make_client(recorder, **options):
+    app = FastAPI()
+
+    @app.post("/api/login")
+    def login(body: dict):
+        return {"ok": True}
+
+    @app.post("/api/upload")
+    def upload(file: UploadFile = File(...)):
+        return {"name": file.filename}
+
+    @app.get("/api/items/{item_id}")
+    def get_item(item_id: int):
+        return {"id": item_id}
+
+    @app.get("/health")
+    def health():
+        return {"ok": True}
+
+    app.add_middleware(TrafficCaptureMiddleware, recorder=recorder, **options)
+    return TestClient(app)
+
+
+def test_redact():
+    assert redact(
+        {"nickname": "a", "password": "pw", "items": [{"api_key": "k", "n": 1}]}
+    ) == {
+        "nickname": "a",
+        "password": REDACTED,
+        "items": [{"api_key": REDACTED, "n": 1}],
+    }
+    assert body_shape(
+        {"nickname": "a", "password": "pw", "ids": [1, None], "cam": True}
+    ) == {
+        "nickname": "str",
+        "password": REDACTED,
+        "ids": ["int", "null"],
+        "cam": "bool",
+    }
+    assert redact_pairs([("token", "t"), ("limit", "10")]) == [
+        ["token", REDACTED],
+        ["limit", "10"],
+    ]
+
+
+def test_middleware_records_redacted_requests():
+    recorder = ListRecorder()
+    client = make_client(recorder, exclude_routes=["GET /api/items/{item_id}"])
+
+    client.post(
+        "/api/login?access_token=abc&x=1",
+        json={"nickname": "kim", "password": "secret"},
+        headers={"Authorization": "Bearer abc"},
+    )
+    client.post("/api/upload", files={"file": ("a.csv", b"a,b\n1,2\n")})
+    client.get("/api/items/3")
+    client.get("/health")
+
+    login, upload = recorder.entries
+    assert (login["method"], login["route"], login["status"]) == (
+        "POST",
+        "/api/login",
+        200,
+    )
+    assert login["query"] == [["access_token", REDACTED], ["x", "1"]]
+    # 기본은 본문 값 없이 구조만 기록
+    assert login["body_kind"] == "shape"
+    assert login["body"] == {"nickname": "str", "password": REDACTED}
+    assert "authorization" not in dict(login["headers"])
+    assert login["response_bytes"] > 0
+
+    assert upload["body_kind"] == "omitted"
+    assert upload["body"] is None
+    assert upload["body_bytes"] > 0
+
+
+def test_full_bodies_records_redacted_values():
+    recorder = ListRecorder()
+    client = make_client(recorder, full_bodies=True)
+    client.post("/api/login", json={"nickname": "kim", "password": "secret"})
+    entry = recorder.entries[0]
+    assert entry["body_kind"] == "json"
+    assert entry["body"] == {"nickname": "kim", "password": REDACTED}
+
+
+def test_large_json_body_is_omitted():
+    recorder = ListRecorder()
+    client = make_client(recorder, max_body_bytes=10)
+    client.post("/api/login", json={"nickname": "a" * 20})
+    assert recorder.entries[0]["body_kind"] == "omitted"
+
+
+def test_rotating_writer(tmp_path):
+    path = tmp_path / "capture.jsonl"
+    writer = RotatingJsonlWriter(str(path), max_bytes=30, backup_count=2)
+    for index in range(4):
+        writer.write([{"index": index, "pad": "x" * 10}])
+
+    assert json.loads(path.read_text())["index"] == 3
+    assert json.loads(path.with_name("capture.jsonl.1").read_text())["index"] == 2
+    assert json.loads(path.with_name("capture.jsonl.2").read_text())["index"] == 1
+    assert not path.with_name("capture.jsonl.3").exists()
+
+
+def test_recorder_writes_and_replay_loads_in_order(tmp_path):
+    path = tmp_path / "capture.jsonl"
+    recorder = TrafficRecorder(
+        RotatingJsonlWriter(str(path), max_bytes=60, backup_count=5)
+    )
+    recorder.start()
+    for ts in range(5):
+        recorder.record({"ts": ts, "route": "GET /api/items/{item_id}"})
+        recorder.stop()
+        recorder.start()
+    recorder.stop()
+
+    assert recorder.written == 5
+    assert len(replay_traffic.capture_files(path)) > 1
+    entries = replay_traffic.load_entries(path)
+    assert [entry["ts"] for entry in entries] == list(range(5))
+
+
+def test_full_recorder_queue_drops_entries(tmp_path):
+    recorder = TrafficRecorder(
+        RotatingJsonlWriter(str(tmp_path / "capture.jsonl"), 1024, 1),
+        max_queue_size=1,
+    )
+    for ts in range(3):
+        recorder.record({"ts": ts})
+    assert recorder.dropped == 2
+
+
+def test_replay_helpers():
+    assert replay_traffic.fill_secret(
+        {"password": REDACTED, "list": [REDACTED, "x"]}, "pw"
+    ) == {"password": "pw", "list": ["pw", "x"]}
+    assert replay_traffic.fill_secret(REDACTED, None) == REDACTED
+    assert replay_traffic.request_body(
+        {"body_kind": "shape", "body": {"name": "str", "password": REDACTED}}, "pw"
+    ) == {"name": "replay", "password": "pw"}
+    assert replay_traffic.request_body(
+        {"body_kind": "json", "body": {"name": "kim"}}, None
+    ) == {"name": "kim"}
+    assert (
+        replay_traffic.request_body({"body_kind": "omitted", "body": None}, None)
+        is None
+    )
+    assert replay_traffic.percentile([5, 1, 3, 2, 4], 50) == 3
+    assert replay_traffic.percentile([5, 1, 3, 2, 4], 95) == 5
+    assert replay_traffic.percentile([], 50) is None
+
+
+def test_replay_summary():
+    Result = replay_traffic.ReplayResult
+    results = [
+        Result("GET /a", 200, 10.0, status=200, duration_ms=20.0),
+        Result("GET /a", 200, 10.0, status=500, duration_ms=20.0),
+        Result("POST /b", 201, 4.0, error="ConnectError: refused"),
+    ]
+    rows = {row["route"]: row for row in replay_traffic.summarize(results)}
+
+    assert list(rows) == ["GET /a", "POST /b", "TOTAL"]
+    assert rows["GET /a"]["p50_change_pct"] == 100.0
+    assert rows["GET /a"]["status_mismatches"] == 1
+    assert rows["POST /b"]["replay_p50_ms"] is None
+    assert (rows["TOTAL"]["count"], rows["TOTAL"]["errors"]) == (3, 1)
@@ -0,0 +1,110 @@
+"""
+사용자 API 테스트
+
+사용자별 작업 목록과 작업량 통계를 확인합니다.
+"""
+
+from models.m_user_backup_status import MUserBackupStatus
+from models.user import User
+
+
+def create_users(db):
+    db.add_all(
+        [
+            User(name="김작업", nickname="worker", password="pw"),
+            User(name="이확인", nickname="checker", password="pw"),
+        ]
+    )
+    db.commit()
+
+
+def create_backup(client, **fields):
+    response = client.post(
+        "/api/v1/backup-status",
+        json={"name": "backup", "created_by": 1, "user_ids": [1], **fields},
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_user_stats_counts_stages(client, db):
+    create_users(db)
+    create_backup(client, cam=True, master=True)
+    create_backup(
+        client,
+        cam=True,
+        master=True,
+        clean=True,
+        final_product=True,
+        clean_checker=1,
+    )
+    create_backup(client, cam=False, cam_checker=1)
+    deleted_id = create_backup(client, cam=True)
+    assert (
+        client.delete(
+            f"/api/v1/backup-status/{deleted_id}", params={"deleted_by": 1}
+        ).status_code
+        == 204
+    )
+    # 작업자로 참여하지 않고 확인자로만 지정된 항목
+    client.post(
+        "/api/v1/backup-status",
+        json={"name": "checked", "created_by": 2, "master_checker": 1},
+    )
+
+    stats = client.get("/api/v1/auth/users/1/stats").json()
+
+    assert stats["produced"] == {
+        "total": 3,
+        "cam": 2,
+        "master": 2,
+        "clean": 1,
+        "final_product": 1,
+        "fully_backed_up": 1,
+    }
+    assert stats["checked"] == {
+        "total": 3,
+        "cam": 1,
+        "master": 1,
+        "clean": 1,
+        "final_product": 0,
+    }
+
+
+def test_user_stats_unknown_user(client):
+    assert client.get("/api/v1/auth/users/999/stats").status_code == 404
+
+
+def test_user_backups_lists_produced_items(client, db):
+    create_users(db)
+    produced_id = create_backup(client, displayed_date="2024-01-02T00:00:00")
+    client.post("/api/v1/backup-status", json={"name": "other", "created_by": 2})
+
+    items = client.get("/api/v1/auth/users/1/backups").json()
+
+    assert [item["id"] for item in items] == [produced_id]
+    assert items[0]["producers"] == ["김작업"]
+    assert db.query(MUserBackupStatus).count() == 1
+
+
+def test_user_backups_paginates_newest_first(client, db):
+    create_users(db)
+    undated = create_backup(client)
+    older = create_backup(client, displayed_date="2024-01-01T00:00:00")
+    newer = create_backup(client, displayed_date="2024-03-01T00:00:00")
+    deleted = create_backup(client, displayed_date="2024-05-01T00:00:00")
+    client.delete(f"/api/v1/backup-status/{deleted}", params={"deleted_by": 1})
+
+    def page(skip, limit):
+        response = client.get(
+            "/api/v1/auth/users/1/backups", params={"skip": skip, "limit": limit}
+        )
+        assert response.status_code == 200
+        return [item["id"] for item in response.json()]
+
+    same_day = create_backup(client, displayed_date="2024-03-01T00:00:00")
+
+    # 날짜가 같으면 ID 역순 (목록 API, 스냅샷 조회와 같은 순서)
+    assert page(0, 2) == [same_day, newer]
+    assert page(2, 2) == [older, undated]
+    assert client.get("/api/v1/auth/users/999/backups").status_code == 404